@@ -8,6 +8,7 @@ The factory accepts optional `shapes_api` argument; if omitted, it uses
 """
 
 from typing import Literal
+import io
 from PIL import Image
 from fairypptx.core.resolvers import resolve_shapes
 from fairypptx.core.types import COMObject
@@ -50,14 +51,14 @@ class ShapeApiFactory:
 
     @staticmethod
     def add_picture(
-        image_or_path: Image.Image | str,
+        image_or_path: Image.Image | bytes | str,
         shapes_api: COMObject | None = None,
         **kwargs
     ) -> COMObject:
         """Add a picture to a slide.
 
         Args:
-            image_or_path: PIL.Image or file path string.
+            image_or_path: PIL.Image, PNG / JPEG bytes (written as they are), or file path string.
             shapes_api: Optional Shapes collection. If None, uses resolve_shapes().
             **kwargs: Additional arguments passed to AddPicture.
 
@@ -68,18 +69,17 @@ class ShapeApiFactory:
             shapes_api = resolve_shapes() 
         assert shapes_api is not None
 
-        if isinstance(image_or_path, Image.Image):
-            with registry_utils.yield_temporary_dump(image_or_path) as path:
-                return shapes_api.AddPicture(
-                    str(path),
-                    msoFalse,
-                    msoTrue,
-                    Left=0,
-                    Top=0,
-                    Width=image_or_path.width,
-                    Height=image_or_path.height,
-                    **kwargs
-                )
+        if isinstance(image_or_path, (Image.Image, bytes)):
+            if isinstance(image_or_path, bytes):
+                suffix = registry_utils.to_image_suffix(image_or_path)
+                # Only the header is read, and the pixels are not decoded.
+                width, height = Image.open(io.BytesIO(image_or_path)).size
+            else:
+                suffix = ".png"
+                width, height = image_or_path.size
+            params = {"Left": 0, "Top": 0, "Width": width, "Height": height} | kwargs
+            with registry_utils.yield_temporary_dump(image_or_path, suffix=suffix) as path:
+                return shapes_api.AddPicture(str(path), msoFalse, msoTrue, **params)
         else:
             return shapes_api.AddPicture(str(image_or_path), msoFalse, msoTrue, **kwargs)
 
@@ -1,8 +1,13 @@
 from fairypptx.core.types import COMObject
-from typing import Sequence, Literal
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Sequence, Literal
+import numpy as np
+from pywintypes import com_error
 from fairypptx.object_utils import stored, getattr as f_getattr, setattr as f_setattr
 from fairypptx import registry_utils
 from fairypptx import constants
+from fairypptx.apis.text_frame import measure
 from PIL import Image
 
 def swap_props(api1: COMObject, api2: COMObject, attrs: Sequence[str]) -> None:
@@ -14,32 +19,201 @@ def swap_props(api1: COMObject, api2: COMObject, attrs: Sequence[str]) -> None:
         f_setattr(api2, attr, p1)
 
 
-def tighten(api: COMObject, *, oneline: bool=False):
+def tighten(api: COMObject, *, oneline: bool=False,
+            engine: Literal["powerpoint", "offline"] = "powerpoint"):
     """Tighten the Shape according to Text.
 
     Args:
         oneline: Modify so that text becomes 1 line.
+        engine: `powerpoint` lets PowerPoint re-layout the shape.
+            `offline` predicts the size with `measure.TextMeasurer` and writes it once.
     """
     if api.HasTextFrame:
         if oneline is True:
             api.TextFrame.TextRange.Text = api.Text.replace("\r", "").replace(
                 "\n", ""
             )
+        if engine == "offline":
+            measure.tighten_offline(api)
+            return
         with stored(api, ("TextFrame.AutoSize", "TextFrame.WordWrap")):
             api.TextFrame.AutoSize = constants.ppAutoSizeShapeToFitText
             api.TextFrame.WordWrap = constants.msoFalse
 
+TIGHT_TOLERANCE = 5
+
 def is_tight(api: COMObject, *, oneline: bool=False):
     assert oneline is False
     width, height = api.Width, api.Height
     with stored(api, ("Width", "Height", "Left", "Top")):
         tighten(api, oneline=False)
-        if abs(width - api.Width) <= 5 and abs(height - api.Height) <= 5:
+        if abs(width - api.Width) <= TIGHT_TOLERANCE and abs(height - api.Height) <= TIGHT_TOLERANCE:
             return True
     return False
 
+def estimate_is_tight(api: COMObject) -> bool:
+    """Estimate `is_tight` without modification of the shape.
+
+    The size required by the text is estimated as
+    `BoundWidth` / `BoundHeight` of the text and the margins.
+    Note that the estimate may differ from `is_tight` when the text is wrapped.
+    """
+    if not api.HasTextFrame:
+        return True
+    frame_api = api.TextFrame
+    text_range_api = frame_api.TextRange
+    required_width = frame_api.MarginLeft + frame_api.MarginRight + text_range_api.BoundWidth
+    required_height = frame_api.MarginTop + frame_api.MarginBottom + text_range_api.BoundHeight
+    return (abs(api.Width - required_width) <= TIGHT_TOLERANCE
+            and abs(api.Height - required_height) <= TIGHT_TOLERANCE)
+
 def to_image(api:COMObject, mode: Literal["RGBA", "RGB"] ="RGBA") -> Image.Image:
+    prefetched = _prefetched_images.get()
+    if prefetched is not None:
+        key = _to_image_key(api)
+        if key in prefetched:
+            return prefetched[key].convert(mode)
     with registry_utils.yield_temporary_path(suffix=".png") as path:
         api.Export(path, constants.ppShapeFormatPNG)
         image = Image.open(path).copy()
     return image.convert(mode)
+
+
+DEFAULT_EXPORT_DPI = 96
+
+_prefetched_images: ContextVar[dict[tuple[int, int], Image.Image] | None] = ContextVar("_prefetched_images", default=None)
+
+
+def _to_image_key(api: COMObject) -> tuple[int, int] | None:
+    try:
+        return (api.Parent.SlideID, api.Id)
+    except (com_error, AttributeError):  # e.g. Shapes of layouts or grouped shapes.
+        return None
+
+
+@contextmanager
+def prefetched_images(apis: Sequence[COMObject], dpi: float = DEFAULT_EXPORT_DPI) -> Iterator[None]:
+    """Within the context, `to_image` of the pictures in `apis` returns the images cropped by `to_images`.
+    The other shapes are exported when `to_image` is called, as usual.
+
+    Note that this is lossy: the cropped images are opaque, and the transparency
+    within the media of a picture (e.g. PNG with alpha) is filled with what is behind it.
+    Use it only when it is acceptable.
+    """
+    cropped = _crop_pictures(apis, "RGBA", dpi)
+    images = {key: image for index, image in cropped.items() if (key := _to_image_key(apis[index])) is not None}
+    token = _prefetched_images.set({**(_prefetched_images.get() or {}), **images})
+    try:
+        yield
+    finally:
+        _prefetched_images.reset(token)
+
+
+def to_images(apis: Sequence[COMObject],
+              mode: Literal["RGBA", "RGB"] = "RGBA",
+              *,
+              dpi: float = DEFAULT_EXPORT_DPI,
+              exact: bool = False) -> list[Image.Image]:
+    """Images of the shapes.
+
+    For the pictures on the same slide, the slide is exported once at `dpi`,
+    and the region of each picture is cropped from it.
+    The shapes whose appearance differs from the region of the slide are exported one by one
+    (`to_image`): the ones other than pictures, rotated, hidden, grouped,
+    with transparent background or fill, with lines or effects (e.g. shadow, glow, soft edges, reflection, 3D),
+    overlapped by the shapes in front, or out of the slide.
+
+    Note that the cropped images are opaque even in "RGBA" mode,
+    since the transparency within the media of a picture (e.g. PNG with alpha) cannot be detected
+    and is filled with what is behind it.
+    If it matters, use `exact=True`, which always exports each shape.
+    """
+    images = {} if exact else _crop_pictures(apis, mode, dpi)
+    return [images[index] if index in images else to_image(api, mode) for index, api in enumerate(apis)]
+
+
+def _crop_pictures(apis: Sequence[COMObject], mode: str, dpi: float) -> dict[int, Image.Image]:
+    """Images of the croppable pictures in `apis`, by index."""
+    images: dict[int, Image.Image] = {}
+    slides: dict[int, tuple[COMObject, list[int]]] = {}
+    for index, api in enumerate(apis):
+        if api.Type == constants.msoPicture and api.Child != constants.msoTrue:
+            slide_api = api.Parent
+            try:
+                slide_id = slide_api.SlideID
+            except (com_error, AttributeError):  # e.g. Shapes of layouts.
+                continue
+            slides.setdefault(slide_id, (slide_api, []))[1].append(index)
+
+    scale = dpi / 72
+    for slide_api, indices in slides.values():
+        croppable = _to_croppable_indices(slide_api, [apis[index] for index in indices])
+        targets = [index for index, is_croppable in zip(indices, croppable) if is_croppable]
+        if len(targets) < 2:
+            continue
+        page_setup = slide_api.Parent.PageSetup
+        width, height = round(page_setup.SlideWidth * scale), round(page_setup.SlideHeight * scale)
+        with registry_utils.yield_temporary_path(suffix=".png") as path:
+            slide_api.Export(str(path), "PNG", width, height)
+            array = np.asarray(Image.open(path).convert(mode))
+        # Rows and columns in pixels of all the targets at once.
+        boxes = np.array([[apis[index].Left, apis[index].Top, apis[index].Width, apis[index].Height]
+                          for index in targets], dtype=float)
+        lefts, tops = np.floor(boxes[:, 0] * scale).astype(int), np.floor(boxes[:, 1] * scale).astype(int)
+        rights = np.ceil((boxes[:, 0] + boxes[:, 2]) * scale).astype(int)
+        bottoms = np.ceil((boxes[:, 1] + boxes[:, 3]) * scale).astype(int)
+        for index, left, top, right, bottom in zip(targets, lefts, tops, rights, bottoms):
+            images[index] = Image.fromarray(array[max(top, 0):bottom, max(left, 0):right])
+    return images
+
+
+def _to_croppable_indices(slide_api: COMObject, apis: Sequence[COMObject]) -> list[bool]:
+    """Whether the region of the slide is the same as the export of each picture."""
+    page_setup = slide_api.Parent.PageSetup
+    slide_width, slide_height = page_setup.SlideWidth, page_setup.SlideHeight
+    # (zorder, left, top, right, bottom) of all the visible shapes.
+    # The rotated shapes are regarded as their circumscribed squares.
+    bounds = []
+    for shape_api in slide_api.Shapes:
+        if shape_api.Visible != constants.msoTrue:
+            continue
+        left, top, width, height = shape_api.Left, shape_api.Top, shape_api.Width, shape_api.Height
+        if shape_api.Rotation % 360:
+            radius = (width ** 2 + height ** 2) ** 0.5 / 2
+            c_x, c_y = left + width / 2, top + height / 2
+            left, top, width, height = c_x - radius, c_y - radius, 2 * radius, 2 * radius
+        bounds.append((shape_api.ZOrderPosition, left, top, left + width, top + height))
+    bounds_array = np.array(bounds, dtype=float).reshape(-1, 5)
+
+    result = []
+    for api in apis:
+        left, top, right, bottom = api.Left, api.Top, api.Left + api.Width, api.Top + api.Height
+        if (api.Visible != constants.msoTrue
+                or api.Rotation % 360
+                or api.PictureFormat.TransparentBackground == constants.msoTrue
+                or _has_effects(api)
+                or left < 0 or top < 0 or slide_width < right or slide_height < bottom):
+            result.append(False)
+            continue
+        front = bounds_array[bounds_array[:, 0] > api.ZOrderPosition]
+        overlapped = ((front[:, 1] < right) & (left < front[:, 3])
+                      & (front[:, 2] < bottom) & (top < front[:, 4]))
+        result.append(not overlapped.any())
+    return result
+
+
+def _has_effects(api: COMObject) -> bool:
+    """Whether the picture is drawn beyond or differently from its bare region,
+    by the line, the effects or the transparency of the fill.
+    """
+    try:
+        return (api.Line.Visible == constants.msoTrue
+                or api.Shadow.Visible == constants.msoTrue
+                or 0 < api.Glow.Radius
+                or api.SoftEdge.Type != constants.msoSoftEdgeTypeNone
+                or api.Reflection.Type != constants.msoReflectionTypeNone
+                or api.ThreeD.Visible == constants.msoTrue
+                or api.ThreeD.BevelTopType != constants.msoBevelNone
+                or 0 < api.Fill.Transparency)
+    except com_error:
+        return True
@@ -75,3 +75,12 @@ class TextFrameApiModel(BaseApiModel):
             apply_style_api2_data(api, self.api2_data)
             apply_style_api_data(api, self.api_data)
             self.text_range.apply_api(api.TextRange)
+
+    def update_api(self, api: COMObject) -> None:
+        """Same as `apply_api`, but the text is updated incrementally.
+        See `TextRangeApiModel.update_api`.
+        """
+        if self.text_range:
+            apply_style_api2_data(api, self.api2_data)
+            apply_style_api_data(api, self.api_data)
+            self.text_range.update_api(api.TextRange)
@@ -0,0 +1,214 @@
+"""Offline measurement of texts, used for `tighten` without the re-layout of PowerPoint.
+
+`tighten` via COM toggles `AutoSize` / `WordWrap` and lets PowerPoint re-layout
+the shape, which costs several writes and reads per shape.
+Here, the extent of the text is predicted with the glyph advances of `Pillow`,
+and the target size of the shape is written once.
+
+Notes:
+    * The fonts are resolved with `matplotlib.font_manager`.
+      When the font is not installed, the default font of matplotlib is used,
+      so the prediction is approximate.
+    * Kerning and the layout of complex scripts are not considered.
+      Use `verify_tighten` to compare the prediction with PowerPoint.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Sequence
+
+from PIL import ImageFont
+
+from fairypptx.core.types import COMObject
+from fairypptx.object_utils import stored
+from fairypptx import constants
+
+
+# Ratio of the line height to the height of the font, as PowerPoint's single spacing.
+LINE_HEIGHT_RATIO = 1.2
+
+
+@dataclass(frozen=True)
+class FontKey:
+    name: str
+    size: float
+    bold: bool = False
+    italic: bool = False
+
+
+@dataclass(frozen=True)
+class Segment:
+    """A part of a line with the single font."""
+    text: str
+    font: FontKey
+
+
+@dataclass(frozen=True)
+class TextExtent:
+    width: float
+    height: float
+
+
+@lru_cache(maxsize=None)
+def resolve_font_path(name: str, bold: bool = False, italic: bool = False) -> str:
+    """Return the path of the font file for `name`."""
+    from matplotlib import font_manager
+    prop = font_manager.FontProperties(family=name,
+                                       weight="bold" if bold else "normal",
+                                       style="italic" if italic else "normal")
+    return font_manager.findfont(prop, fallback_to_default=True)
+
+
+@dataclass
+class _GlyphMetrics:
+    """Glyph advances of a font at a size (in points)."""
+    font: ImageFont.FreeTypeFont
+    line_height: float
+    advances: dict[str, float] = field(default_factory=dict)
+
+    def width(self, text: str) -> float:
+        advances = self.advances
+        total = 0.0
+        for char in text:
+            advance = advances.get(char)
+            if advance is None:
+                advance = advances[char] = self.font.getlength(char)
+            total += advance
+        return total
+
+
+class TextMeasurer:
+    """Predict the extent of texts with `Pillow`.
+
+    The glyph advances are cached for each (font, size).
+    Here, 1 pixel of `Pillow` is regarded as 1 point.
+    """
+
+    def __init__(self):
+        self._metrics: dict[tuple[str, float], _GlyphMetrics] = {}
+
+    def _to_metrics(self, font: FontKey) -> _GlyphMetrics:
+        path = resolve_font_path(font.name, font.bold, font.italic)
+        key = (path, font.size)
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            image_font = ImageFont.truetype(path, font.size)
+            ascent, descent = image_font.getmetrics()
+            line_height = max(ascent + descent, font.size * LINE_HEIGHT_RATIO)
+            metrics = self._metrics[key] = _GlyphMetrics(image_font, line_height)
+        return metrics
+
+    def line_extent(self, segments: Sequence[Segment], default: FontKey | None = None) -> TextExtent:
+        """Extent of a line. For empty lines, the height follows `default`."""
+        width, height = 0.0, 0.0
+        for segment in segments:
+            metrics = self._to_metrics(segment.font)
+            width += metrics.width(segment.text)
+            height = max(height, metrics.line_height)
+        if not segments and default is not None:
+            height = self._to_metrics(default).line_height
+        return TextExtent(width, height)
+
+    def extent(self, lines: Sequence[Sequence[Segment]],
+               spacings: Sequence[float] | None = None) -> TextExtent:
+        """Extent of the lines without wrapping.
+
+        Args:
+            lines: Segments of each line.
+            spacings: The multiple of the line spacing for each line (default: 1).
+        """
+        spacings = spacings if spacings is not None else [1.0] * len(lines)
+        width, height = 0.0, 0.0
+        default = None
+        for segments, spacing in zip(lines, spacings):
+            if segments:
+                default = segments[-1].font
+            line = self.line_extent(segments, default)
+            width = max(width, line.width)
+            height += line.height * spacing
+        return TextExtent(width, height)
+
+
+default_measurer = TextMeasurer()
+
+
+def read_lines(text_range_api: COMObject) -> tuple[list[list[Segment]], list[float]]:
+    """Read the segments of each line of `text_range_api`, and the multiple of line spacing.
+    Lines are separated with `\\r` and `\\013`.
+    """
+    lines: list[list[Segment]] = []
+    spacings: list[float] = []
+    for para_api in text_range_api.Paragraphs():
+        format_api = para_api.ParagraphFormat
+        if format_api.LineRuleWithin == constants.msoTrue:
+            spacing = format_api.SpaceWithin
+        else:
+            spacing = 1.0
+        n_lines = len(lines)
+        lines.append([])
+        run_text = ""
+        for run_api in para_api.Runs():
+            font_api = run_api.Font
+            font = FontKey(font_api.Name, font_api.Size,
+                           font_api.Bold == constants.msoTrue,
+                           font_api.Italic == constants.msoTrue)
+            run_text = run_api.Text
+            parts = run_text.replace("\013", "\r").split("\r")
+            for index, part in enumerate(parts):
+                if index:
+                    lines.append([])
+                if part:
+                    lines[-1].append(Segment(part, font))
+        # The trailing `\r` does not make a new line.
+        if len(lines) - n_lines > 1 and run_text.endswith("\r"):
+            lines.pop()
+        spacings.extend([spacing] * (len(lines) - n_lines))
+    return lines, spacings
+
+
+def predict_tight_size(api: COMObject, measurer: TextMeasurer | None = None) -> tuple[float, float]:
+    """Return (width, height) of the shape `api` when it is tightened (`WordWrap` is off)."""
+    measurer = measurer or default_measurer
+    frame_api = api.TextFrame
+    lines, spacings = read_lines(frame_api.TextRange)
+    extent = measurer.extent(lines, spacings)
+    width = extent.width + frame_api.MarginLeft + frame_api.MarginRight
+    height = extent.height + frame_api.MarginTop + frame_api.MarginBottom
+    return width, height
+
+
+def tighten_offline(api: COMObject, measurer: TextMeasurer | None = None) -> None:
+    """Tighten the shape with the predicted size, written once."""
+    if not api.HasTextFrame:
+        return
+    width, height = predict_tight_size(api, measurer)
+    api.Width, api.Height = width, height
+
+
+@dataclass(frozen=True)
+class MeasureReport:
+    predicted: tuple[float, float]
+    actual: tuple[float, float]
+    tolerance: float
+
+    @property
+    def error(self) -> tuple[float, float]:
+        return (self.predicted[0] - self.actual[0], self.predicted[1] - self.actual[1])
+
+    @property
+    def ok(self) -> bool:
+        return all(abs(value) <= self.tolerance for value in self.error)
+
+
+def verify_tighten(api: COMObject,
+                   measurer: TextMeasurer | None = None,
+                   tolerance: float = 5.0) -> MeasureReport:
+    """Compare the predicted size with the one of PowerPoint's `tighten`.
+    The shape is not modified.
+    """
+    from fairypptx.apis.shape import api_functions
+    predicted = predict_tight_size(api, measurer)
+    with stored(api, ("Width", "Height", "Left", "Top")):
+        api_functions.tighten(api, engine="powerpoint")
+        actual = (api.Width, api.Height)
+    return MeasureReport(predicted, actual, tolerance)
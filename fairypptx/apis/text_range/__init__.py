@@ -1,6 +1,7 @@
 """Text Frame API layer exports."""
 from fairypptx.apis.text_range.api_model import TextRangeApiModel, normalize_paragraph_breaks
 from fairypptx.apis.text_range.applicator import TextRangeApplicator
+from fairypptx.apis.text_range.snapshot import TextRangeSnapshot, utf16_len
 
-__all__ = ["TextRangeApiModel", "TextRangeApplicator", "normalize_paragraph_breaks"]
+__all__ = ["TextRangeApiModel", "TextRangeApplicator", "normalize_paragraph_breaks", "TextRangeSnapshot", "utf16_len"]
 
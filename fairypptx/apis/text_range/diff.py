@@ -0,0 +1,169 @@
+"""Incremental update of `TextRange`.
+
+Instead of clearing the text and rebuilding it, the current text
+and the target are aligned (paragraphs first, then characters inside
+the paragraphs replaced one-to-one), and only the differences are written.
+
+* Text: `plan_text_edits` computes the replacements,
+  which are applied from the back so that the positions stay valid.
+* Format: paragraph formats and fonts are written only for the paragraphs
+  whose text or formats differ from the aligned current paragraph.
+
+Hence, the number of writes is proportional to the size of the edit.
+"""
+
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from itertools import accumulate
+from typing import Sequence
+
+from fairypptx.core.types import COMObject
+from fairypptx.apis.text_range.snapshot import TextRangeSnapshot, merge_font_spans, utf16_len
+
+
+@dataclass(frozen=True)
+class TextEdit:
+    """Replace `text[start:start + length]` with `text`. (`str` index.)"""
+    start: int
+    length: int
+    text: str
+
+
+@dataclass
+class TextEditPlan:
+    """
+    * `edits`: Non-overlapping edits, in the order of the alignment.
+    * `origins`: For each target paragraph, the index of the current paragraph
+      it is aligned to, or None if it is newly inserted.
+    * `touched`: Target paragraphs whose paragraph break is inserted / removed,
+      so their formats are written again.
+    """
+    edits: list[TextEdit] = field(default_factory=list)
+    origins: list[int | None] = field(default_factory=list)
+    touched: set[int] = field(default_factory=set)
+
+
+def plan_text_edits(current: str, target: str) -> TextEditPlan:
+    """Compute the edits which convert `current` to `target`.
+    Both texts are paragraphs joined with `\\r`.
+    """
+    cur_paras = current.split("\r")
+    tgt_paras = target.split("\r")
+    offsets = [0, *accumulate(len(para) + 1 for para in cur_paras)]
+    plan = TextEditPlan()
+    origins: list[int | None] = [None] * len(tgt_paras)
+
+    matcher = SequenceMatcher(None, cur_paras, tgt_paras, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal" or (tag == "replace" and i2 - i1 == j2 - j1):
+            for i, j in zip(range(i1, i2), range(j1, j2)):
+                origins[j] = i
+                if tag == "replace":
+                    plan.edits.extend(_plan_paragraph_edits(cur_paras[i], tgt_paras[j], offsets[i]))
+        elif tag == "insert":
+            inserted = tgt_paras[j1:j2]
+            if i1 < len(cur_paras):
+                plan.edits.append(TextEdit(offsets[i1], 0, "".join(para + "\r" for para in inserted)))
+            else:
+                plan.edits.append(TextEdit(len(current), 0, "".join("\r" + para for para in inserted)))
+                plan.touched.add(j1 - 1)
+        elif tag == "delete":
+            if i2 < len(cur_paras):
+                plan.edits.append(TextEdit(offsets[i1], offsets[i2] - offsets[i1], ""))
+            else:
+                # The preceding `\r` is removed with the last paragraphs.
+                start = offsets[i1] - 1
+                plan.edits.append(TextEdit(start, len(current) - start, ""))
+                plan.touched.add(j1 - 1)
+        else:
+            start = offsets[i1]
+            end = offsets[i2] - 1
+            plan.edits.append(TextEdit(start, end - start, "\r".join(tgt_paras[j1:j2])))
+    plan.origins = origins
+    return plan
+
+
+def _plan_paragraph_edits(current: str, target: str, offset: int) -> list[TextEdit]:
+    matcher = SequenceMatcher(None, current, target, autojunk=False)
+    return [TextEdit(offset + i1, i2 - i1, target[j1:j2])
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"]
+
+
+def apply_text_edits(api: COMObject, text: str, edits: Sequence[TextEdit]) -> None:
+    """Apply `edits` planned over `text` (the current text of `api`)."""
+    # For the same `start`, the insertion (`length == 0`) must come last,
+    # and the later edit in `edits` must come first.
+    order = sorted(range(len(edits)), key=lambda i: (edits[i].start, edits[i].length, i), reverse=True)
+    for edit in (edits[i] for i in order):
+        start = utf16_len(text[:edit.start]) + 1
+        length = utf16_len(text[edit.start:edit.start + edit.length])
+        if edit.length == 0 and edit.start == len(text):
+            api.InsertAfter(edit.text)
+        elif edit.text:
+            api.Characters(start, length).Text = edit.text
+        else:
+            api.Characters(start, length).Delete()
+
+
+class _ParagraphSignatures:
+    """Comparable formats of each paragraph of `snapshot`."""
+
+    def __init__(self, snapshot: TextRangeSnapshot):
+        self.snapshot = snapshot
+        font_keys = [font.model_dump_json(exclude_defaults=True) for font in snapshot.fonts]
+        format_keys = [fmt.model_dump_json(exclude_defaults=True) for fmt in snapshot.paragraph_formats]
+        self.formats = [format_keys[index] for index in snapshot.paragraph_format_ids]
+        self.run_starts = [0, *accumulate(snapshot.paragraph_run_counts)]
+        self.run_lengths16 = [utf16_len(snapshot.text[offset:offset + length])
+                              for offset, length in zip(snapshot.run_offsets, snapshot.run_lengths)]
+        self.fonts = [
+            tuple((length, font_keys[font_id]) for _, length, font_id in self.font_spans(index, 1))
+            for index in range(len(snapshot.paragraph_run_counts))
+        ]
+
+    def font_spans(self, index: int, start: int) -> list[tuple[int, int, int]]:
+        """Merged font spans of the paragraph `index`, whose first character is at `start`."""
+        first, last = self.run_starts[index], self.run_starts[index + 1]
+        spans = merge_font_spans([last - first],
+                                 self.run_lengths16[first:last],
+                                 self.snapshot.run_font_ids[first:last])
+        return [(span_start + start - 1, length, font_id) for span_start, length, font_id in spans]
+
+
+def update_api(target: TextRangeSnapshot,
+               api: COMObject,
+               current: TextRangeSnapshot | None = None) -> None:
+    """Make `api` equivalent to `target`, writing only the differences.
+
+    Args:
+        target: The target state.
+        api: COM object of `TextRange`.
+        current: The current state of `api`. If None, it is read from `api`.
+    """
+    if current is None:
+        current = TextRangeSnapshot.from_api(api)
+    if not (_is_aligned(current) and _is_aligned(target)):
+        target.apply_api(api)
+        return
+    plan = plan_text_edits(current.text, target.text)
+    apply_text_edits(api, current.text, plan.edits)
+
+    cur_sigs = _ParagraphSignatures(current)
+    tgt_sigs = _ParagraphSignatures(target)
+    cur_paras = current.text.split("\r")
+    tgt_paras = target.text.split("\r")
+    paragraph_starts16 = [1, *accumulate(utf16_len(para) + 1 for para in tgt_paras)]
+    for index, origin in enumerate(plan.origins):
+        if origin is None or index in plan.touched or tgt_sigs.formats[index] != cur_sigs.formats[origin]:
+            format_id = target.paragraph_format_ids[index]
+            target.paragraph_formats[format_id].apply_api(api.Paragraphs(index + 1).ParagraphFormat)
+        if (origin is not None and cur_paras[origin] == tgt_paras[index]
+                and tgt_sigs.fonts[index] == cur_sigs.fonts[origin]):
+            continue
+        for start, length, font_id in tgt_sigs.font_spans(index, paragraph_starts16[index]):
+            target.fonts[font_id].apply_api(api.Characters(start, length).Font)
+
+
+def _is_aligned(snapshot: TextRangeSnapshot) -> bool:
+    """Whether the paragraphs of `snapshot` correspond to `text.split("\\r")`."""
+    return len(snapshot.paragraph_lengths) == snapshot.text.count("\r") + 1
@@ -0,0 +1,353 @@
+"""Columnar snapshot of `TextRange`.
+
+`TextRangeSnapshot` keeps
+* the text once,
+* the lengths of paragraphs and runs as arrays,
+* the interned tables of distinct fonts and paragraph formats,
+  referred by index from each run / paragraph.
+
+Reading
+-------
+`TextRangeApiModel.from_api` builds `FontApiModel` and `ParagraphFormatApiModel`
+for every run and paragraph. Here, only the raw values which identify the format
+(fingerprint) are read per run / paragraph, and the model is built only
+for the fingerprints not seen before in the same `TextRange`.
+
+* Font: tri-state keys and `Name` which are determined for the whole range
+  are read only once.
+* ParagraphFormat: `remove_invalidity` / `Bullet` reading are done
+  once per fingerprint, and `TextRange2` is acquired once for the range.
+
+Writing
+-------
+The whole text is inserted at once, then paragraph formats and fonts
+are written over the spans of consecutive equal formats
+(`merge_paragraph_spans` / `merge_font_spans`).
+"""
+
+from itertools import accumulate
+from typing import Any, Hashable, Self, Sequence
+
+from pywintypes import com_error
+
+from fairypptx import constants
+from fairypptx.core.models import BaseApiModel
+from fairypptx.core.types import COMObject
+from fairypptx.core.utils import crude_api_read, remove_invalidity
+from fairypptx.object_utils import getattr as f_getattr, to_api2, upstream
+from fairypptx.apis.font.api_model import FontApiModel
+from fairypptx.apis.bullet_format.api_model import BulletFormatApiModel
+from fairypptx.apis.paragraph_format.api_model import ParagraphFormatApiModel
+from fairypptx.apis.text_range.api_model import (
+    TextRangeApiModel,
+    TextRangeParagraphModel,
+    TextRangeRunModel,
+    normalize_paragraph_breaks,
+)
+
+
+_TRISTATES = {constants.msoCTrue, constants.msoTrue, constants.msoFalse}
+
+
+def utf16_len(text: str) -> int:
+    """Length of `text` in UTF-16 code units, which is used by `Characters` / `Start`."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+class _FontReader:
+    """Read `FontApiModel` of runs, sharing the values determined for the whole range."""
+
+    def __init__(self, range_api: COMObject):
+        self._uniform: dict[str, Any] = {}
+        self._variable_keys: list[str] = ["Size", "Color.RGB"]
+        self._cache: dict[Hashable, int] = {}
+        self.fonts: list[FontApiModel] = []
+
+        font_api = range_api.Font
+        name = self._read(font_api, "Name")
+        if name:
+            self._uniform["Name"] = name
+        else:
+            self._variable_keys.append("Name")
+        for key in FontApiModel._only_determined_keys:
+            value = self._read(font_api, key)
+            if value in _TRISTATES:
+                self._uniform[key] = value
+            else:
+                self._variable_keys.append(key)
+
+    @staticmethod
+    def _read(api: COMObject, key: str) -> Any:
+        """Read of the whole range. On failure, `key` is read per run instead."""
+        try:
+            return f_getattr(api, key)
+        except (com_error, AttributeError):
+            return None
+
+    def __call__(self, run_api: COMObject) -> int:
+        # As `FontApiModel.from_api`, the failure of the common keys propagates,
+        # and the undetermined keys are omitted.
+        font_api = run_api.Font
+        values = {key: f_getattr(font_api, key) if key in FontApiModel._common_keys else self._read(font_api, key)
+                  for key in self._variable_keys}
+        fingerprint = tuple(values.values())
+        if fingerprint not in self._cache:
+            values.update(self._uniform)
+            data: dict[str, Any] = {}
+            for key in FontApiModel._common_keys:
+                data[key] = values[key]
+            for key in FontApiModel._only_determined_keys:
+                if values[key] in _TRISTATES:
+                    data[key] = values[key]
+            self._cache[fingerprint] = len(self.fonts)
+            self.fonts.append(FontApiModel(api_data=data))
+        return self._cache[fingerprint]
+
+
+class _ParagraphFormatReader:
+    """Read `ParagraphFormatApiModel` of paragraphs, once per fingerprint."""
+
+    def __init__(self, range_api: COMObject):
+        self._cache: dict[Hashable, int] = {}
+        self.paragraph_formats: list[ParagraphFormatApiModel] = []
+        try:
+            shape_api = upstream(range_api, "Shape")
+            self._range_api2 = shape_api.TextFrame2.TextRange.GetCharacters(range_api.Start, range_api.Length)
+        except (com_error, ValueError):
+            self._range_api2 = None
+
+    def _to_api2(self, index: int, format_api: COMObject) -> COMObject:
+        if self._range_api2 is None:
+            return to_api2(format_api)
+        return self._range_api2.Paragraphs(index).ParagraphFormat
+
+    def __call__(self, index: int, paragraph_api: COMObject) -> int:
+        format_api = paragraph_api.ParagraphFormat
+        format_api2 = self._to_api2(index, format_api)
+        api_data = crude_api_read(format_api, ParagraphFormatApiModel._common_keys)
+        api2_data = crude_api_read(format_api2, ParagraphFormatApiModel._api2_keys)
+        bullet_type = format_api.Bullet.Type
+        character = format_api.Bullet.Character if bullet_type == constants.ppBulletUnnumbered else None
+
+        fingerprint = (tuple(api_data.values()), tuple(api2_data.values()), bullet_type, character)
+        if fingerprint not in self._cache:
+            if bullet_type != constants.ppBulletNone:
+                bullet = BulletFormatApiModel.from_api(format_api.Bullet)
+            else:
+                bullet = None
+            model = ParagraphFormatApiModel(api_data=remove_invalidity(format_api, api_data),
+                                            api2_data=remove_invalidity(format_api2, api2_data),
+                                            bullet=bullet)
+            self._cache[fingerprint] = len(self.paragraph_formats)
+            self.paragraph_formats.append(model)
+        return self._cache[fingerprint]
+
+
+class TextRangeSnapshot(BaseApiModel):
+    """Compact representation of `TextRangeApiModel`.
+
+    * `text`: The texts of paragraphs joined with `\\r`.
+    * `paragraph_lengths`, `run_lengths`: The lengths in `str` (not UTF-16).
+    * `paragraph_run_counts`: The number of runs for each paragraph.
+    * `paragraph_format_ids`, `run_font_ids`: Indices to `paragraph_formats` and `fonts`.
+    """
+
+    text: str
+    paragraph_lengths: Sequence[int]
+    paragraph_run_counts: Sequence[int]
+    paragraph_format_ids: Sequence[int]
+    run_lengths: Sequence[int]
+    run_font_ids: Sequence[int]
+    fonts: Sequence[FontApiModel]
+    paragraph_formats: Sequence[ParagraphFormatApiModel]
+
+    @classmethod
+    def from_api(cls, api: COMObject) -> Self:
+        font_reader = _FontReader(api)
+        format_reader = _ParagraphFormatReader(api)
+
+        texts: list[str] = []
+        paragraph_lengths: list[int] = []
+        paragraph_run_counts: list[int] = []
+        paragraph_format_ids: list[int] = []
+        run_lengths: list[int] = []
+        run_font_ids: list[int] = []
+
+        for p_index, paragraph_api in enumerate(api.Paragraphs(), start=1):
+            paragraph_format_ids.append(format_reader(p_index, paragraph_api))
+            p_texts = []
+            for run_api in paragraph_api.Runs():
+                text = normalize_paragraph_breaks(run_api.Text)
+                if text.endswith("\r"):
+                    text = text[:-1]
+                p_texts.append(text)
+                run_lengths.append(len(text))
+                run_font_ids.append(font_reader(run_api))
+            paragraph_run_counts.append(len(p_texts))
+            p_text = "".join(p_texts)
+            paragraph_lengths.append(len(p_text))
+            texts.append(p_text)
+
+        return cls(text="\r".join(texts),
+                   paragraph_lengths=paragraph_lengths,
+                   paragraph_run_counts=paragraph_run_counts,
+                   paragraph_format_ids=paragraph_format_ids,
+                   run_lengths=run_lengths,
+                   run_font_ids=run_font_ids,
+                   fonts=font_reader.fonts,
+                   paragraph_formats=format_reader.paragraph_formats)
+
+    def apply_api(self, api: COMObject) -> None:
+        """Write the whole text at once, then the formats over the merged spans.
+
+        The number of COM calls is proportional to the number of
+        format changes, not to that of paragraphs / runs.
+        """
+        api.Text = ""
+        if not self.text:
+            if self.paragraph_format_ids:
+                self.paragraph_formats[self.paragraph_format_ids[0]].apply_api(api.ParagraphFormat)
+            if self.run_font_ids:
+                self.fonts[self.run_font_ids[0]].apply_api(api.Font)
+            return
+        # `Characters` / `Paragraphs` are relative to `target`.
+        target = api.InsertAfter(self.text)
+        for start, count, format_id in self.paragraph_spans():
+            self.paragraph_formats[format_id].apply_api(target.Paragraphs(start, count).ParagraphFormat)
+        for start, length, font_id in self.font_spans():
+            self.fonts[font_id].apply_api(target.Characters(start, length).Font)
+
+    def paragraph_spans(self) -> Sequence[tuple[int, int, int]]:
+        """`(start, count, format_id)` of consecutive paragraphs with the same format.
+        `start` is 1-based, which is for `Paragraphs(start, count)`.
+        """
+        return merge_paragraph_spans(self.paragraph_format_ids)
+
+    def font_spans(self) -> Sequence[tuple[int, int, int]]:
+        """`(start, length, font_id)` in UTF-16, which is for `Characters(start, length)`.
+        `start` is 1-based, and adjacent runs with the same font are merged.
+        """
+        run_lengths16 = [utf16_len(self.text[offset:offset + length])
+                         for offset, length in zip(self.run_offsets, self.run_lengths)]
+        return merge_font_spans(self.paragraph_run_counts, run_lengths16, self.run_font_ids)
+
+    @property
+    def run_offsets(self) -> Sequence[int]:
+        """Start of each run in `text` (`str` index)."""
+        offsets = []
+        cursor = 0
+        run_lengths = iter(self.run_lengths)
+        for n_runs in self.paragraph_run_counts:
+            for _ in range(n_runs):
+                offsets.append(cursor)
+                cursor += next(run_lengths)
+            cursor += 1  # `\r`.
+        return offsets
+
+    @property
+    def paragraph_offsets(self) -> Sequence[int]:
+        """Start of each paragraph in `text` (`str` index)."""
+        if not self.paragraph_lengths:
+            return []
+        return [0, *accumulate(length + 1 for length in self.paragraph_lengths[:-1])]
+
+    def to_api_model(self) -> TextRangeApiModel:
+        paragraphs = []
+        run_iter = zip(self.run_offsets, self.run_lengths, self.run_font_ids)
+        for n_runs, format_id in zip(self.paragraph_run_counts, self.paragraph_format_ids):
+            runs = []
+            for _ in range(n_runs):
+                offset, length, font_id = next(run_iter)
+                runs.append(TextRangeRunModel(text=self.text[offset:offset + length],
+                                              font=self.fonts[font_id]))
+            paragraphs.append(TextRangeParagraphModel(runs=runs,
+                                                      paragraph_format=self.paragraph_formats[format_id]))
+        return TextRangeApiModel(paragraphs=paragraphs)
+
+    @classmethod
+    def from_api_model(cls, model: TextRangeApiModel) -> Self:
+        """Intern the formats of `model` (equal formats share one entry)."""
+        fonts: list[FontApiModel] = []
+        paragraph_formats: list[ParagraphFormatApiModel] = []
+
+        indices: dict[tuple[type, str], int] = {}
+
+        def _intern[T: BaseApiModel](table: list[T], item: T) -> int:
+            # The same criteria as `BaseApiModel.__eq__`.
+            key = (type(item), item.model_dump_json(exclude_defaults=True))
+            if key not in indices:
+                indices[key] = len(table)
+                table.append(item)
+            return indices[key]
+
+        texts = []
+        paragraph_lengths, paragraph_run_counts, paragraph_format_ids = [], [], []
+        run_lengths, run_font_ids = [], []
+        for paragraph in model.paragraphs:
+            paragraph_format_ids.append(_intern(paragraph_formats, paragraph.paragraph_format))
+            for run in paragraph.runs:
+                run_lengths.append(len(run.text))
+                run_font_ids.append(_intern(fonts, run.font))
+            paragraph_run_counts.append(len(paragraph.runs))
+            texts.append(paragraph.text)
+            paragraph_lengths.append(len(paragraph.text))
+        return cls(text="\r".join(texts),
+                   paragraph_lengths=paragraph_lengths,
+                   paragraph_run_counts=paragraph_run_counts,
+                   paragraph_format_ids=paragraph_format_ids,
+                   run_lengths=run_lengths,
+                   run_font_ids=run_font_ids,
+                   fonts=fonts,
+                   paragraph_formats=paragraph_formats)
+
+
+def merge_paragraph_spans(format_ids: Sequence[int]) -> list[tuple[int, int, int]]:
+    """Group the consecutive paragraphs with the same `format_id`.
+
+    Returns:
+        `(start, count, format_id)` with 1-based `start`.
+    """
+    spans: list[tuple[int, int, int]] = []
+    for index, format_id in enumerate(format_ids, start=1):
+        if spans and spans[-1][2] == format_id:
+            start, count, _ = spans[-1]
+            spans[-1] = (start, count + 1, format_id)
+        else:
+            spans.append((index, 1, format_id))
+    return spans
+
+
+def merge_font_spans(paragraph_run_counts: Sequence[int],
+                     run_lengths: Sequence[int],
+                     font_ids: Sequence[int]) -> list[tuple[int, int, int]]:
+    """Compute the spans of fonts over the text whose paragraphs are joined with `\\r`.
+
+    Adjacent runs with the same `font_id` are merged, even when
+    a paragraph break lies between them (the break receives the font as well).
+    Empty runs are skipped.
+
+    Args:
+        paragraph_run_counts: The number of runs for each paragraph.
+        run_lengths: The lengths of runs (UTF-16).
+        font_ids: The font of runs.
+
+    Returns:
+        `(start, length, font_id)` with 1-based `start`.
+    """
+    spans: list[tuple[int, int, int]] = []
+    runs = iter(zip(run_lengths, font_ids))
+    cursor = 1
+    for p_index, n_runs in enumerate(paragraph_run_counts):
+        if p_index:
+            cursor += 1  # `\r`.
+        for _ in range(n_runs):
+            length, font_id = next(runs)
+            if not length:
+                continue
+            if spans and spans[-1][2] == font_id and cursor - (spans[-1][0] + spans[-1][1]) <= 1:
+                start = spans[-1][0]
+                spans[-1] = (start, cursor + length - start, font_id)
+            else:
+                spans.append((cursor, length, font_id))
+            cursor += length
+    return spans
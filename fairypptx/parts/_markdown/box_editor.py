@@ -11,10 +11,7 @@ Box Editor's Rule.
 At the end of ``to_textbox`` function, virtual cursor exists at the start of the paragraph. 
 
 """
-import os
-import subprocess
 from contextlib import contextmanager
-import json  
 from pprint import pprint  
 from fairypptx import constants
 from fairypptx.parts._markdown import fonttag_parser
@@ -32,12 +29,8 @@ def write(shape, text, default_fontsize=18):
 
 
 def _to_jsonast(input_arg):
-    if os.path.exists(input_arg):
-        result = subprocess.run(f"pandoc {os.path.abspath(input_arg)} -t json", stdout=subprocess.PIPE)
-        return json.loads(result.stdout.decode(), encoding="utf8")
-    elif isinstance(input_arg, str):
-        result = subprocess.run(f"pandoc -t json", stdout=subprocess.PIPE, input=input_arg.encode("utf8"))
-        return json.loads(result.stdout.decode(), encoding="utf8")
+    from fairypptx.parts._markdown.jsonast.utils import to_jsonast
+    return to_jsonast(input_arg)
 
 
 def _factory(object_dict):
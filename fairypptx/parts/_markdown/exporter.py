@@ -0,0 +1,241 @@
+"""Export of texts in PowerPoint to Markdown.
+
+Each text frame is read once into `TextFrameSnapshot`
+(text, bold, italic, underline, color, hyperlink of runs / bullet, indent, size of paragraphs),
+and Markdown is generated from the snapshot without further COM calls.
+
+`iter_markdown` yields Markdown slide by slide, so that
+only one slide is kept in memory even for large presentations,
+and `export_markdown` writes it to a file.
+
+The format follows `box_interpreter.interpret`:
+
+* Bullets are `* ` / `1. `, indented with 4 spaces per level.
+* Headers are inferred from the font size relative to the smallest one in the frame.
+* Underline and non-default color are expressed with HTML tags.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Sequence, Self, TYPE_CHECKING
+
+from pywintypes import com_error
+
+from fairypptx import constants
+from fairypptx.color import Color
+from fairypptx.core.types import COMObject
+from fairypptx.apis.text_range.api_model import normalize_paragraph_breaks
+
+if TYPE_CHECKING:
+    from fairypptx.presentation import Presentation
+    from fairypptx.slide import Slide
+
+
+_DEFAULT_FONTSIZE = 18
+_BLACK = 0
+
+
+@dataclass(frozen=True)
+class RunSnapshot:
+    text: str
+    bold: bool = False
+    italic: bool = False
+    underline: bool = False
+    color: int = _BLACK
+    hyperlink: str | None = None
+
+
+@dataclass(frozen=True)
+class ParagraphSnapshot:
+    runs: Sequence[RunSnapshot]
+    indent_level: int = 1
+    bullet_type: int | None = None  # None if the bullet is not visible.
+    size: float = 0
+
+    @property
+    def text(self) -> str:
+        return "".join(run.text for run in self.runs)
+
+
+class _FontFlagReader:
+    """Read bold / italic / underline of runs.
+    The flags which are determined for the whole range are read only once.
+    """
+    _KEYS = ("Bold", "Italic", "Underline")
+
+    def __init__(self, range_api: COMObject):
+        font_api = range_api.Font
+        self._uniform: dict[str, bool] = {}
+        for key in self._KEYS:
+            value = getattr(font_api, key)
+            if value in (constants.msoTrue, constants.msoFalse):
+                self._uniform[key] = value == constants.msoTrue
+
+    def __call__(self, font_api: COMObject) -> dict[str, bool]:
+        return {key.lower(): self._uniform[key] if key in self._uniform else getattr(font_api, key) == constants.msoTrue
+                for key in self._KEYS}
+
+
+@dataclass(frozen=True)
+class TextFrameSnapshot:
+    paragraphs: Sequence[ParagraphSnapshot]
+
+    @classmethod
+    def from_api(cls, text_range_api: COMObject, read_hyperlinks: bool = True) -> Self:
+        """Read `TextRange` in one pass over paragraphs and runs.
+
+        Args:
+            read_hyperlinks: If False, `ActionSettings` of runs are not read.
+                (e.g. the slide has no hyperlinks.)
+        """
+        flag_reader = _FontFlagReader(text_range_api)
+        paragraphs = []
+        for paragraph_api in text_range_api.Paragraphs():
+            bullet_api = paragraph_api.ParagraphFormat.Bullet
+            bullet_type = bullet_api.Type if bullet_api.Visible == constants.msoTrue else None
+            runs = []
+            for run_api in paragraph_api.Runs():
+                text = normalize_paragraph_breaks(run_api.Text).replace("\r", "")
+                font_api = run_api.Font
+                hyperlink = _read_hyperlink(run_api) if read_hyperlinks else None
+                runs.append(RunSnapshot(text=text,
+                                        color=font_api.Color.RGB,
+                                        hyperlink=hyperlink,
+                                        **flag_reader(font_api)))
+            paragraphs.append(ParagraphSnapshot(runs=runs,
+                                                indent_level=paragraph_api.IndentLevel,
+                                                bullet_type=bullet_type,
+                                                size=paragraph_api.Font.Size))
+        return cls(paragraphs=paragraphs)
+
+    @property
+    def text(self) -> str:
+        return "\r".join(paragraph.text for paragraph in self.paragraphs)
+
+    def to_markdown(self) -> str:
+        return "".join(MarkdownWriter(self).iter_lines())
+
+
+def _read_hyperlink(run_api: COMObject) -> str | None:
+    action = run_api.ActionSettings(constants.ppMouseClick)
+    if action.Action != constants.ppActionHyperlink:
+        return None
+    return action.Hyperlink.Address
+
+
+class MarkdownWriter:
+    """Generate Markdown from `TextFrameSnapshot`."""
+
+    def __init__(self, snapshot: TextFrameSnapshot):
+        self.snapshot = snapshot
+        self.default_fontsize = _infer_default_fontsize(snapshot.paragraphs)
+        self.default_color = _infer_default_color(snapshot.paragraphs)
+
+    def iter_lines(self) -> Iterator[str]:
+        prev_key: tuple[int, str | None] = (1, None)
+        for paragraph in self.snapshot.paragraphs:
+            mode = _to_itemization_mode(paragraph.bullet_type)
+            key = (paragraph.indent_level, mode)
+            # Separation of itemizations.
+            prefix = "\n" if key != prev_key else ""
+            prev_key = key
+            prefix += " " * 4 * (paragraph.indent_level - 1)
+            if mode == "ordered":
+                prefix += "1. "
+            elif mode == "unordered":
+                prefix += "* "
+            elif paragraph.indent_level == 1:
+                prefix += self._to_header_prefix(paragraph.size)
+            yield prefix + "".join(self._convert_run(run) for run in paragraph.runs) + "\n"
+
+    def _to_header_prefix(self, size: float) -> str:
+        """Currently, the font size smaller than the default cannot be handled."""
+        if size <= 0:
+            return ""
+        ratio = size / self.default_fontsize
+        if 2.0 <= ratio:
+            return "# "
+        elif 1.5 <= ratio:
+            return "## "
+        elif 1.2 <= ratio:
+            return "### "
+        return ""
+
+    def _convert_run(self, run: RunSnapshot) -> str:
+        if run.hyperlink is not None:
+            return f"[{run.text}]({run.hyperlink})"
+
+        text = run.text.replace("\013", "  \n")
+        if run.bold and run.italic:
+            text = f"***{text}***"
+        elif run.bold:
+            text = f"**{text}**"
+        elif run.italic:
+            text = f"*{text}*"
+
+        if run.underline:
+            text = f"<u>{text}</u>"
+
+        if run.color != self.default_color:
+            text = f'<span style="color:{Color(run.color).as_hex()}">{text}</span>'
+        return text
+
+
+def _to_itemization_mode(bullet_type: int | None) -> str | None:
+    if bullet_type is None:
+        return None
+    return "ordered" if bullet_type == constants.ppBulletNumbered else "unordered"
+
+
+def _infer_default_fontsize(paragraphs: Sequence[ParagraphSnapshot]) -> float:
+    # The smallest one is regarded as the normal text.
+    return min((paragraph.size for paragraph in paragraphs if 0 < paragraph.size), default=_DEFAULT_FONTSIZE)
+
+
+def _infer_default_color(paragraphs: Sequence[ParagraphSnapshot]) -> int:
+    counter = Counter(run.color for paragraph in paragraphs for run in paragraph.runs if 0 <= run.color)
+    if not counter:
+        return _BLACK
+    return counter.most_common(1)[0][0]
+
+
+def slide_to_markdown(slide_api: COMObject) -> str:
+    """Markdown of the text frames of the slide, separated by blank lines."""
+    from fairypptx.text_range.search import iter_text_range_apis
+    try:
+        has_hyperlinks = 0 < slide_api.Hyperlinks.Count
+    except com_error:
+        has_hyperlinks = True
+    scripts = []
+    for text_range_api in iter_text_range_apis(list(slide_api.Shapes)):
+        snapshot = TextFrameSnapshot.from_api(text_range_api, read_hyperlinks=has_hyperlinks)
+        if snapshot.text.strip():
+            scripts.append(snapshot.to_markdown().strip("\n"))
+    return "\n\n".join(scripts)
+
+
+def iter_markdown(presentation: "Presentation",
+                  slides: "slice | Iterable[int] | Iterable[Slide] | None" = None) -> Iterator[str]:
+    """Yield Markdown of the slides one by one, separated with `---`.
+
+    Args:
+        slides: Target slides. See `Presentation.select`.
+    """
+    for index, slide_api in enumerate(presentation._to_slide_apis(slides)):
+        if index:
+            yield "\n---\n\n"
+        script = slide_to_markdown(slide_api)
+        yield f"{script}\n" if script else ""
+
+
+def export_markdown(presentation: "Presentation",
+                    path: str | Path | IO[str],
+                    slides: "slice | Iterable[int] | Iterable[Slide] | None" = None) -> None:
+    """Write Markdown of the slides to `path` (or a text stream), slide by slide."""
+    if isinstance(path, (str, Path)):
+        with open(path, "w", encoding="utf8") as fp:
+            export_markdown(presentation, fp, slides=slides)
+        return
+    for chunk in iter_markdown(presentation, slides=slides):
+        path.write(chunk)
@@ -24,12 +24,17 @@ however, for e-mails this function may be necessary.
 """
 
 from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from typing import Union, Optional
+from typing import Union, Optional, Sequence
 from pathlib import Path
+import hashlib
 import premailer
 import subprocess
 
+from fairypptx.registry_utils.utils import get_registry_folder
+from fairypptx.parts._markdown.jsonast.utils import TextCache, get_pandoc_versions, to_hash
+
 _this_folder = Path(__file__).absolute().parent
 _default_css_cache = _this_folder / "__css__"
 _default_css_cache.mkdir(exist_ok=True)
@@ -37,7 +42,7 @@ _default_css_cache.mkdir(exist_ok=True)
 
 def _is_existent_path(arg):
     try:
-        return Path(arg).exists()
+        return Path(arg).is_file()
     except:
         return False
 
@@ -49,8 +54,52 @@ def to_html(
     output_path=None,
     css_folder=None,
 ):
-    """Convert markdown document to html."""
-    css_path = _CSSCache(css_folder)(css)
+    """Convert markdown document to html.
+
+    The result is cached by (markdown, content of css, version of pandoc),
+    in memory and on disk (bounded by size, see `TextCache`).
+    """
+    html = to_html_many([markdown], css=css, css_folder=css_folder)[0]
+    if output_path:
+        Path(output_path).write_text(html, encoding="utf8")
+    return html
+
+
+def to_html_many(
+    markdowns: Sequence[Union[str, Path]],
+    css: Optional[Union[str, Path]] = None,
+    *,
+    css_folder=None,
+    max_workers: int = 4,
+) -> list[str]:
+    """Convert markdown documents to html with the same `css`.
+
+    The documents which are not cached are converted by `pandoc` in parallel,
+    and inlined by one `premailer.Premailer`, so that the parsing of css is shared.
+    """
+    css_path = _get_css_index(css_folder)(css)
+    css_hash = _hash_file(css_path) if css_path else ""
+    version = get_pandoc_versions()["version"]
+
+    texts = [Path(markdown).read_text(encoding="utf8") if _is_existent_path(markdown) else str(markdown)
+             for markdown in markdowns]
+    keys = [to_hash(version, css_hash, text) for text in texts]
+    results = [_html_cache.get_text(key) for key in keys]
+    missing = {key: text for key, text, result in zip(keys, texts, results) if result is None}
+    if missing:
+        run = partial(_run_pandoc, css_path=css_path)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as executor:
+            raw_htmls = list(executor.map(run, missing.values()))
+        inliner = premailer.Premailer()
+        converted = {}
+        for key, raw_html in zip(missing, raw_htmls):
+            converted[key] = inliner.transform(raw_html)
+            _html_cache.put_text(key, converted[key])
+        results = [result if result is not None else converted[key] for key, result in zip(keys, results)]
+    return results  # type: ignore[return-value]
+
+
+def _run_pandoc(markdown: str, css_path: Optional[Path] = None) -> str:
     command = f"""
     pandoc -s --self-contained -t html5
     """.strip()
@@ -58,9 +107,6 @@ def to_html(
     if css_path:
         command += f" -c {css_path.absolute()}"
 
-    if _is_existent_path(markdown):
-        markdown = Path(markdown).read_text(encoding="utf8")
-
     result = subprocess.run(
         command,
         universal_newlines=True,
@@ -71,22 +117,49 @@ def to_html(
     )
     if result.returncode != 0:
         raise RuntimeError(result.stderr)
-    html = result.stdout
-    html = premailer.transform(html)
+    return result.stdout
 
-    if output_path:
-        Path(output_path).write_text(html, encoding="utf8")
-    return html
+
+class _HtmlCache(TextCache):
+    suffix = ".html"
+
+
+# The files on disk beyond `max_bytes` are removed from the least recently used.
+_html_cache = _HtmlCache(get_registry_folder() / "__pandoc__" / "html", max_size=128, max_bytes=32 * 1024 * 1024)
+
+# (path, size, mtime) -> hash of the content.
+_file_hashes: dict[tuple[str, int, int], str] = {}
+
+
+def _hash_file(path: Path) -> str:
+    stat = path.stat()
+    fingerprint = (str(path.absolute()), stat.st_size, stat.st_mtime_ns)
+    if fingerprint not in _file_hashes:
+        _file_hashes[fingerprint] = hashlib.sha256(path.read_bytes()).hexdigest()
+    return _file_hashes[fingerprint]
 
 
 class _CSSCache:
-    """CSSCache Folder."""
+    """CSSCache Folder.
+
+    The names of files are kept in memory, and refreshed when mtime of the folder changes
+    (i.e. files are added, removed or renamed).
+    """
 
     def __init__(self, folder=None):
         if folder is None:
             folder = _default_css_cache
         self.folder = Path(folder)
         assert self.folder.exists()
+        self._mtime: int | None = None
+        self._names: list[str] = []
+
+    def _refresh(self) -> list[str]:
+        mtime = self.folder.stat().st_mtime_ns
+        if mtime != self._mtime:
+            self._names = sorted(path.name for path in self.folder.iterdir())
+            self._mtime = mtime
+        return self._names
 
     def __call__(self, arg) -> Union[None, Path]:
         if arg is None:
@@ -94,9 +167,10 @@ class _CSSCache:
         arg = Path(arg)
         if arg.exists():
             return arg
-        if (self.folder / arg).exists():
+        names = self._refresh()
+        if str(arg) in names or (1 < len(arg.parts) and (self.folder / arg).exists()):
             return self.folder / arg
-        candidates = list(self.folder.glob(f"{arg}*"))
+        candidates = [self.folder / name for name in names if name.startswith(str(arg))]
         if len(candidates) == 1: 
             return candidates[0]
         elif 1 < len(candidates):
@@ -109,6 +183,16 @@ class _CSSCache:
         raise ValueError(f"Cannot handle appripriate css file by `{arg}`")
 
 
+_css_indices: dict[Path, _CSSCache] = {}
+
+
+def _get_css_index(folder=None) -> _CSSCache:
+    key = Path(folder if folder is not None else _default_css_cache).absolute()
+    if key not in _css_indices:
+        _css_indices[key] = _CSSCache(key)
+    return _css_indices[key]
+
+
 if __name__ == "__main__":
     result = to_html("sample.html", "sample", output_path="output.html")
     print(result)
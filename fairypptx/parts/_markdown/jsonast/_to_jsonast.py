@@ -70,11 +70,8 @@ class Converter:
         """
         if cls._pandoc_api is not None:
             return cls._pandoc_api
-        ret = subprocess.run("pandoc -t json",
-                              universal_newlines=True, 
-                              stdout=subprocess.PIPE, 
-                              input="", encoding="utf8")
-        cls._pandoc_api = json.loads(ret.stdout)["pandoc-api-version"]
+        from fairypptx.parts._markdown.jsonast.utils import get_pandoc_api_version
+        cls._pandoc_api = get_pandoc_api_version()
         return cls._pandoc_api
         
 
@@ -1,10 +1,12 @@
-from fairypptx import TextRange
+from fairypptx import Shape, TextRange
+from fairypptx import constants
+from fairypptx.apis.text_range.snapshot import utf16_len
 from fairypptx.parts._markdown.jsonast.models import BaseBlock, BaseInlineModel
 
 
 from contextlib import contextmanager
-from dataclasses import dataclass
-from typing import Iterator, Mapping, Type, TYPE_CHECKING, Self
+from dataclasses import dataclass, replace
+from typing import Iterator, Mapping, Sequence, Type, TYPE_CHECKING, Self
 
 if TYPE_CHECKING:
     from fairypptx.parts._markdown.jsonast.editors import BlockEditProtocol, InlineEditProtocol
@@ -47,38 +49,196 @@ class ParagraphState:
                    bullet_type=paragraph_format.bullet_type)
 
 
-@dataclass
+@dataclass(frozen=True)
+class _Piece:
+    start: int  # Position in the plan (UTF-16).
+    length: int
+    font_state: FontState
+    paragraph_state: ParagraphState
+
+
+class RenderPlan:
+    """Texts and formats to be written into `TextRange`, built in memory.
+
+    The positions are counted in UTF-16 units from the start of the plan.
+    """
+
+    def __init__(self, start: int = 0):
+        self.start = start
+        self.parts: list[str] = []
+        self.pieces: list[_Piece] = []
+        self.hyperlinks: list[tuple[int, int, str]] = []
+        self.end = start
+
+    def __bool__(self) -> bool:
+        return bool(self.parts) or bool(self.hyperlinks)
+
+    def add_text(self, text: str, font_state: FontState, paragraph_state: ParagraphState) -> None:
+        length = utf16_len(text)
+        if not length:
+            return
+        self.parts.append(text)
+        self.pieces.append(_Piece(self.end, length, font_state, paragraph_state))
+        self.end += length
+
+    @property
+    def text(self) -> str:
+        return "".join(self.parts)
+
+    def trim_end(self, chars: str = "\r") -> None:
+        """Remove the trailing `chars` (e.g. the break after the last paragraph)."""
+        while self.parts and self.parts[-1] and self.parts[-1][-1] in chars:
+            self.parts[-1] = self.parts[-1][:-1]
+            piece = self.pieces[-1]
+            if piece.length == 1:
+                self.parts.pop()
+                self.pieces.pop()
+            else:
+                self.pieces[-1] = replace(piece, length=piece.length - 1)
+            self.end -= 1
+
+    def font_spans(self) -> list[tuple[int, int, FontState]]:
+        """Merged `(start, length, font_state)`, relative to the plan start."""
+        spans: list[tuple[int, int, FontState]] = []
+        for piece in self.pieces:
+            start = piece.start - self.start
+            if spans and spans[-1][2] == piece.font_state:
+                spans[-1] = (spans[-1][0], start + piece.length - spans[-1][0], piece.font_state)
+            else:
+                spans.append((start, piece.length, piece.font_state))
+        return spans
+
+    def paragraph_spans(self, written: str) -> list[tuple[int, int, ParagraphState]]:
+        """Merged `(start, length, paragraph_state)`, relative to the plan start.
+
+        `written` is the text read back after writing.
+        The state of a paragraph is the one of its first character.
+        Paragraphs without characters follow the preceding one.
+        """
+        starts = [0]
+        position = 0
+        for char in written:
+            position += 1 if ord(char) < 0x10000 else 2
+            if char == "\r":
+                starts.append(position)
+        bounds = [(start, end) for start, end in zip(starts, [*starts[1:], position]) if start < end]
+
+        spans: list[tuple[int, int, ParagraphState]] = []
+        pieces = iter(self.pieces)
+        piece = next(pieces, None)
+        for start, end in bounds:
+            while piece is not None and piece.start - self.start + piece.length <= start:
+                piece = next(pieces, None)
+            if piece is None:
+                break
+            state = piece.paragraph_state
+            if spans and spans[-1][2] == state:
+                spans[-1] = (spans[-1][0], end - spans[-1][0], state)
+            else:
+                spans.append((start, end - start, state))
+        return spans
+
+
 class Context:
-    text_range: TextRange
-    block_editors: Mapping[Type[BaseBlock], Type["BlockEditProtocol"]]
-    inline_editors: Mapping[Type[BaseInlineModel], Type["InlineEditProtocol"]]
-    font_state: FontState = FontState()
-    paragraph_state = ParagraphState()
+    """State of the rendering of `PandocJsonAst` into `text_range`.
+
+    The editors insert texts via `insert_text`, which are stored in `RenderPlan`
+    and written at once with the merged formats (`flush`).
+
+    Accessing `text_range` flushes the plan, so that the editors
+    which handle `TextRange` directly keep working.
+
+    Args:
+        inherited: If `text_range` is empty and already has the states,
+            the spans of these states are not written at the first `flush`.
+    """
+
+    def __init__(self,
+                 text_range: TextRange,
+                 block_editors: Mapping[Type[BaseBlock], Type["BlockEditProtocol"]],
+                 inline_editors: Mapping[Type[BaseInlineModel], Type["InlineEditProtocol"]],
+                 font_state: FontState | None = None,
+                 paragraph_state: ParagraphState | None = None,
+                 inherited: tuple[FontState, ParagraphState] | None = None):
+        self._text_range = text_range
+        self.block_editors = block_editors
+        self.inline_editors = inline_editors
+        self.font_state = font_state if font_state is not None else FontState(bold=False, underline=False)
+        self.paragraph_state = paragraph_state if paragraph_state is not None else ParagraphState()
+        self.inherited = inherited
+        self._plan = RenderPlan()
+        # The editors are stateless, hence one instance per model type is reused.
+        self._block_dispatch: dict[type, "BlockEditProtocol"] = {}
+        self._inline_dispatch: dict[type, "InlineEditProtocol"] = {}
+        # Shapes made by the editors other than the one of `text_range` (e.g. tables).
+        self.shapes: list[Shape] = []
+
+    def sub_context(self,
+                    text_range: TextRange,
+                    font_state: FontState | None = None,
+                    paragraph_state: ParagraphState | None = None,
+                    inherited: tuple[FontState, ParagraphState] | None = None) -> "Context":
+        """Context for another `text_range` (e.g. a cell), sharing the editors and `shapes`."""
+        context = Context(text_range, self.block_editors, self.inline_editors,
+                          font_state=font_state, paragraph_state=paragraph_state, inherited=inherited)
+        context._block_dispatch = self._block_dispatch
+        context._inline_dispatch = self._inline_dispatch
+        context.shapes = self.shapes
+        return context
 
-    def __post_init__(self):
-        if self.font_state is None:
-            self.font_state = FontState(bold=False, underline=False)
-        self._need_to_apply_font = True
+    @property
+    def text_range(self) -> TextRange:
+        self.flush()
+        return self._text_range
 
-        if self.paragraph_state is None:
-            self.paragraph_state = ParagraphState()
-        self._need_to_apply_paragraph = True
+    @property
+    def position(self) -> int:
+        """The number of the characters (UTF-16) inserted via this context."""
+        return self._plan.end
 
+    def render(self, blocks: Sequence[BaseBlock], *, trim_end: bool = False) -> TextRange:
+        """Render `blocks` and write them.
+
+        Args:
+            trim_end: If True, the break after the last paragraph is not written.
+        """
+        self.apply_blocks(blocks)
+        if trim_end:
+            self._plan.trim_end()
+        self.flush()
+        return self._text_range
 
     def apply_inline(self, inline: BaseInlineModel):
-        from fairypptx.parts._markdown.jsonast.editors import FallbackInlineEditor
-        function = self._fetch_regisered_instance(inline, self.inline_editors) or FallbackInlineEditor()
+        cls = type(inline)
+        function = self._inline_dispatch.get(cls)
+        if function is None:
+            from fairypptx.parts._markdown.jsonast.editors import FallbackInlineEditor
+            function = self._fetch_regisered_instance(cls, self.inline_editors) or FallbackInlineEditor()
+            self._inline_dispatch[cls] = function
         function(inline, self)
 
     def apply_block(self, block: BaseBlock):
-        from fairypptx.parts._markdown.jsonast.editors import FallbackBlockEditor
-        function = self._fetch_regisered_instance(block, self.block_editors) or FallbackBlockEditor()
+        cls = type(block)
+        function = self._block_dispatch.get(cls)
+        if function is None:
+            from fairypptx.parts._markdown.jsonast.editors import FallbackBlockEditor
+            function = self._fetch_regisered_instance(cls, self.block_editors) or FallbackBlockEditor()
+            self._block_dispatch[cls] = function
         function(block, self)
 
-    def _fetch_regisered_instance(self, model: BaseBlock | BaseInlineModel, registers: Mapping) ->  "None | BlockEditProtocol | InlineEditProtocol":
-        for cls in type(model).mro():
-            if cls in registers:
-                return registers[cls]()
+    def apply_inlines(self, inlines: Sequence[BaseInlineModel]):
+        for inline in inlines:
+            self.apply_inline(inline)
+
+    def apply_blocks(self, blocks: Sequence[BaseBlock]):
+        for block in blocks:
+            self.apply_block(block)
+
+    def _fetch_regisered_instance(self, cls: type, registers: Mapping) ->  "None | BlockEditProtocol | InlineEditProtocol":
+        """Instance of the editor registered for `cls` or its nearest base class."""
+        for base in cls.mro():
+            if base in registers:
+                return registers[base]()
         return None
 
 
@@ -86,34 +246,53 @@ class Context:
     def update_font_state(self, font_state: FontState) -> Iterator[None]:
         prev_font_state = self.font_state
         self.font_state = font_state
-        self._need_to_apply_font = True
         yield
         self.font_state = prev_font_state
-        self._need_to_apply_font = True
 
     @contextmanager
     def update_paragraph_state(self, paragraph_state: ParagraphState) -> Iterator[None]:
         prev_state = self.paragraph_state
         self.paragraph_state = paragraph_state
-        self._need_to_apply_paragraph = True
         yield
         self.paragraph_state = prev_state
-        self._need_to_apply_paragraph = True
 
 
     def insert_text(self, text: str):
-        """Inser the text, if necessary `format` is modified for the generated TextRange.
+        """Insert the text with the current `font_state` and `paragraph_state`.
+        The text is written when the plan is flushed.
         """
-        text_range = self.text_range
-        if self._need_to_apply_font or self._need_to_apply_paragraph:
-            start_idx = text_range.total_count
-            text_range.insert(text)
-            length = text_range.total_count - start_idx
-            if length:
-                new_text_range = text_range.get_range_from_root(start_idx + 1, length)
-                self.paragraph_state.apply(new_text_range)
-                self.font_state.apply(new_text_range)
-                self._need_to_apply_font = False
-                self._need_to_apply_paragraph = False
+        self._plan.add_text(text, self.font_state, self.paragraph_state)
+
+    def add_hyperlink(self, start: int, length: int, address: str) -> None:
+        """Set the hyperlink to `[start, start + length)` of `position`."""
+        self._plan.hyperlinks.append((start, length, address))
+
+    def flush(self) -> None:
+        """Write the texts of the plan, then apply the merged formats."""
+        plan = self._plan
+        if not plan:
+            return
+        self._plan = RenderPlan(plan.end)
+        inherited_font, inherited_paragraph = self.inherited or (None, None)
+        # After the first write, the inserted texts follow the preceding characters.
+        self.inherited = None
+        text_range = self._text_range
+        root_api = text_range.root.api
+        text = plan.text
+        offset = 0
+        if text:
+            inserted_api = text_range.api.InsertAfter(text)
+            offset = inserted_api.Start - 1 - plan.start
+            if any(piece.paragraph_state != inherited_paragraph for piece in plan.pieces):
+                for start, length, state in plan.paragraph_spans(inserted_api.Text):
+                    if state != inherited_paragraph:
+                        state.apply(TextRange(root_api.Characters(inserted_api.Start + start, length)))
+            for start, length, state in plan.font_spans():
+                if state != inherited_font:
+                    state.apply(TextRange(root_api.Characters(inserted_api.Start + start, length)))
         else:
-            text_range.insert(text)
+            offset = root_api.Length - plan.start
+        for start, length, address in plan.hyperlinks:
+            hyperlink = root_api.Characters(offset + start + 1, length).ActionSettings(constants.ppMouseClick)
+            hyperlink.Action = constants.ppActionHyperlink
+            hyperlink.Hyperlink.Address = address
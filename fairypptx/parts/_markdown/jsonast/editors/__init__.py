@@ -1,8 +1,28 @@
 from dataclasses import replace
 from typing import Mapping, Protocol, TYPE_CHECKING
-from fairypptx.parts._markdown.jsonast.models import BaseBlock, BaseInlineModel, CodeBlock, CodeInline, Header, LineBreakInline, ParaBlock, PlainBlock, SoftBreakInline, SpaceInline, StrInline, StrongInline, LinkInline, OrderedList, BulletList, QuotedInline
-from fairypptx.parts._markdown.jsonast.context import Context
+from fairypptx.parts._markdown.jsonast.models import (
+    BaseBlock,
+    BaseInlineModel,
+    CodeBlock,
+    CodeInline,
+    Header,
+    LineBreakInline,
+    ParaBlock,
+    PlainBlock,
+    SoftBreakInline,
+    SpaceInline,
+    StrInline,
+    StrongInline,
+    LinkInline,
+    OrderedList,
+    BulletList,
+    QuotedInline,
+    TableBlock,
+)
+from fairypptx.parts._markdown.jsonast.context import Context, FontState, ParagraphState
 from fairypptx import constants
+from fairypptx import Shape, TextRange
+from fairypptx.object_utils import upstream
 
 
 class BlockEditProtocol[T: BaseBlock](Protocol):
@@ -26,16 +46,14 @@ def register_block(block_type: type[BaseBlock]):
 @register_block(ParaBlock)
 class ParaEditor(BlockEditProtocol):
     def __call__(self, model: ParaBlock, context: Context):
-        for inline in model.inlines:
-            context.apply_inline(inline)
+        context.apply_inlines(model.inlines)
         context.insert_text("\r")
 
 
 @register_block(PlainBlock)
 class PlainEditor(BlockEditProtocol):
     def __call__(self, model: PlainBlock, context: Context):
-        for inline in model.inlines:
-            context.apply_inline(inline)
+        context.apply_inlines(model.inlines)
         context.insert_text("\r")
 
 
@@ -52,8 +70,7 @@ class HeaderEditor(BlockEditProtocol):
         font_state = context.font_state
         assert font_state
         with context.update_font_state(replace(font_state, bold=True, underline=True)):
-            for inline in model.inlines:
-                context.apply_inline(inline)
+            context.apply_inlines(model.inlines)
             context.insert_text("\r")
 
 
@@ -69,10 +86,8 @@ class BulletListEditor(BlockEditProtocol):
                             indent_level=next_indent_level,
                             bullet_type=constants.ppBulletUnnumbered)
         with context.update_paragraph_state(new_state):
-            blocks_list = model.blocks_list
-            for blocks in blocks_list:
-                for block in blocks:
-                    context.apply_block(block)
+            for blocks in model.blocks_list:
+                context.apply_blocks(blocks)
 
 
 @register_block(OrderedList)
@@ -87,11 +102,70 @@ class OrderedListEditor(BlockEditProtocol):
                             indent_level=next_indent_level,
                             bullet_type=constants.ppBulletNumbered)
         with context.update_paragraph_state(new_state):
-            blocks_list = model.blocks_list
-            for blocks in blocks_list:
-                for block in blocks:
-                    context.apply_block(block)
-
+            for blocks in model.blocks_list:
+                context.apply_blocks(blocks)
+
+
+_CELL_ALIGNMENTS = {"AlignLeft": constants.ppAlignLeft,
+                    "AlignCenter": constants.ppAlignCenter,
+                    "AlignRight": constants.ppAlignRight}
+
+
+@register_block(TableBlock)
+class TableEditor(BlockEditProtocol):
+    """Make a table with one `AddTable`, and append it to `context.shapes`.
+
+    Each cell is rendered by its own sub context (one `InsertAfter` per cell),
+    and the formats are written only where they differ from the style of the table,
+    which is read from the first cell of the header / body rows.
+    The table is placed below the text by the caller after the rendering,
+    since the text rendered after the table changes the height of the shape.
+    """
+    def __call__(self, model: TableBlock, context: Context):
+        _, _, col_specs, head, bodies, foot = model.c
+        head_rows = list(head[1])
+        rows = [*head_rows, *(row for body in bodies for row in [*body[2], *body[3]]), *foot[1]]
+        n_rows, n_cols = len(rows), len(col_specs)
+        if not n_rows or not n_cols:
+            return
+
+        shape_api = upstream(context.text_range.api, "Shape")
+        slide_api = upstream(shape_api, "Slide")
+        table_shape_api = slide_api.Shapes.AddTable(n_rows, n_cols, shape_api.Left, shape_api.Top + shape_api.Height)
+        table_api = table_shape_api.Table
+        if not head_rows:
+            table_api.FirstRow = False
+
+        # Font states given by the style, for the header rows (True) and the others (False).
+        styled_fonts: dict[bool, FontState] = {}
+        occupied: set[tuple[int, int]] = set()
+        for r_index, (_, cells) in enumerate(rows):
+            is_header = r_index < len(head_rows)
+            font_state = FontState(bold=is_header)
+            if is_header not in styled_fonts:
+                first_cell = TextRange(table_api.Cell(r_index + 1, 1).Shape.TextFrame.TextRange)
+                styled_fonts[is_header] = FontState.from_text_range(first_cell)
+            c_index = 0
+            for _, alignment, row_span, col_span, blocks in cells:
+                while (r_index, c_index) in occupied:
+                    c_index += 1
+                if n_cols <= c_index:
+                    break
+                occupied.update((r_index + dr, c_index + dc) for dr in range(row_span) for dc in range(col_span))
+                cell_api = table_api.Cell(r_index + 1, c_index + 1)
+                if 1 < row_span or 1 < col_span:
+                    cell_api.Merge(table_api.Cell(min(r_index + row_span, n_rows), min(c_index + col_span, n_cols)))
+
+                cell_context = context.sub_context(TextRange(cell_api.Shape.TextFrame.TextRange),
+                                                   font_state=font_state,
+                                                   inherited=(styled_fonts[is_header], ParagraphState()))
+                text_range = cell_context.render(blocks, trim_end=True)
+                if alignment.t == "AlignDefault":
+                    alignment = col_specs[c_index][0]
+                if alignment.t in _CELL_ALIGNMENTS:
+                    text_range.api.ParagraphFormat.Alignment = _CELL_ALIGNMENTS[alignment.t]
+                c_index += col_span
+        context.shapes.append(Shape(table_shape_api))
 
 
 class FallbackBlockEditor(BlockEditProtocol):
@@ -133,15 +207,13 @@ class StrongEditor(InlineEditProtocol):
         font_state = context.font_state
         assert font_state
         with context.update_font_state(replace(font_state, bold=True)):
-            for inline in model.inlines:
-                context.apply_inline(inline)
+            context.apply_inlines(model.inlines)
 
 
 @register_inline(SpaceInline)
 class SpaceEditor(InlineEditProtocol):
     def __call__(self, _: SpaceInline, context: Context):
-        text_range = context.text_range
-        text_range.insert(" ")
+        context.insert_text(" ")
 
 
 @register_inline(LineBreakInline)
@@ -164,8 +236,7 @@ class QuotedInlineEditor(InlineEditProtocol):
         else:
             quote = '"'
         context.insert_text(quote)
-        for inline in inlines:
-            context.apply_inline(inline)
+        context.apply_inlines(inlines)
         context.insert_text(quote)
 
 
@@ -179,13 +250,8 @@ class CodeInlineEditor(InlineEditProtocol):
 class LinkInlineEditor(InlineEditProtocol):
     def __call__(self, model: LinkInline , context: Context):
         path, _ = model.c[-1]
-        start_index = context.text_range.total_count
-        for inline in model.inlines:
-            context.apply_inline(inline)
-        end_index = context.text_range.total_count
-        length = end_index - start_index
+        start_index = context.position
+        context.apply_inlines(model.inlines)
+        length = context.position - start_index
         if length:
-            target = context.text_range.get_range_from_root(start_index + 1, length)
-            hyperlink = target.api.ActionSettings(constants.ppMouseClick)
-            hyperlink.Action = constants.ppActionHyperlink
-            hyperlink.Hyperlink.Address = path
+            context.add_hyperlink(start_index, length, path)
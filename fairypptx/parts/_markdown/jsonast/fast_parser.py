@@ -0,0 +1,364 @@
+"""Pure-Python parser for the common subset of Markdown.
+
+The snippets for slides mostly consist of the elements below,
+which are the ones handled by `jsonast.editors`.
+For them, the JSON AST equivalent to `pandoc -t json` is built without `pandoc`.
+
+* Blocks: ATX headers (`#`), paragraphs, tight bullet / ordered (`1.`) lists (nested).
+* Inlines: emphasis, strong, inline code, links (`[text](url)`).
+
+For anything else (e.g. quotes which `pandoc` converts with `smart`, tables, HTML, escapes),
+`parse` returns None and the caller falls back to `pandoc`.
+The policy is to decline rather than to guess: the output must be the same as `pandoc`.
+"""
+
+from itertools import count
+import re
+from typing import Any, Sequence
+
+DEFAULT_API_VERSION = (1, 23, 1)
+
+_EMPTY_ATTR = ["", [], []]
+
+# Characters / sequences which `pandoc` handles specially.
+_UNSUPPORTED_CHARS = set("\\<>&'\"~^$@|{}\t]")
+_UNSUPPORTED_SEQUENCES = ("--", "...")
+
+_HEADER = re.compile(r"^(#{1,6}) +(.*?)$")
+_BULLET = re.compile(r"^( *)([*+-]) {1,4}(\S.*)$")
+_ORDERED = re.compile(r"^( *)(\d{1,9})\. {1,4}(\S.*)$")
+# Besides, the markers of `fancy_lists` (e.g. `a.`, `(1)`, `iv)`) and setext underlines.
+_BLOCK_START = re.compile(r"^(?: {0,3}(?:#|>|[*+-](?: |$)|\d+[.)](?: |$)|[a-zA-Z]+[.)](?: |$)|\(\w+\)(?: |$)"
+                          r"|[-*_=]{3,}|=+ *$|```|~~~|:)| {4,}|%)")
+# Horizontal rules, including the ones separated by spaces (e.g. `* * *`).
+_HRULE = re.compile(r"^ {0,3}([-*_])(?: *\1){2,} *$")
+_LINK = re.compile(r"\[([^\[\]]*)\]\(([^\s()<>\"']*)\)")
+
+
+class Unsupported(Exception):
+    """The input contains an element outside of the supported subset."""
+
+
+def parse(text: str, api_version: Sequence[int] | None = None) -> dict[str, Any] | None:
+    """Return JSON AST of `text`, equivalent to `pandoc -t json`, or None if unsupported."""
+    try:
+        blocks = _BlockParser(text).parse()
+    except Unsupported:
+        return None
+    data: dict[str, Any] = {"blocks": blocks, "meta": {}}
+    if api_version is not None:
+        data["pandoc-api-version"] = list(api_version)
+    return data
+
+
+class _BlockParser:
+    def __init__(self, text: str):
+        if "\t" in text or "\r" in text:
+            raise Unsupported()
+        self.lines = text.split("\n")
+        self.identifiers: set[str] = set()
+
+    def parse(self) -> list[dict[str, Any]]:
+        blocks = []
+        for chunk in self._to_chunks():
+            first = chunk[0]
+            if first.startswith("#"):
+                if len(chunk) != 1:
+                    raise Unsupported()
+                blocks.append(self._to_header(first))
+            elif _is_list_start(first):
+                blocks.extend(_ListParser(chunk).parse())
+            else:
+                blocks.append(self._to_para(chunk))
+        return blocks
+
+    def _to_chunks(self) -> list[list[str]]:
+        """Split the lines at blank lines. Lists must not contain blank lines."""
+        chunks: list[list[str]] = [[]]
+        for line in self.lines:
+            if _HRULE.match(line):
+                raise Unsupported()
+            if line.strip():
+                chunks[-1].append(line)
+            elif chunks[-1]:
+                chunks.append([])
+        chunks = [chunk for chunk in chunks if chunk]
+        for prev, chunk in zip(chunks, chunks[1:]):
+            if _is_list_start(prev[0]) and (chunk[0].startswith(" ") or _is_list_start(chunk[0])):
+                raise Unsupported()  # Loose list.
+        return chunks
+
+    def _to_header(self, line: str) -> dict[str, Any]:
+        match = _HEADER.match(line.rstrip())
+        if not match or not match.group(2) or match.group(2).endswith("#"):
+            raise Unsupported()
+        level, content = len(match.group(1)), match.group(2)
+        inlines = parse_inlines(content)
+        identifier = self._to_identifier(inlines)
+        return {"t": "Header", "c": [level, [identifier, [], []], inlines]}
+
+    def _to_identifier(self, inlines: Sequence[dict[str, Any]]) -> str:
+        """Identifier of `auto_identifiers` of `pandoc`."""
+        text = stringify(inlines).lower()
+        chars = []
+        for char in text:
+            if char.isspace():
+                chars.append("-")
+            elif char.isalnum() or char in "_-.":
+                chars.append(char)
+        identifier = "".join(chars)
+        index = next((i for i, char in enumerate(identifier) if char.isalpha()), len(identifier))
+        identifier = identifier[index:] or "section"
+        # The suffix is chosen so as not to collide with any identifier already assigned
+        # (e.g. `# A`, `# A`, `# A-1` gives `a`, `a-1`, `a-1-1`).
+        if identifier in self.identifiers:
+            identifier = next(candidate for number in count(1)
+                              if (candidate := f"{identifier}-{number}") not in self.identifiers)
+        self.identifiers.add(identifier)
+        return identifier
+
+    def _to_para(self, lines: Sequence[str]) -> dict[str, Any]:
+        if lines[0].startswith(" ") or any(_BLOCK_START.match(line) for line in lines):
+            raise Unsupported()
+        return {"t": "Para", "c": _lines_to_inlines(lines)}
+
+
+class _ListParser:
+    """Tight lists without blank lines.
+    A nested list starts at (or within 3 spaces after) the content column of the parent item.
+    """
+
+    def __init__(self, lines: Sequence[str]):
+        self.lines = lines
+
+    def parse(self) -> list[dict[str, Any]]:
+        # Each frame: (marker indent, content column, kind, start, items)
+        # Each item: [lines of text, nested lists (blocks)]
+        root: list[dict[str, Any]] = []
+        stack: list[dict[str, Any]] = []
+        for line in self.lines:
+            marker = _to_marker(line)
+            if marker is None:
+                if not stack:
+                    raise Unsupported()
+                if _BLOCK_START.match(line.lstrip()) or len(line) - len(line.lstrip()) >= 4:
+                    raise Unsupported()
+                stack[-1]["items"][-1]["lines"].append(line.lstrip())
+                continue
+            indent, kind, number, column, content = marker
+            while stack and indent < stack[-1]["indent"]:
+                stack.pop()
+            if stack and indent == stack[-1]["indent"]:
+                if stack[-1]["kind"] != kind:
+                    raise Unsupported()
+            elif (not stack and indent == 0) or (stack and 0 <= indent - stack[-1]["column"] < 4):
+                frame = {"indent": indent, "column": column, "kind": kind, "start": number, "items": []}
+                (stack[-1]["items"][-1]["children"] if stack else root).append(frame)
+                stack.append(frame)
+            else:
+                raise Unsupported()
+            stack[-1]["column"] = column
+            stack[-1]["items"].append({"lines": [content], "children": []})
+        return [_frame_to_block(frame) for frame in root]
+
+
+def _is_list_start(line: str) -> bool:
+    return bool(_BULLET.match(line) or _ORDERED.match(line))
+
+
+def _to_marker(line: str) -> tuple[int, str, int, int, str] | None:
+    """(indent, kind, number, content column, content) of the list marker."""
+    if match := _BULLET.match(line):
+        indent, marker, content = match.groups()
+        return len(indent), marker, 1, len(line) - len(content), content
+    if match := _ORDERED.match(line):
+        indent, number, content = match.groups()
+        return len(indent), "ordered", int(number), len(line) - len(content), content
+    return None
+
+
+def _frame_to_block(frame: dict[str, Any]) -> dict[str, Any]:
+    items = []
+    for item in frame["items"]:
+        # The first line is the content after the marker (e.g. `* # Header`, `* 1. nested`).
+        if any(_BLOCK_START.match(line) for line in item["lines"]):
+            raise Unsupported()
+        blocks = [{"t": "Plain", "c": _lines_to_inlines(item["lines"])}]
+        blocks += [_frame_to_block(child) for child in item["children"]]
+        items.append(blocks)
+    if frame["kind"] == "ordered":
+        return {"t": "OrderedList",
+                "c": [[frame["start"], {"t": "Decimal"}, {"t": "Period"}], items]}
+    return {"t": "BulletList", "c": items}
+
+
+def _lines_to_inlines(lines: Sequence[str]) -> list[dict[str, Any]]:
+    for line in lines:
+        if line.endswith("  "):
+            raise Unsupported()  # Hard line break.
+    return parse_inlines("\n".join(line.strip() for line in lines))
+
+
+def parse_inlines(text: str) -> list[dict[str, Any]]:
+    return _InlineParser(text).parse()
+
+
+class _InlineParser:
+    def __init__(self, text: str):
+        self.text = text
+        self.inlines: list[dict[str, Any]] = []
+        self.buffer: list[str] = []
+
+    def parse(self) -> list[dict[str, Any]]:
+        text = self.text
+        index = 0
+        while index < len(text):
+            char = text[index]
+            if char == "`":
+                index = self._code(index)
+            elif char == "[":
+                index = self._link(index)
+            elif char in "*_":
+                index = self._emphasis(index)
+            else:
+                self.buffer.append(char)
+                index += 1
+        self._flush()
+        return self.inlines
+
+    def _flush(self) -> None:
+        text = "".join(self.buffer)
+        self.buffer = []
+        if not text:
+            return
+        if any(char in _UNSUPPORTED_CHARS for char in text):
+            raise Unsupported()
+        if any(sequence in text for sequence in _UNSUPPORTED_SEQUENCES):
+            raise Unsupported()
+        for token in re.split(r"( +|\n)", text):
+            if not token:
+                continue
+            if token == "\n":
+                self._append({"t": "SoftBreak"})
+            elif token.startswith(" "):
+                self._append({"t": "Space"})
+            else:
+                self._append({"t": "Str", "c": token})
+
+    def _append(self, inline: dict[str, Any]) -> None:
+        inlines = self.inlines
+        if inline["t"] == "Str" and inlines and inlines[-1]["t"] == "Str":
+            inlines[-1] = {"t": "Str", "c": inlines[-1]["c"] + inline["c"]}
+        elif inline["t"] in {"Space", "SoftBreak"} and inlines and inlines[-1]["t"] in {"Space", "SoftBreak"}:
+            raise Unsupported()
+        else:
+            inlines.append(inline)
+
+    def _extend(self, inlines: Sequence[dict[str, Any]]) -> None:
+        self._flush()
+        for inline in inlines:
+            self._append(inline)
+
+    def _code(self, index: int) -> int:
+        text = self.text
+        length = _run_length(text, index)
+        end = _to_code_closer(text, index)
+        content = text[index + length:end]
+        if not content or content != content.strip() or "\n" in content:
+            raise Unsupported()
+        self._extend([{"t": "Code", "c": [_EMPTY_ATTR, content]}])
+        return end + length
+
+    def _link(self, index: int) -> int:
+        match = _LINK.match(self.text, index)
+        if self.buffer and self.buffer[-1] == "!":
+            raise Unsupported()  # Image.
+        if not match or not match.group(1) or match.group(1) != match.group(1).strip():
+            raise Unsupported()
+        label, url = match.groups()
+        self._extend([{"t": "Link", "c": [_EMPTY_ATTR, parse_inlines(label), [url, ""]]}])
+        return match.end()
+
+    def _emphasis(self, index: int) -> int:
+        text = self.text
+        char = text[index]
+        length = _run_length(text, index)
+        prev_char = text[index - 1] if index else " "
+        next_char = text[index + length] if index + length < len(text) else " "
+        if char == "_" and prev_char.isalnum():
+            # Intraword underscores are literal.
+            if next_char.isalnum():
+                self.buffer.append(char * length)
+                return index + length
+            raise Unsupported()
+        if char == "_" and not prev_char.isspace():
+            raise Unsupported()  # e.g. `x._y_`, which `pandoc` regards as intraword.
+        if next_char.isspace():
+            if prev_char.isspace():
+                self.buffer.append(char * length)
+                return index + length
+            raise Unsupported()
+        if 3 <= length:
+            raise Unsupported()
+        end = self._find_closer(index + length, char, length)
+        inner = parse_inlines(text[index + length:end])
+        tag = "Emph" if length == 1 else "Strong"
+        self._extend([{"t": tag, "c": inner}])
+        return end + length
+
+    def _find_closer(self, start: int, char: str, length: int) -> int:
+        text = self.text
+        index = start
+        while index < len(text):
+            current = text[index]
+            if current == "`":
+                index = _to_code_closer(text, index) + _run_length(text, index)
+                continue
+            if current == char:
+                run = _run_length(text, index)
+                after = text[index + run] if index + run < len(text) else " "
+                if run == length and not text[index - 1].isspace() and not (char == "_" and after.isalnum()):
+                    return index
+                index += run
+                continue
+            index += 1
+        raise Unsupported()
+
+
+def _to_code_closer(text: str, index: int) -> int:
+    """Index of the backtick run closing the code span opened at `index`.
+    As CommonMark, it is the next run of the same length (e.g. `` `c``c` `` is one span).
+    """
+    length = _run_length(text, index)
+    start = index + length
+    while (end := text.find("`", start)) >= 0:
+        run = _run_length(text, end)
+        if run == length:
+            return end
+        start = end + run
+    raise Unsupported()  # The backticks are literal.
+
+
+def _run_length(text: str, index: int) -> int:
+    end = index
+    while end < len(text) and text[end] == text[index]:
+        end += 1
+    return end - index
+
+
+def stringify(inlines: Sequence[dict[str, Any]]) -> str:
+    """Plain text of `inlines`, as `stringify` of `pandoc`."""
+    parts = []
+    for inline in inlines:
+        tag = inline["t"]
+        if tag == "Str":
+            parts.append(inline["c"])
+        elif tag in {"Space", "SoftBreak"}:
+            parts.append(" ")
+        elif tag == "Code":
+            parts.append(inline["c"][1])
+        elif tag == "Link":
+            parts.append(stringify(inline["c"][1]))
+        elif tag in {"Emph", "Strong"}:
+            parts.append(stringify(inline["c"]))
+    return "".join(parts)
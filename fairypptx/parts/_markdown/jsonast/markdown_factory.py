@@ -15,7 +15,14 @@ from fairypptx.font import Font
 from fairypptx.apis.font import FontApiModel
 
 
-from typing import Mapping
+from dataclasses import asdict, dataclass
+from difflib import SequenceMatcher
+from itertools import accumulate
+from typing import ClassVar, Mapping, Sequence, Self
+import hashlib
+
+from fairypptx import TextRange
+from fairypptx.parts._markdown.jsonast.models import BaseBlock
 
 
 class MarkdownFactory:
@@ -33,9 +40,121 @@ class MarkdownFactory:
         context = Context(text_range=shape.text_range,
                           block_editors=self.block_editors,
                           inline_editors=self.inline_editors)
+        lengths = self._render_blocks(context, blocks)
+        self._stack_below(shape, context.shapes)
+        BlockIndex.from_blocks(blocks, lengths, shape.api.TextFrame.TextRange.Text).save(shape.api)
+        if context.shapes:
+            return Markdown([shape, *context.shapes])
+        return Markdown(shape)
+
+    def update(self, shape: Shape, document: str | Path) -> bool:
+        """Rewrite only the texts of the top-level blocks which differ from the previous document.
+
+        The blocks of the previous document are identified by `BlockIndex` in the tags of `shape`.
+
+        Returns:
+            False if the update in place is impossible
+            (e.g. `shape` is not made by `from_document`, is edited by hand, or tables are changed).
+        """
+        shape_api = shape.api
+        root_api = shape_api.TextFrame.TextRange
+        index = BlockIndex.load(shape_api)
+        if index is None or not index.is_valid_for(root_api.Text):
+            return False
+        blocks = PandocJsonAst.model_validate(to_jsonast(document)).blocks
+        new_index = BlockIndex.from_blocks(blocks, [0] * len(blocks), "")
+        opcodes = [opcode for opcode in SequenceMatcher(None, index.hashes, new_index.hashes, autojunk=False).get_opcodes()
+                   if opcode[0] != "equal"]
+        for _, i1, i2, j1, j2 in opcodes:
+            if index.has_shapes(i1, i2) or new_index.has_shapes(j1, j2):
+                return False
+
+        lengths = list(index.lengths)
+        offsets = index.offsets
+        # From the back, so that the offsets of the preceding blocks are kept.
+        for _, i1, i2, j1, j2 in reversed(opcodes):
+            start, end = offsets[i1], offsets[i2]
+            if start < end:
+                root_api.Characters(start + 1, end - start).Delete()
+            anchor = root_api.Characters(start, 1) if start else root_api.Characters(1, 0)
+            context = Context(text_range=TextRange(anchor),
+                              block_editors=self.block_editors,
+                              inline_editors=self.inline_editors)
+            lengths[i1:i2] = self._render_blocks(context, blocks[j1:j2])
+        BlockIndex(hashes=new_index.hashes, kinds=new_index.kinds, lengths=lengths,
+                   text_hash=BlockIndex.hash_text(root_api.Text)).save(shape_api)
+        return True
+
+    @staticmethod
+    def _stack_below(shape: Shape, others: Sequence[Shape]) -> None:
+        """Place `others` (e.g. tables) below the rendered text of `shape`, in order."""
+        left, top = shape.api.Left, shape.api.Top + shape.api.Height
+        for other in others:
+            other.api.Left, other.api.Top = left, top
+            top += other.api.Height
+
+    @staticmethod
+    def _render_blocks(context: Context, blocks: Sequence[BaseBlock]) -> list[int]:
+        """Render `blocks`, and return the length (UTF-16) of the text of each block."""
+        lengths = []
         for block in blocks:
+            start = context.position
             context.apply_block(block)
-        return Markdown(shape)
+            lengths.append(context.position - start)
+        context.flush()
+        return lengths
+
+
+@dataclass(frozen=True)
+class BlockIndex:
+    """Top-level blocks rendered in a shape, stored in the tags of the shape.
+
+    * `hashes`: Hashes of the blocks.
+    * `kinds`: Tags of the blocks (e.g. `Para`, `Table`).
+    * `lengths`: The lengths (UTF-16) of the texts written by the blocks.
+    * `text_hash`: Hash of the whole text, to detect the edit by hand.
+    """
+    TAG_NAME: ClassVar[str] = "FAIRYPPTX_MARKDOWN_BLOCKS"
+    # Blocks which make shapes other than the text.
+    SHAPE_KINDS: ClassVar[frozenset[str]] = frozenset({"Table"})
+
+    hashes: Sequence[str]
+    kinds: Sequence[str]
+    lengths: Sequence[int]
+    text_hash: str
+
+    @classmethod
+    def from_blocks(cls, blocks: Sequence[BaseBlock], lengths: Sequence[int], text: str) -> Self:
+        hashes = [hashlib.sha1(block.model_dump_json().encode("utf8")).hexdigest()[:16] for block in blocks]
+        kinds = [str(getattr(block, "t", "")) for block in blocks]
+        return cls(hashes=hashes, kinds=kinds, lengths=list(lengths), text_hash=cls.hash_text(text))
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        return hashlib.sha1(str(text).encode("utf8")).hexdigest()[:16]
+
+    @property
+    def offsets(self) -> list[int]:
+        return [0, *accumulate(self.lengths)]
+
+    def is_valid_for(self, text: str) -> bool:
+        return self.hash_text(text) == self.text_hash
+
+    def has_shapes(self, start: int, end: int) -> bool:
+        return any(kind in self.SHAPE_KINDS for kind in self.kinds[start:end])
+
+    def save(self, shape_api) -> None:
+        shape_api.Tags.Add(self.TAG_NAME, json.dumps(asdict(self)))
+
+    @classmethod
+    def load(cls, shape_api) -> Self | None:
+        value = shape_api.Tags(cls.TAG_NAME)
+        if not value:
+            return None
+        try:
+            return cls(**json.loads(value))
+        except (ValueError, TypeError):
+            return None
 
 
 if __name__ == "__main__":
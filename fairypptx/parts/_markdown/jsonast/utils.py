@@ -1,25 +1,265 @@
+"""Conversion of Markdown into JSON AST of `pandoc`.
+
+Since spawning `pandoc` dominates the conversion of small documents,
+
+* The results are cached by the hash of the content and the version of `pandoc`,
+  in memory (LRU) and on disk (under the registry folder, LRU by size).
+* `to_jsonast_many` converts the documents which are not cached by `pandoc` in parallel.
+* The versions of `pandoc` are cached on disk, keyed by the executable (path / size / mtime).
+* The common subset of Markdown is parsed in Python (`fast_parser`) without `pandoc`.
+
+Note that each document is converted by its own `pandoc` invocation.
+Joining the documents into one invocation changes the result
+(e.g. `auto_identifiers` and reference links are shared among the documents).
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Sequence
+import hashlib
+import json
+import os
+import shutil
 import subprocess
-import json 
+import uuid
+
+from fairypptx.registry_utils.utils import get_registry_folder
+from fairypptx.parts._markdown.jsonast import fast_parser
+
+
+def to_jsonast(path: Path | str, *, fast: bool = True):
+    """Convert Markdown (text or path) to JSON AST.
 
+    Args:
+        fast: If True, `fast_parser` is tried before `pandoc`.
+    """
+    return _from_str_or_path(path, fast=fast)
+
+
+def to_jsonast_many(contents: Sequence[Path | str], *, fast: bool = True, max_workers: int = 4) -> list[dict[str, Any]]:
+    """Convert multiple documents, the same as `to_jsonast` for each.
+
+    The documents which are not cached are converted by `pandoc` in parallel.
+    """
+    texts = [_to_text(content) for content in contents]
+    results: list[dict[str, Any] | None] = [(_parse_fast(text) if fast else None) or _default_cache.get(text)
+                                            for text in texts]
+    missing = list(dict.fromkeys(text for text, result in zip(texts, results) if result is None))
+    if missing:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as executor:
+            converted = dict(zip(missing, executor.map(_run_pandoc, missing)))
+        for text, data in converted.items():
+            _default_cache.put(text, data)
+        results = [result if result is not None else json.loads(json.dumps(converted[text]))
+                   for text, result in zip(texts, results)]
+    return results  # type: ignore[return-value]
 
-def to_jsonast(path: Path | str): 
-    return _from_str_or_path(path)
 
 def _is_existent_path(content):
     try:
-        return Path(content).exists()
-    except OSError:
+        return Path(content).is_file()
+    except (OSError, ValueError):
         return False
 
-def _from_str_or_path(content: str | Path) -> str:
+
+def _to_text(content: str | Path) -> str:
     if _is_existent_path(content):
-        content = Path(content).read_text("utf8")
-    else:
-        content = str(content)
+        return Path(content).read_text("utf8")
+    return str(content)
+
+
+def _parse_fast(content: str) -> dict[str, Any] | None:
+    return fast_parser.parse(content, api_version=_get_api_version_for_fast())
+
+
+def _get_api_version_for_fast() -> list[int]:
+    try:
+        return get_pandoc_api_version()
+    except RuntimeError:  # `pandoc` is not installed.
+        return list(fast_parser.DEFAULT_API_VERSION)
+
+
+def _from_str_or_path(content: str | Path, fast: bool = True) -> dict[str, Any]:
+    content = _to_text(content)
+    data = _parse_fast(content) if fast else None
+    if data is not None:
+        return data
+    data = _default_cache.get(content)
+    if data is None:
+        data = _run_pandoc(content)
+        _default_cache.put(content, data)
+    return data
+
+
+def _run_pandoc(content: str) -> dict[str, Any]:
     ret = subprocess.run("pandoc -t json",
                          text=True,
-                         stdout=subprocess.PIPE, 
+                         stdout=subprocess.PIPE,
                          input=content, encoding="utf8")
     assert ret.returncode == 0
     return json.loads(ret.stdout)
+
+
+class PandocVersions:
+    """Versions of `pandoc`, cached on disk per executable."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    @staticmethod
+    def _fingerprint() -> str:
+        executable = shutil.which("pandoc")
+        if executable is None:
+            raise RuntimeError("`pandoc` is not found.")
+        stat = Path(executable).stat()
+        return f"{executable}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            return json.loads(self.path.read_text("utf8"))
+        except (OSError, ValueError):
+            return {}
+
+    def get(self) -> dict[str, Any]:
+        """Return `{"version": str, "api_version": list[int]}`."""
+        fingerprint = self._fingerprint()
+        stock = self._load()
+        if fingerprint not in stock:
+            ret = subprocess.run(["pandoc", "--version"], stdout=subprocess.PIPE, text=True, encoding="utf8")
+            version = ret.stdout.splitlines()[0].strip() if ret.stdout else ""
+            api_version = _run_pandoc("")["pandoc-api-version"]
+            stock[fingerprint] = {"version": version, "api_version": api_version}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(stock), "utf8")
+        return stock[fingerprint]
+
+
+def _get_cache_folder() -> Path:
+    return get_registry_folder() / "__pandoc__"
+
+
+@lru_cache(maxsize=None)
+def get_pandoc_versions() -> dict[str, Any]:
+    return PandocVersions(_get_cache_folder() / "versions.json").get()
+
+
+def get_pandoc_api_version() -> list[int]:
+    return list(get_pandoc_versions()["api_version"])
+
+
+class TextCache:
+    """Cache of texts keyed by a hash, in memory (LRU) and on disk.
+
+    Args:
+        folder: Folder of the on-disk cache. If None, only the memory is used.
+        max_size: The number of entries kept in memory.
+        max_bytes: The total size of the files on disk.
+            The least recently used files are removed when it is exceeded.
+    """
+
+    suffix = ".txt"
+
+    def __init__(self, folder: Path | None, max_size: int = 512, max_bytes: int = 64 * 1024 * 1024):
+        self.folder = folder
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        # Estimated total size on disk, counted when the files are scanned first.
+        self._disk_bytes: int | None = None
+
+    def _to_path(self, key: str) -> Path:
+        assert self.folder is not None
+        return self.folder / key[:2] / f"{key}{self.suffix}"
+
+    def get_text(self, key: str) -> str | None:
+        stored = self._memory.get(key)
+        if stored is not None:
+            self._memory.move_to_end(key)
+            return stored
+        if self.folder is None:
+            return None
+        path = self._to_path(key)
+        try:
+            stored = path.read_text("utf8")
+            # `mtime` is used as the time of the last use.
+            os.utime(path)
+        except OSError:
+            return None
+        self._remember(key, stored)
+        return stored
+
+    def put_text(self, key: str, stored: str) -> None:
+        self._remember(key, stored)
+        if self.folder is not None:
+            path = self._to_path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+            data = stored.encode("utf8")
+            temp.write_bytes(data)
+            temp.replace(path)
+            if self._disk_bytes is not None:
+                self._disk_bytes += len(data)
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used files until the total size is within `max_bytes`.
+        The files are scanned only when the estimated total exceeds it.
+        """
+        assert self.folder is not None
+        if self._disk_bytes is not None and self._disk_bytes <= self.max_bytes:
+            return
+        entries = []
+        for path in self.folder.glob(f"*/*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._disk_bytes = total
+
+    def _remember(self, key: str, stored: str) -> None:
+        self._memory[key] = stored
+        self._memory.move_to_end(key)
+        while self.max_size < len(self._memory):
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        self._memory.clear()
+        self._disk_bytes = None
+        if self.folder is not None and self.folder.exists():
+            shutil.rmtree(self.folder)
+
+
+def to_hash(*parts: str) -> str:
+    """Hash of `parts`, used as the key of `TextCache`."""
+    return hashlib.sha256("\0".join(parts).encode("utf8")).hexdigest()
+
+
+class JsonAstCache(TextCache):
+    """Cache of JSON AST, keyed by the hash of the content and the version of `pandoc`."""
+
+    suffix = ".json"
+
+    def _to_key(self, content: str) -> str:
+        return to_hash(get_pandoc_versions()["version"], content)
+
+    def get(self, content: str) -> dict[str, Any] | None:
+        stored = self.get_text(self._to_key(content))
+        if stored is None:
+            return None
+        # A new object is returned, since the callers may modify it.
+        return json.loads(stored)
+
+    def put(self, content: str, data: dict[str, Any]) -> None:
+        self.put_text(self._to_key(content), json.dumps(data, ensure_ascii=False))
+
+
+_default_cache = JsonAstCache(_get_cache_folder() / "jsonast")
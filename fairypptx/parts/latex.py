@@ -12,10 +12,132 @@ from fairypptx import constants
 
 from fairypptx.object_utils import is_object, upstream
 from fairypptx import constants
+from fairypptx.registry_utils.utils import get_registry_folder
 from pywintypes import com_error
 
 from fairyimage import from_latex
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from importlib import metadata
+from io import BytesIO
+from pathlib import Path
+from PIL import Image
+from typing import Any, Iterator, Sequence
+import hashlib
+import json
+import os
+import uuid
+
+
+class LatexRenderCache:
+    """PNG images of rendered `Latex`, stored under the registry folder.
+
+    The key is the hash of the text, the keyword arguments of `from_latex`
+    and the versions of the renderers.
+    The least recently used files are removed when the total size exceeds `max_bytes`.
+    """
+
+    def __init__(self, folder: Path, max_bytes: int = 64 * 1024 * 1024):
+        self.folder = folder
+        self.max_bytes = max_bytes
+
+    def to_key(self, text: str, *args, **kwargs) -> str:
+        data = {"text": text, "args": args, "kwargs": kwargs, "versions": _get_renderer_versions()}
+        content = json.dumps(data, sort_keys=True, default=repr)
+        return hashlib.sha256(content.encode("utf8")).hexdigest()
+
+    def _to_path(self, key: str) -> Path:
+        return self.folder / f"{key}.png"
+
+    def get(self, key: str) -> bytes | None:
+        path = self._to_path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        # `mtime` is used as the time of the last use.
+        os.utime(path)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        self.folder.mkdir(parents=True, exist_ok=True)
+        path = self._to_path(key)
+        temp = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        temp.write_bytes(data)
+        temp.replace(path)
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.folder.glob("*.png"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def render(self, text: str, *args, **kwargs) -> bytes:
+        """Return PNG of `from_latex(text, *args, **kwargs)`, rendering only when not cached."""
+        key = self.to_key(text, *args, **kwargs)
+        data = self.get(key)
+        if data is None:
+            data = _render_png(text, args, kwargs)
+            self.put(key, data)
+        return data
+
+    def render_many(self, texts: Sequence[str], max_workers: int | None = None, **kwargs) -> Iterator[bytes]:
+        """Yield PNG of `texts` in order.
+
+        The ones not cached are rendered in a process pool,
+        so that the caller can consume the results while the others are rendered.
+        """
+        keys = [self.to_key(text, **kwargs) for text in texts]
+        cached = {key: data for key in dict.fromkeys(keys) if (data := self.get(key)) is not None}
+        missing = {key: text for key, text in zip(keys, texts) if key not in cached}
+        if not missing:
+            yield from (cached[key] for key in keys)
+            return
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {key: executor.submit(_render_png, text, (), kwargs) for key, text in missing.items()}
+            for key in keys:
+                if key not in cached:
+                    cached[key] = futures[key].result()
+                    self.put(key, cached[key])
+                yield cached[key]
+
+
+def _render_png(text: str, args: Sequence[Any], kwargs: dict[str, Any]) -> bytes:
+    # Module level, to be picklable for `ProcessPoolExecutor`.
+    buffer = BytesIO()
+    from_latex(text, *args, **kwargs).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=None)
+def _get_renderer_versions() -> dict[str, str]:
+    versions = {}
+    for name in ("fairyimage", "matplotlib"):
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = ""
+    return versions
+
+
+_default_render_cache = LatexRenderCache(get_registry_folder() / "__latex__")
+
+
+def render_latex(text: str, **kwargs) -> Image.Image:
+    """`from_latex` with the cache under the registry folder."""
+    return Image.open(BytesIO(_default_render_cache.render(text, **kwargs)))
+
 
 class Latex:
     """Latex Parts.
@@ -36,7 +158,20 @@ class Latex:
 
     @classmethod
     def make(cls, text, **kwargs):
-        image = from_latex(text, **kwargs)
+        return cls._make_from_image(text, _default_render_cache.render(text, **kwargs))
+
+    @classmethod
+    def make_many(cls, texts: Sequence[str], *, max_workers: int | None = None, **kwargs) -> list["Latex"]:
+        """Make `Latex` for each of `texts`.
+
+        The images are rendered in a process pool, and the shapes are made
+        on this thread in order, as soon as each image is ready.
+        """
+        return [cls._make_from_image(text, data)
+                for text, data in zip(texts, _default_render_cache.render_many(texts, max_workers=max_workers, **kwargs))]
+
+    @classmethod
+    def _make_from_image(cls, text, image):
         image_shape = Shape.make(image)
         script_shape = Shape.make(text)
         script_shape.textrange.font.color = cls.TEXT_COLOR
@@ -100,7 +235,7 @@ class Latex:
         assert len(image_shapes) == 1
         image_shape = image_shapes[0]
 
-        image = from_latex(text, *args, **kwargs)
+        image_data = _default_render_cache.render(text, *args, **kwargs)
 
         left = image_shape.left
         top = image_shape.top
@@ -113,7 +248,7 @@ class Latex:
         # and write the state of `self`
         shapes_api = upstream(self.shape.api, "Slide").Shapes
 
-        with yield_temporary_dump(image) as path:
+        with yield_temporary_dump(image_data, suffix=".png") as path:
             output_image_shape = shapes_api.AddPicture(
                 path, msoFalse, msoTrue, Left=left, Top=top, Width=width, Height=height
             )
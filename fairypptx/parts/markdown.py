@@ -88,21 +88,25 @@ class Markdown:
 
 
     def compile(self, text, *args, **kwargs):
-        # Currently, generate the next `Markdown` and 
+        # Only the changed blocks are rewritten in place, if possible.
+        # Otherwise, generate the next `Markdown` and 
         # Change the position and delete the old one. 
+        from fairypptx.parts._markdown.jsonast.markdown_factory import MarkdownFactory
+        if MarkdownFactory().update(self.shape, text):
+            # The text may grow over the tables.
+            MarkdownFactory._stack_below(self.shape, list(self.shape_range)[1:])
+            return self
 
         new_markdown = type(self).make(text, *args, **kwargs)
 
-        left = self.shapes[0].left
-        top = self.shapes[0].top
-
-        for n_shape in new_markdown.shapes:
-            n_shape.left = left
-            n_shape.top = top
+        new_shapes = list(new_markdown.shape_range)
+        new_shapes[0].left = self.shape_range[0].left
+        new_shapes[0].top = self.shape_range[0].top
+        MarkdownFactory._stack_below(new_shapes[0], new_shapes[1:])
 
-        for shape in self.shapes:
+        for shape in self.shape_range:
             shape.api.Delete()
-        self = new_markdown
+        self.shape_range = new_markdown.shape_range
         return  self
 
 
@@ -1,7 +1,13 @@
 from pathlib import Path
+from typing import IO, Iterable, TYPE_CHECKING
 from fairypptx.core.resolvers import resolve_presentation
 from fairypptx.core.types import COMObject, ObjectLike
 
+if TYPE_CHECKING:
+    from fairypptx.query import Predicate
+    from fairypptx.slide import Slide
+    from fairypptx.shape_range import ShapeRange
+
 class Presentation:
     def __init__(self, arg: None | str | Path | ObjectLike = None):
         self._api = resolve_presentation(arg) 
@@ -15,3 +21,76 @@ class Presentation:
         from fairypptx.slides import Slides
         return Slides(self.api.Slides)
 
+    def select(self,
+               query: "str | Predicate",
+               *,
+               slides: "slice | Iterable[int] | Iterable[Slide] | None" = None,
+               include_children: bool = False) -> "ShapeRange":
+        """Return the shapes which satisfy `query`.
+
+        Args:
+            query: Selector string (e.g. `TextBox[font.name='Meiryo']`) or `Predicate`.
+            slides: Target slides. `slice` / indices (0-based) / `Slide`s. If None, all the slides.
+                Note that the `slide_index` column of `query` is 1-based (`SlideIndex` of PowerPoint),
+                e.g. `slides=[0]` and `[slide_index=1]` are the same slide.
+            include_children: If True, the children of grouped shapes are also candidates.
+        """
+        from fairypptx.query import select_shapes
+        return select_shapes(query, self._to_slide_apis(slides), include_children=include_children)
+
+    def find_replace(self,
+                     target: str,
+                     replacement: str,
+                     *,
+                     regex: bool = False,
+                     slides: "slice | Iterable[int] | Iterable[Slide] | None" = None) -> int:
+        """Replace `target` with `replacement` in all the texts of the shapes.
+
+        The texts are read in one pass, the replacements are planned in Python,
+        and then applied from the back of each text.
+
+        Args:
+            target: The text to replace, or the regular expression if `regex` is True.
+            replacement: The new text. If `regex` is True, group references (e.g. `\\1`) are expanded.
+            slides: Target slides. See `select`.
+
+        Returns:
+            The number of replacements.
+        """
+        from fairypptx.apis.text_range.diff import apply_text_edits
+        from fairypptx.text_range.search import iter_text_range_apis, plan_replacements
+
+        plans = []
+        for slide_api in self._to_slide_apis(slides):
+            for text_range_api in iter_text_range_apis(list(slide_api.Shapes)):
+                text = str(text_range_api.Text)
+                edits = plan_replacements(text, target, replacement, regex)
+                if edits:
+                    plans.append((text_range_api, text, edits))
+
+        for text_range_api, text, edits in plans:
+            apply_text_edits(text_range_api, text, edits)
+        return sum(len(edits) for _, _, edits in plans)
+
+    def export_markdown(self,
+                        path: "str | Path | IO[str]",
+                        *,
+                        slides: "slice | Iterable[int] | Iterable[Slide] | None" = None) -> None:
+        """Write the texts of the slides as Markdown, slide by slide.
+
+        Each text frame is read once, and only one slide is kept in memory.
+
+        Args:
+            path: Output file or text stream.
+            slides: Target slides. See `select`.
+        """
+        from fairypptx.parts._markdown.exporter import export_markdown
+        export_markdown(self, path, slides=slides)
+
+    def _to_slide_apis(self, slides: "slice | Iterable[int] | Iterable[Slide] | None") -> list[COMObject]:
+        slides_api = self.api.Slides
+        if slides is None:
+            return list(slides_api)
+        if isinstance(slides, slice):
+            return [slides_api.Item(i + 1) for i in range(*slides.indices(slides_api.Count))]
+        return [slides_api.Item(elem + 1) if isinstance(elem, int) else elem.api for elem in slides]
@@ -0,0 +1,58 @@
+"""Query of shapes over slides.
+
+The properties required by the predicate are read in one pass
+(`ShapeSnapshot`), then the predicate is evaluated in memory.
+Only the matched shapes are wrapped as `Shape`.
+
+Example
+-------
+>>> pres = Presentation()
+>>> pres.select("TextBox[font.name='Meiryo'][slide_index>=10][slide_index<=80]")
+>>> pres.select(is_type("TextBox") & overlaps(title.box))
+"""
+
+from typing import Iterable, TYPE_CHECKING
+
+from fairypptx.core.types import COMObject
+from fairypptx.query.snapshot import ShapeSnapshot, COLUMN_SPECS
+from fairypptx.query.predicates import (
+    Predicate,
+    Always,
+    col,
+    is_type,
+    has_text,
+    overlaps,
+)
+from fairypptx.query.selector import parse_selector, SelectorSyntaxError
+
+if TYPE_CHECKING:
+    from fairypptx.shape_range import ShapeRange
+
+
+def to_predicate(query: str | Predicate) -> Predicate:
+    if isinstance(query, Predicate):
+        return query
+    if isinstance(query, str):
+        return parse_selector(query)
+    raise TypeError(f"Invalid query: {query!r}")
+
+
+def select_shapes(query: str | Predicate,
+                  slide_apis: Iterable[COMObject],
+                  *,
+                  include_children: bool = False) -> "ShapeRange":
+    """Return the shapes in `slide_apis` which satisfy `query`.
+
+    Args:
+        query: Selector string or `Predicate`.
+        slide_apis: COM objects of `Slide`.
+        include_children: If True, the children of grouped shapes are also candidates.
+    """
+    from fairypptx.shape import Shape
+    from fairypptx.shape_range import ShapeRange
+
+    predicate = to_predicate(query)
+    snapshot = ShapeSnapshot.from_slide_apis(slide_apis, predicate.fields,
+                                             include_children=include_children)
+    mask = predicate.evaluate(snapshot)
+    return ShapeRange([Shape(api) for api in snapshot.take(mask)])
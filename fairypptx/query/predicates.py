@@ -0,0 +1,291 @@
+"""Composable predicates over `ShapeSnapshot`.
+
+Example
+-------
+>>> from fairypptx.query import col, is_type
+>>> predicate = is_type("TextBox") & (col("font.name") == "Meiryo") & col("slide_index").between(10, 80)
+
+Each predicate declares the columns it requires (`fields`),
+so that `ShapeSnapshot` reads only them.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterable, Sequence
+
+import numpy as np
+
+from fairypptx import constants
+from fairypptx.box import Box
+from fairypptx.query.snapshot import COLUMN_SPECS, ShapeSnapshot, to_column_name
+
+
+SHAPE_TYPES: dict[str, int] = {
+    "autoshape": constants.msoAutoShape,
+    "callout": constants.msoCallout,
+    "chart": constants.msoChart,
+    "comment": constants.msoComment,
+    "freeform": constants.msoFreeform,
+    "group": constants.msoGroup,
+    "line": constants.msoLine,
+    "media": constants.msoMedia,
+    "picture": constants.msoPicture,
+    "linkedpicture": constants.msoLinkedPicture,
+    "placeholder": constants.msoPlaceholder,
+    "smartart": constants.msoSmartArt,
+    "table": constants.msoTable,
+    "textbox": constants.msoTextBox,
+    "textart": constants.msoTextEffect,
+    "embeddedoleobject": constants.msoEmbeddedOLEObject,
+    "linkedoleobject": constants.msoLinkedOLEObject,
+}
+
+
+def to_shape_type(name: str | int) -> int:
+    """Convert the name of `MsoShapeType` (e.g. `TextBox`) to its value."""
+    if isinstance(name, int):
+        return name
+    key = name.strip().lower()
+    if key.startswith("mso"):
+        key = key[3:]
+    if key not in SHAPE_TYPES:
+        raise ValueError(f"Unknown shape type `{name}`. Available: {sorted(SHAPE_TYPES)}")
+    return SHAPE_TYPES[key]
+
+
+class Predicate(ABC):
+    """Condition of shapes, evaluated against `ShapeSnapshot`."""
+
+    @property
+    @abstractmethod
+    def fields(self) -> frozenset[str]:
+        """Column names required by `evaluate`."""
+
+    @abstractmethod
+    def evaluate(self, snapshot: ShapeSnapshot) -> np.ndarray:
+        """Return the boolean mask of matched rows."""
+
+    def __and__(self, other: "Predicate") -> "Predicate":
+        return And(self, other)
+
+    def __or__(self, other: "Predicate") -> "Predicate":
+        return Or(self, other)
+
+    def __invert__(self) -> "Predicate":
+        return Not(self)
+
+
+class _Compound(Predicate):
+    def __init__(self, *predicates: Predicate):
+        self.predicates = predicates
+
+    @property
+    def fields(self) -> frozenset[str]:
+        return frozenset().union(*(p.fields for p in self.predicates))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}{self.predicates!r}"
+
+
+class And(_Compound):
+    def evaluate(self, snapshot: ShapeSnapshot) -> np.ndarray:
+        mask = np.ones(len(snapshot), dtype=bool)
+        for predicate in self.predicates:
+            mask &= predicate.evaluate(snapshot)
+        return mask
+
+
+class Or(_Compound):
+    def evaluate(self, snapshot: ShapeSnapshot) -> np.ndarray:
+        mask = np.zeros(len(snapshot), dtype=bool)
+        for predicate in self.predicates:
+            mask |= predicate.evaluate(snapshot)
+        return mask
+
+
+class Not(_Compound):
+    def __init__(self, predicate: Predicate):
+        super().__init__(predicate)
+
+    def evaluate(self, snapshot: ShapeSnapshot) -> np.ndarray:
+        return ~self.predicates[0].evaluate(snapshot)
+
+
+class Always(Predicate):
+    """Predicate which matches every shape."""
+
+    @property
+    def fields(self) -> frozenset[str]:
+        return frozenset()
+
+    def evaluate(self, snapshot: ShapeSnapshot) -> np.ndarray:
+        return np.ones(len(snapshot), dtype=bool)
+
+    def __repr__(self) -> str:
+        return "Always()"
+
+
+class ColumnPredicate(Predicate):
+    """Predicate on a single column.
+
+    Args:
+        name: The name of column.
+        func: Function which receives the column array and returns the mask.
+        label: Used for `repr`.
+    """
+
+    def __init__(self, name: str, func: Callable[[np.ndarray], np.ndarray], label: str = ""):
+        self.name = to_column_name(name)
+        self.func = func
+        self.label = label
+
+    @property
+    def fields(self) -> frozenset[str]:
+        return frozenset({self.name})
+
+    def evaluate(self, snapshot: ShapeSnapshot) -> np.ndarray:
+        return np.asarray(self.func(snapshot[self.name]), dtype=bool)
+
+    def __repr__(self) -> str:
+        return f"ColumnPredicate({self.name!r}, {self.label})"
+
+
+def _elementwise(func: Callable[[Any], bool]) -> Callable[[np.ndarray], np.ndarray]:
+    """`None` (unavailable value) never matches."""
+    def _inner(values: np.ndarray) -> np.ndarray:
+        return np.fromiter((value is not None and bool(func(value)) for value in values),
+                           dtype=bool, count=len(values))
+    return _inner
+
+
+class Column:
+    """Builder of `ColumnPredicate`. Use `col(name)`."""
+
+    def __init__(self, name: str):
+        self.name = to_column_name(name)
+
+    def _check_number(self, *values: Any) -> None:
+        """Numeric columns are compared only with numbers."""
+        if COLUMN_SPECS[self.name].kind != "number":
+            return
+        for value in values:
+            if not isinstance(value, (int, float)):
+                raise TypeError(f"Column `{self.name}` is numeric, but {value!r} is given.")
+
+    def _compare(self, op: Callable[[Any, Any], Any], value: Any, label: str) -> ColumnPredicate:
+        self._check_number(value)
+
+        def _func(values: np.ndarray) -> np.ndarray:
+            if values.dtype.kind == "f":
+                with np.errstate(invalid="ignore"):
+                    return op(values, float(value))
+            return _elementwise(lambda elem: op(elem, value))(values)
+        return ColumnPredicate(self.name, _func, f"{label} {value!r}")
+
+    def __eq__(self, value: Any) -> ColumnPredicate:  # type: ignore[override]
+        return self._compare(lambda a, b: a == b, value, "==")
+
+    def __ne__(self, value: Any) -> ColumnPredicate:  # type: ignore[override]
+        # `nan` and `None` are regarded as unmatched.
+        self._check_number(value)
+
+        def _func(values: np.ndarray) -> np.ndarray:
+            if values.dtype.kind == "f":
+                return ~np.isnan(values) & (values != float(value))
+            return _elementwise(lambda elem: elem != value)(values)
+        return ColumnPredicate(self.name, _func, f"!= {value!r}")
+
+    def __lt__(self, value: Any) -> ColumnPredicate:
+        return self._compare(lambda a, b: a < b, value, "<")
+
+    def __le__(self, value: Any) -> ColumnPredicate:
+        return self._compare(lambda a, b: a <= b, value, "<=")
+
+    def __gt__(self, value: Any) -> ColumnPredicate:
+        return self._compare(lambda a, b: a > b, value, ">")
+
+    def __ge__(self, value: Any) -> ColumnPredicate:
+        return self._compare(lambda a, b: a >= b, value, ">=")
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def between(self, low: float, high: float) -> ColumnPredicate:
+        """`low <= value <= high`."""
+        self._check_number(low, high)
+        return ColumnPredicate(self.name,
+                               lambda values: (values >= low) & (values <= high),
+                               f"between {low!r}, {high!r}")
+
+    def isin(self, candidates: Iterable[Any]) -> ColumnPredicate:
+        candidates = list(candidates)
+        self._check_number(*candidates)
+
+        def _func(values: np.ndarray) -> np.ndarray:
+            if values.dtype.kind == "f":
+                return np.isin(values, [float(elem) for elem in candidates])
+            return _elementwise(lambda elem: elem in candidates)(values)
+        return ColumnPredicate(self.name, _func, f"in {candidates!r}")
+
+    def is_null(self) -> ColumnPredicate:
+        def _func(values: np.ndarray) -> np.ndarray:
+            if values.dtype.kind == "f":
+                return np.isnan(values)
+            return np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+        return ColumnPredicate(self.name, _func, "is null")
+
+    def contains(self, text: str) -> ColumnPredicate:
+        return ColumnPredicate(self.name, _elementwise(lambda elem: text in str(elem)), f"contains {text!r}")
+
+    def startswith(self, text: str) -> ColumnPredicate:
+        return ColumnPredicate(self.name, _elementwise(lambda elem: str(elem).startswith(text)), f"startswith {text!r}")
+
+    def endswith(self, text: str) -> ColumnPredicate:
+        return ColumnPredicate(self.name, _elementwise(lambda elem: str(elem).endswith(text)), f"endswith {text!r}")
+
+    def matches(self, pattern: str | re.Pattern) -> ColumnPredicate:
+        regex = re.compile(pattern)
+        return ColumnPredicate(self.name, _elementwise(lambda elem: regex.search(str(elem))), f"matches {regex.pattern!r}")
+
+
+def col(name: str) -> Column:
+    return Column(name)
+
+
+def is_type(*types: str | int) -> Predicate:
+    """Predicate of `MsoShapeType` (e.g. `is_type("TextBox", "AutoShape")`)."""
+    return col("type").isin(to_shape_type(elem) for elem in types)
+
+
+def has_text() -> Predicate:
+    return col("has_text") == True  # noqa: E712
+
+
+class Overlaps(Predicate):
+    """Shapes whose boxes intersect with `box` (touching edges are not counted)."""
+
+    def __init__(self, box: Box | Sequence[float]):
+        if not isinstance(box, Box):
+            box = Box(*box)
+        self.box = box
+
+    @property
+    def fields(self) -> frozenset[str]:
+        return frozenset({"left", "top", "width", "height"})
+
+    def evaluate(self, snapshot: ShapeSnapshot) -> np.ndarray:
+        left, top = snapshot["left"], snapshot["top"]
+        right, bottom = left + snapshot["width"], top + snapshot["height"]
+        box = self.box
+        with np.errstate(invalid="ignore"):
+            return ((left < box.left + box.width) & (box.left < right)
+                    & (top < box.top + box.height) & (box.top < bottom))
+
+    def __repr__(self) -> str:
+        return f"Overlaps({self.box!r})"
+
+
+def overlaps(box: Box | Sequence[float]) -> Predicate:
+    """Predicate of intersection with `box`, `(left, top, width, height)` or `Box`.
+    For example, `overlaps(title_shape.box)`.
+    """
+    return Overlaps(box)
@@ -0,0 +1,127 @@
+"""CSS-like selector strings for shapes.
+
+Grammar
+-------
+* `query := selector ("," selector)*`  (`,` means OR.)
+* `selector := (TypeName | "*")? ("[" column op value "]")*`
+* `op := "=" | "!=" | "<" | "<=" | ">" | ">=" | "~=" (regex) | "^=" (prefix) | "$=" (suffix) | "*=" (contains)`
+* `value` is a quoted string, a number, `true` or `false`.
+  The numeric columns are compared only with numbers.
+* `slide_index` is 1-based (`SlideIndex` of PowerPoint).
+
+Example
+-------
+* `TextBox[font.name='Meiryo']`
+* `*[slide_index>=10][slide_index<=80][text~='^Agenda']`
+* `Picture, Table`
+"""
+
+import re
+from typing import Any
+
+from fairypptx.query.predicates import Always, Predicate, col, is_type
+
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<type>\*|[A-Za-z_][A-Za-z0-9_]*)
+      | \[\s*(?P<column>[A-Za-z_][A-Za-z0-9_.]*)\s*
+            (?P<op>!=|<=|>=|~=|\^=|\$=|\*=|=|<|>)\s*
+            (?P<value>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|[^\]\s'"=]+)\s*\]
+      | (?P<comma>,)
+    )""", re.VERBOSE)
+
+
+class SelectorSyntaxError(ValueError):
+    """Exception for invalid selector strings."""
+
+
+def _to_value(literal: str) -> Any:
+    if literal[0] in {"'", '"'}:
+        return re.sub(r"\\(.)", r"\1", literal[1:-1])
+    lowered = literal.lower()
+    if lowered in {"true", "false"}:
+        return lowered == "true"
+    try:
+        return int(literal)
+    except ValueError:
+        pass
+    try:
+        return float(literal)
+    except ValueError:
+        pass
+    return literal
+
+
+def _to_predicate(column: str, op: str, value: Any) -> Predicate:
+    target = col(column)
+    match op:
+        case "=":
+            return target == value
+        case "!=":
+            return target != value
+        case "<":
+            return target < value
+        case "<=":
+            return target <= value
+        case ">":
+            return target > value
+        case ">=":
+            return target >= value
+        case "~=":
+            return target.matches(str(value))
+        case "^=":
+            return target.startswith(str(value))
+        case "$=":
+            return target.endswith(str(value))
+        case "*=":
+            return target.contains(str(value))
+    raise SelectorSyntaxError(f"Unknown operator `{op}`.")
+
+
+def _combine(predicates: list[Predicate]) -> Predicate:
+    if not predicates:
+        return Always()
+    result = predicates[0]
+    for predicate in predicates[1:]:
+        result = result & predicate
+    return result
+
+
+def parse_selector(query: str) -> Predicate:
+    """Convert `query` to `Predicate`."""
+    alternatives: list[Predicate] = []
+    current: list[Predicate] = []
+    is_empty = True
+    pos = 0
+    query = query.strip()
+    while pos < len(query):
+        match = _TOKEN.match(query, pos)
+        if not match or match.end() == pos:
+            raise SelectorSyntaxError(f"Invalid selector at {pos}: `{query}`")
+        pos = match.end()
+        if match["comma"]:
+            if is_empty:
+                raise SelectorSyntaxError(f"Empty selector in `{query}`")
+            alternatives.append(_combine(current))
+            current, is_empty = [], True
+        elif match["type"]:
+            if not is_empty:
+                raise SelectorSyntaxError(f"Type must come first in `{query}`")
+            if match["type"] != "*":
+                current.append(is_type(match["type"]))
+            is_empty = False
+        else:
+            try:
+                current.append(_to_predicate(match["column"], match["op"], _to_value(match["value"])))
+            except TypeError as e:
+                raise SelectorSyntaxError(f"{e} in `{query}`") from e
+            is_empty = False
+    if is_empty:
+        raise SelectorSyntaxError(f"Empty selector in `{query}`")
+    alternatives.append(_combine(current))
+
+    result = alternatives[0]
+    for predicate in alternatives[1:]:
+        result = result | predicate
+    return result
@@ -0,0 +1,210 @@
+"""Columnar snapshot of shape properties.
+
+`ShapeSnapshot` reads the requested properties of every shape in one pass
+over the slides and keeps them as columns (`numpy` arrays).
+Predicates are evaluated against these columns in memory,
+so the COM objects are touched only once per (shape, property).
+
+Rule
+----
+* Only the columns which are required by the predicate are read.
+* The `Shape` wrappers are not created here; only the COM objects are kept.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Literal, Mapping, Sequence
+
+import numpy as np
+from pywintypes import com_error
+
+from fairypptx import constants
+from fairypptx.core.types import COMObject
+
+
+_UNSET = object()
+
+
+class _RowReader:
+    """Reads the properties of one shape.
+    `TextRange` is shared among the text-related columns.
+    """
+
+    def __init__(self, api: COMObject, slide_index: int) -> None:
+        self.api = api
+        self.slide_index = slide_index
+        self._text_range: Any = _UNSET
+
+    @property
+    def text_range(self) -> COMObject | None:
+        if self._text_range is _UNSET:
+            try:
+                if self.api.HasTextFrame == constants.msoTrue:
+                    self._text_range = self.api.TextFrame.TextRange
+                else:
+                    self._text_range = None
+            except com_error:
+                self._text_range = None
+        return self._text_range
+
+
+def _safe(func: Callable[[_RowReader], Any]) -> Callable[[_RowReader], Any]:
+    def _inner(row: _RowReader) -> Any:
+        try:
+            return func(row)
+        except (com_error, AttributeError):
+            return None
+    return _inner
+
+
+def _text_attr(attr: str) -> Callable[[_RowReader], Any]:
+    def _inner(row: _RowReader) -> Any:
+        text_range = row.text_range
+        if text_range is None:
+            return None
+        target = text_range
+        for elem in attr.split("."):
+            target = getattr(target, elem)
+        return target
+    return _safe(_inner)
+
+
+def _text_tristate(attr: str) -> Callable[[_RowReader], Any]:
+    """MSO tri-state is converted to `bool`; `mixed` becomes `None`."""
+    reader = _text_attr(attr)
+
+    def _inner(row: _RowReader) -> bool | None:
+        value = reader(row)
+        if value in {constants.msoTrue, constants.msoCTrue}:
+            return True
+        if value == constants.msoFalse:
+            return False
+        return None
+    return _inner
+
+
+def _placeholder_type(row: _RowReader) -> int | None:
+    if row.api.Type != constants.msoPlaceholder:
+        return None
+    return row.api.PlaceholderFormat.Type
+
+
+type ColumnKind = Literal["number", "object"]
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    kind: ColumnKind
+    reader: Callable[[_RowReader], Any]
+
+
+COLUMN_SPECS: dict[str, ColumnSpec] = {
+    # 1-based, as `SlideIndex` of PowerPoint.
+    "slide_index": ColumnSpec("number", lambda row: row.slide_index),
+    "id": ColumnSpec("number", _safe(lambda row: row.api.Id)),
+    "name": ColumnSpec("object", _safe(lambda row: row.api.Name)),
+    "type": ColumnSpec("number", _safe(lambda row: row.api.Type)),
+    "auto_shape_type": ColumnSpec("number", _safe(lambda row: row.api.AutoShapeType)),
+    "placeholder_type": ColumnSpec("number", _safe(_placeholder_type)),
+    "left": ColumnSpec("number", _safe(lambda row: row.api.Left)),
+    "top": ColumnSpec("number", _safe(lambda row: row.api.Top)),
+    "width": ColumnSpec("number", _safe(lambda row: row.api.Width)),
+    "height": ColumnSpec("number", _safe(lambda row: row.api.Height)),
+    "rotation": ColumnSpec("number", _safe(lambda row: row.api.Rotation)),
+    "has_text": ColumnSpec("object", lambda row: row.text_range is not None),
+    "text": ColumnSpec("object", _text_attr("Text")),
+    "font.name": ColumnSpec("object", _text_attr("Font.Name")),
+    "font.size": ColumnSpec("number", _text_attr("Font.Size")),
+    "font.color": ColumnSpec("number", _text_attr("Font.Color.RGB")),
+    "font.bold": ColumnSpec("object", _text_tristate("Font.Bold")),
+    "font.italic": ColumnSpec("object", _text_tristate("Font.Italic")),
+    "font.underline": ColumnSpec("object", _text_tristate("Font.Underline")),
+}
+
+
+def to_column_name(name: str) -> str:
+    """Normalize the name of column, and check its existence."""
+    key = name.strip().lower()
+    if key not in COLUMN_SPECS:
+        msg = f"Unknown column `{name}`. Available: {sorted(COLUMN_SPECS)}"
+        raise KeyError(msg)
+    return key
+
+
+class ShapeSnapshot:
+    """Columns of shape properties and the COM objects of the rows.
+
+    Args:
+        apis: COM objects of `Shape`. The order is kept as is.
+        columns: Mapping of the column name and the values.
+    """
+
+    def __init__(self, apis: Sequence[COMObject], columns: Mapping[str, np.ndarray]) -> None:
+        self._apis = list(apis)
+        self._columns = dict(columns)
+        for name, values in self._columns.items():
+            if len(values) != len(self._apis):
+                raise ValueError(f"Length of `{name}` is inconsistent.")
+
+    def __len__(self) -> int:
+        return len(self._apis)
+
+    @property
+    def apis(self) -> Sequence[COMObject]:
+        return self._apis
+
+    @property
+    def column_names(self) -> Sequence[str]:
+        return list(self._columns)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        name = to_column_name(name)
+        if name not in self._columns:
+            raise KeyError(f"`{name}` is not read in this snapshot.")
+        return self._columns[name]
+
+    def take(self, mask: np.ndarray) -> Sequence[COMObject]:
+        """Return COM objects where `mask` is True."""
+        return [api for api, flag in zip(self._apis, mask) if flag]
+
+    @classmethod
+    def from_slide_apis(cls,
+                        slide_apis: Iterable[COMObject],
+                        columns: Iterable[str],
+                        *,
+                        include_children: bool = False) -> "ShapeSnapshot":
+        """Read `columns` of the shapes in `slide_apis` in one pass.
+
+        Args:
+            slide_apis: COM objects of `Slide`.
+            columns: The names of required columns.
+            include_children: If True, the children of grouped shapes are also rows.
+        """
+        names = sorted({to_column_name(name) for name in columns})
+        specs = [COLUMN_SPECS[name] for name in names]
+        apis: list[COMObject] = []
+        values: list[list[Any]] = [[] for _ in names]
+
+        def _add(shape_api: COMObject, slide_index: int) -> None:
+            row = _RowReader(shape_api, slide_index)
+            apis.append(shape_api)
+            for spec, stock in zip(specs, values):
+                stock.append(spec.reader(row))
+            if include_children and shape_api.Type == constants.msoGroup:
+                for child_api in shape_api.GroupItems:
+                    _add(child_api, slide_index)
+
+        for slide_api in slide_apis:
+            slide_index = slide_api.SlideIndex
+            for shape_api in slide_api.Shapes:
+                _add(shape_api, slide_index)
+
+        arrays = {name: _to_array(stock, spec.kind) for name, spec, stock in zip(names, specs, values)}
+        return cls(apis, arrays)
+
+
+def _to_array(values: Sequence[Any], kind: ColumnKind) -> np.ndarray:
+    if kind == "number":
+        return np.array([np.nan if value is None else float(value) for value in values], dtype=float)
+    array = np.empty(len(values), dtype=object)
+    array[:] = list(values)
+    return array
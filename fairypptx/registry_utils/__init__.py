@@ -1,5 +1,6 @@
 from fairypptx.registry_utils.temporary_path import yield_temporary_path #NOQA
 from fairypptx.registry_utils.temporary_path import yield_temporary_dump #NOQA
+from fairypptx.registry_utils.temporary_path import to_image_suffix #NOQA
 from fairypptx.registry_utils.structure_registry import JsonRegistry, BaseModelRegistry #NOQA.
 
 
@@ -1,20 +1,55 @@
 from __future__ import annotations
 from pathlib import Path
+from collections import Counter, OrderedDict
 from contextlib import contextmanager
 from typing import Iterator
+import hashlib
+import io
+import os
+import stat
+import time
 import uuid
 from PIL import Image
 
 from fairypptx.registry_utils.utils import get_registry_folder
 
 
+_RAM_FOLDER = Path("/dev/shm")
+
+
 def _get_temporary_folder() -> Path:
-    registry_folder = get_registry_folder()
-    temp = registry_folder / "__$temporary$__"
-    temp.mkdir(exist_ok=True, parents=True)
+    """Folder of temporary files.
+    A RAM-backed folder is preferred if available.
+    """
+    temp = _get_private_ram_folder()
+    if temp is None:
+        temp = get_registry_folder() / "__$temporary$__"
+        temp.mkdir(exist_ok=True, parents=True)
     return temp
 
 
+def _get_private_ram_folder() -> Path | None:
+    """Folder in the RAM-backed folder, owned by and accessible only to the current user.
+
+    The RAM-backed folder is shared among the users,
+    so the folder which is not such one (e.g. made by another user) is not used.
+    """
+    if not hasattr(os, "getuid") or not (_RAM_FOLDER.is_dir() and os.access(_RAM_FOLDER, os.W_OK)):
+        return None
+    uid = os.getuid()
+    folder = _RAM_FOLDER / f"fairypptx-{uid}"
+    try:
+        folder.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+    except OSError:
+        return None
+    info = folder.lstat()
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != uid or info.st_mode & 0o077:
+        return None
+    return folder
+
+
 @contextmanager
 def yield_temporary_path(suffix: str = "") -> Iterator[Path]:
     """
@@ -32,29 +67,124 @@ def yield_temporary_path(suffix: str = "") -> Iterator[Path]:
             p.unlink()
 
 
-@contextmanager
-def yield_temporary_dump(obj: Image.Image | bytes | str, suffix: str | None = None) -> Iterator[Path]:
-    """Save given memory object (PIL Image, bytes, str) into a temporary file.
+class ContentStore:
+    """Temporary files named by the hash of the content.
+
+    The same content is written only once and the file is reused,
+    and the least recently used files are removed when the total size exceeds `max_bytes`.
+    Files in use (within `dump`) are not removed.
+
+    Only the files written by this store are reused.
+    The files left by the previous processes are overwritten when the same content is dumped,
+    and removed when they are older than `STALE_SECONDS`.
     """
-    folder = _get_temporary_folder()
 
-    # Auto suffix if not provided
-    if suffix is None:
-        suffix = ".png" if isinstance(obj, Image.Image) else ""
+    STALE_SECONDS = 60 * 60
+
+    def __init__(self, folder: Path, max_bytes: int = 64 * 1024 * 1024):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self._sizes: OrderedDict[Path, int] = OrderedDict()
+        self._in_use: Counter[Path] = Counter()
+        self._remove_stale_files()
+
+    def _remove_stale_files(self) -> None:
+        # The recent ones may be in use by the other processes.
+        threshold = time.time() - self.STALE_SECONDS
+        for path in self.folder.glob("*.*"):
+            try:
+                if path.stat().st_mtime < threshold:
+                    path.unlink()
+            except OSError:
+                continue
 
-    p = folder / f"{uuid.uuid1()}{suffix}"
+    @contextmanager
+    def dump(self, obj: Image.Image | bytes | str, suffix: str | None = None) -> Iterator[Path]:
+        if suffix is None:
+            suffix = ".png" if isinstance(obj, Image.Image) else ""
+        key = _to_content_key(obj)
+        path = self.folder / f"{key}{suffix}"
+        self._in_use[path] += 1
+        try:
+            if path in self._sizes and path.exists():
+                self._sizes.move_to_end(path)
+            else:
+                data = _to_bytes(obj, suffix)
+                temp = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+                temp.write_bytes(data)
+                temp.replace(path)
+                self._sizes[path] = len(data)
+            yield path
+        finally:
+            self._in_use[path] -= 1
+            if not self._in_use[path]:
+                del self._in_use[path]
+            self._evict()
 
+    def _evict(self) -> None:
+        total = sum(self._sizes.values())
+        for path in list(self._sizes):
+            if total <= self.max_bytes:
+                break
+            if path in self._in_use:
+                continue
+            total -= self._sizes.pop(path)
+            path.unlink(missing_ok=True)
+
+
+# `info` of images which are saved and change the appearance.
+_IMAGE_INFO_KEYS = ("transparency", "icc_profile", "gamma")
+
+
+def _to_content_key(obj: Image.Image | bytes | str) -> str:
+    # For images, the pixels are hashed, which is cheaper than encoding.
+    # The palette and `info` are hashed as well, since the pixels of "P" images are its indices.
     if isinstance(obj, Image.Image):
-        obj.save(p)
+        header = f"image|{obj.mode}|{obj.size}|".encode("utf8")
+        palette = bytes(obj.getpalette() or []) if obj.mode in ("P", "PA") else b""
+        info = repr([(key, obj.info[key]) for key in _IMAGE_INFO_KEYS if key in obj.info]).encode("utf8")
+        return hashlib.sha256(b"|".join([header, palette, info, obj.tobytes()])).hexdigest()
     elif isinstance(obj, bytes):
-        p.write_bytes(obj)
+        return hashlib.sha256(b"bytes|" + obj).hexdigest()
     elif isinstance(obj, str):
-        p.write_text(obj, encoding="utf8")
-    else:
-        raise TypeError(f"Unsupported type: {type(obj)}")
+        return hashlib.sha256(b"str|" + obj.encode("utf8")).hexdigest()
+    raise TypeError(f"Unsupported type: {type(obj)}")
 
-    try:
-        yield p
-    finally:
-        if p.exists():
-            p.unlink()
+
+def _to_bytes(obj: Image.Image | bytes | str, suffix: str) -> bytes:
+    if isinstance(obj, Image.Image):
+        buffer = io.BytesIO()
+        obj.save(buffer, format=Image.registered_extensions().get(suffix.lower(), "PNG"))
+        return buffer.getvalue()
+    elif isinstance(obj, bytes):
+        return obj
+    return obj.encode("utf8")
+
+
+_default_store: ContentStore | None = None
+
+
+def _get_default_store() -> ContentStore:
+    global _default_store
+    if _default_store is None:
+        _default_store = ContentStore(_get_temporary_folder())
+    return _default_store
+
+
+@contextmanager
+def yield_temporary_dump(obj: Image.Image | bytes | str, suffix: str | None = None) -> Iterator[Path]:
+    """Save given memory object (PIL Image, bytes, str) into a temporary file.
+
+    The file is named by the hash of the content, and the same content reuses the file.
+    """
+    with _get_default_store().dump(obj, suffix=suffix) as path:
+        yield path
+
+
+def to_image_suffix(data: bytes) -> str:
+    """Suffix of PNG / JPEG `data`, judged from the signature."""
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return ".png"
+    elif data.startswith(b"\xff\xd8"):
+        return ".jpg"
+    raise ValueError("Only PNG or JPEG bytes are supported.")
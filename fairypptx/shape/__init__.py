@@ -100,7 +100,7 @@ class Shape(LocationMixin):
         return self.api.Select(replace_)
 
     def resize(self, *, fontsize: int | None = None):
-        from fairypptx._text.editor import FontResizer 
+        from fairypptx.text_range.formatters import FontResizer
         if fontsize is not None:
             FontResizer(fontsize=fontsize, mode="min")(self.textrange)
             self.tighten()
@@ -175,15 +175,25 @@ class Shape(LocationMixin):
         """
         return BaseModelRegistry.get_keys("Shape")
 
-    def tighten(self, *, oneline: bool =False) -> None:
+    def tighten(self, *, oneline: bool =False,
+                engine: Literal["powerpoint", "offline"] = "powerpoint") -> None:
         """Tighten the Shape according to Text.
 
         Args:
             oneline: Modify so that text becomes 1 line.
+            engine: `offline` predicts the size without the re-layout of PowerPoint.
         """
-        api_functions.tighten(self.api, oneline=oneline)
+        api_functions.tighten(self.api, oneline=oneline, engine=engine)
 
-    def is_tight(self) -> bool:
+    def is_tight(self, mode: Literal["exact", "estimate"] = "exact") -> bool:
+        """Return whether the shape is tightened or not.
+
+        Args:
+            mode: `exact` tightens the shape tentatively and restores it.
+                `estimate` only reads the bounds of the text (no modification).
+        """
+        if mode == "estimate":
+            return api_functions.estimate_is_tight(self.api)
         return api_functions.is_tight(self.api)
 
 
@@ -238,13 +248,13 @@ class ShapeFactory:
         """Create a Shape from an image, text string, or shape type constant.
 
         Args:
-            arg: PIL.Image, str/UserString (text), or int (shape type constant).
+            arg: PIL.Image, PNG / JPEG bytes, str/UserString (text), or int (shape type constant).
             **kwargs: Additional arguments for shape positioning/sizing.
 
         Returns:
             A Shape wrapper (or GroupShape if appropriate).
         """
-        if isinstance(arg, Image.Image):
+        if isinstance(arg, (Image.Image, bytes)):
             shape_api = ShapeApiFactory.add_picture(arg, **kwargs)
         elif isinstance(arg, (str, UserString)):
             shape_api = ShapeApiFactory.add_textbox(str(arg), **kwargs)
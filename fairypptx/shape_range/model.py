@@ -1,4 +1,5 @@
-from typing import Self, Sequence, Iterator, TYPE_CHECKING, overload
+from typing import Literal, Self, Sequence, Iterator, TYPE_CHECKING, overload
+from PIL import Image
 from collections.abc import Sequence as SeqABC
 
 from fairypptx.core.types import COMObject
@@ -147,6 +148,21 @@ class ShapeRange:
     def box(self) -> Box:
         return Box.cover([shape.box for shape in self])
 
+    def are_tight(self) -> list[bool]:
+        """Return whether each shape is tightened or not, estimated in one pass
+        without modification of the shapes (see `Shape.is_tight(mode="estimate")`).
+        """
+        from fairypptx.apis.shape import api_functions
+        return [api_functions.estimate_is_tight(shape.api) for shape in self._shapes]
+
+    def to_images(self, mode: Literal["RGBA", "RGB"] = "RGBA", *, exact: bool = False) -> list[Image.Image]:
+        """Images of the shapes.
+        The pictures on the same slide are cropped from one export of the slide
+        (see `api_functions.to_images`).
+        """
+        from fairypptx.apis.shape import api_functions
+        return api_functions.to_images([shape.api for shape in self._shapes], mode, exact=exact)
+
     def _solve_shapes(self, arg) -> list[Shape]:
         """Normalize input → list[Shape]"""
 
@@ -1,4 +1,4 @@
-from typing import Iterator, Self, TYPE_CHECKING, overload
+from typing import Iterator, Literal, Self, TYPE_CHECKING, overload
 
 from fairypptx.constants import msoFalse, msoShapeNotPrimitive
 
@@ -75,9 +75,9 @@ class Shapes:
             shape.api.Select(msoFalse)
         return self
 
-    def tighten(self) -> None:
+    def tighten(self, *, engine: Literal["powerpoint", "offline"] = "powerpoint") -> None:
         for shape in self:
-            shape.tighten()
+            shape.tighten(engine=engine)
 
 
 
@@ -0,0 +1,117 @@
+"""Resumable extraction of `PresentationStateModel`.
+
+`PresentationStateModel.from_entity` keeps all the slides in memory until the end,
+so an error in the middle (e.g. `com_error`) loses everything.
+Here,
+
+* The slides are read on the calling (COM) thread one by one,
+  sharing the layout / master shapes among the slides (`layout_cache`).
+* The serialization of each completed slide (JSON with base64 images, gzip)
+  and the writing are done in a thread pool, while the next slide is read.
+* The slides already saved in the folder are skipped, so that
+  the extraction interrupted by an error resumes from them.
+
+The folder holds a manifest of the presentation (name, slide size) and the options,
+and the folder made for another presentation is refused,
+since `SlideID`s are not unique among presentations.
+Note that the slides are identified by `SlideID`, so the slides edited
+after they are saved are not read again. Remove the folder to extract from scratch.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+import gzip
+import json
+import uuid
+
+from fairypptx.presentation import Presentation
+from fairypptx.states.slide import SlideStateModel, SlideLayoutShapesValue
+from fairypptx.states.presentation import PresentationStateModel
+
+
+class SlideStore:
+    """`SlideStateModel`s saved in `folder`, one file per slide."""
+
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(self, folder: Path):
+        self.folder = folder
+        self.folder.mkdir(parents=True, exist_ok=True)
+
+    def bind(self, manifest: dict[str, Any]) -> None:
+        """Write `manifest` to the empty folder, or check that it is the same as the stored one."""
+        path = self.folder / self.MANIFEST_NAME
+        if path.exists():
+            stored = json.loads(path.read_text("utf8"))
+            if stored != manifest:
+                raise ValueError(f"`{self.folder}` is used for another extraction: {stored}. "
+                                 "Remove it or use another folder.")
+            return
+        if any(self.folder.glob("slide_*.json.gz")):
+            raise ValueError(f"`{self.folder}` contains slides without the manifest.")
+        _write_atomically(path, json.dumps(manifest, ensure_ascii=False).encode("utf8"))
+
+    def _to_path(self, slide_id: int | str) -> Path:
+        return self.folder / f"slide_{slide_id}.json.gz"
+
+    def has(self, slide_id: int | str) -> bool:
+        return self._to_path(slide_id).exists()
+
+    def save(self, model: SlideStateModel) -> None:
+        data = gzip.compress(model.model_dump_json().encode("utf8"))
+        _write_atomically(self._to_path(model.id), data)
+
+    def load(self, slide_id: int | str) -> SlideStateModel:
+        data = gzip.decompress(self._to_path(slide_id).read_bytes())
+        return SlideStateModel.model_validate_json(data)
+
+
+def _write_atomically(path: Path, data: bytes) -> None:
+    # The file appears only when it is complete.
+    temp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    temp.write_bytes(data)
+    temp.replace(path)
+
+
+def _to_manifest(presentation: Presentation, batch_images: bool) -> dict[str, Any]:
+    api = presentation.api
+    page_setup = api.PageSetup
+    return {"full_name": api.FullName,
+            "name": api.Name,
+            "slide_size": [page_setup.SlideWidth, page_setup.SlideHeight],
+            "batch_images": batch_images}
+
+
+def extract_presentation(presentation: Presentation,
+                         folder: Path,
+                         *,
+                         max_workers: int = 2,
+                         batch_images: bool = False) -> PresentationStateModel:
+    """Extract `PresentationStateModel`, saving each slide in `folder` as soon as it is read.
+
+    Args:
+        max_workers: The number of threads for serialization and writing.
+        batch_images: See `SlideStateModel.from_entity`.
+
+    Raises:
+        ValueError: `folder` is used for another presentation or other options.
+    """
+    store = SlideStore(folder)
+    store.bind(_to_manifest(presentation, batch_images))
+    layout_cache: dict[tuple[str, str, int], SlideLayoutShapesValue] = {}
+    slide_ids: list[int] = []
+    futures: list[Future] = []
+    # Leaving the context waits for the pending saves, even when reading raises.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for slide in presentation.slides:
+            slide_id = slide.id
+            slide_ids.append(slide_id)
+            if store.has(slide_id):
+                continue
+            model = SlideStateModel.from_entity(slide, batch_images=batch_images, layout_cache=layout_cache)
+            futures.append(executor.submit(store.save, model))
+    for future in futures:
+        future.result()
+    slides = [store.load(slide_id) for slide_id in slide_ids]
+    return PresentationStateModel(slides=slides, id=presentation.api.Name)
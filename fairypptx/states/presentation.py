@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Self, Sequence, Annotated
 from pydantic import Field
 from fairypptx.states.models import  FrozenBaseStateModel
@@ -12,9 +13,24 @@ class PresentationStateModel(FrozenBaseStateModel):
     @classmethod
     def from_entity(cls, entity: Presentation) -> Self:
         pres = entity
-        slides = [SlideStateModel.from_entity(slide) for slide in pres.slides]
+        layout_cache = {}
+        slides = [SlideStateModel.from_entity(slide, layout_cache=layout_cache) for slide in pres.slides]
         return cls(slides=slides, id=pres.api.Name)
 
+    @classmethod
+    def extract(cls,
+                entity: Presentation,
+                folder: str | Path,
+                *,
+                max_workers: int = 2,
+                batch_images: bool = False) -> Self:
+        """Same as `from_entity`, but the completed slides are saved in `folder`,
+        and an interrupted extraction resumes from them.
+        See `fairypptx.states.extraction`.
+        """
+        from fairypptx.states.extraction import extract_presentation
+        return extract_presentation(entity, Path(folder), max_workers=max_workers, batch_images=batch_images)
+
     def create_entity(self, context: Context) -> Presentation:
         pres = Presentation(Application().api.Presentations.Add())
         context = Context(presentation=pres)
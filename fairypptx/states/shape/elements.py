@@ -2,7 +2,6 @@ import io
 import base64
 from enum import IntEnum
 from pydantic import BaseModel 
-from PIL import Image
 from fairypptx import Shape,  constants, registry_utils
 from fairypptx.shape import TableShape
 from fairypptx.box import Box
@@ -138,9 +137,9 @@ class PictureShapeStateModel(BaseShapeStateModel):
     def create_entity(self, context: Context) -> Shape:
         shapes_api = context.shapes.api
         img_data = self.image
-        image = Image.open(io.BytesIO(img_data))
 
-        with registry_utils.yield_temporary_dump(image, suffix=".png") as path:
+        # The stored PNG is written as it is.
+        with registry_utils.yield_temporary_dump(img_data, suffix=".png") as path:
             shape = Shape(shapes_api.AddPicture(str(path), msoFalse, msoTrue, Left=self.box.left, Width=self.box.width, Top=self.box.top, Height=self.box.height))
         return shape
 
@@ -39,12 +39,27 @@ class SlideLayoutShapesValue(BaseModel):
     ]
 
     @classmethod
-    def from_slide(cls, slide: Slide) -> Self:
-        layout_shapes = cls._to_layout_states(slide)
-        master_shapes = cls._to_master_states(slide)
+    def from_slide(cls, slide: Slide, cache: dict[tuple[str, str, int], Self] | None = None) -> Self:
+        """
+        Args:
+            cache: The values shared by the slides with the same layout,
+                keyed by (design name, layout name, layout index).
+        """
         layout_name = slide.api.CustomLayout.Name
         design_name = slide.api.Design.Name
         layout_index = slide.api.Layout
+        key = (design_name, layout_name, layout_index)
+        if cache is not None and key in cache:
+            return cache[key]
+        value = cls._from_slide(slide, layout_index, layout_name, design_name)
+        if cache is not None:
+            cache[key] = value
+        return value
+
+    @classmethod
+    def _from_slide(cls, slide: Slide, layout_index: int, layout_name: str, design_name: str) -> Self:
+        layout_shapes = cls._to_layout_states(slide)
+        master_shapes = cls._to_master_states(slide)
         return cls(
             layout_index=layout_index,
             layout_name=layout_name,
@@ -127,8 +142,24 @@ class SlideStateModel(FrozenBaseStateModel):
         return slide
 
     @classmethod
-    def from_entity(cls, entity: Slide) -> Self:
+    def from_entity(cls,
+                    entity: Slide,
+                    *,
+                    batch_images: bool = False,
+                    layout_cache: dict[tuple[str, str, int], SlideLayoutShapesValue] | None = None) -> Self:
+        """
+        Args:
+            batch_images: If True, the images of pictures are cropped from one export of the slide
+                (see `api_functions.to_images`) instead of exporting each picture.
+                Note that it is lossy: the transparency within the pictures is lost.
+            layout_cache: Shared among the slides, so that the shapes of
+                the same layout / master are read only once. See `SlideLayoutShapesValue.from_slide`.
+        """
         slide = entity
+        if batch_images:
+            from fairypptx.apis.shape import api_functions
+            with api_functions.prefetched_images([shape.api for shape in slide.shapes]):
+                return cls.from_entity(slide, layout_cache=layout_cache)
         shapes = [ShapeStateModel.from_entity(shape) for shape in slide.shapes]
         note_text_frame = slide.note_text_frame
         note_text_frame_model = (
@@ -141,7 +172,7 @@ class SlideStateModel(FrozenBaseStateModel):
             note_text_frame=note_text_frame_model,
             shapes=shapes,
             slide_size=slide.size,
-            layout=SlideLayoutShapesValue.from_slide(slide),
+            layout=SlideLayoutShapesValue.from_slide(slide, layout_cache),
         )
 
     def _common_setting(self, slide: Slide) -> None:
@@ -40,7 +40,7 @@ class AutoShapeStyle(BaseModel):
         line = NaiveLineFormatStyle.from_entity(shape.line)
         fill = NaiveFillFormatStyle.from_entity(shape.fill)
         text_frame = NaiveTextFrameStyle.from_entity(shape.text_frame)
-        is_tight = entity.is_tight()
+        is_tight = entity.is_tight(mode="estimate")
         return cls(line=line, fill=fill, text_frame=text_frame, auto_shape_type=entity.api.AutoShapeType, is_tight=is_tight)
 
     def apply(self, entity: Shape) -> Shape:
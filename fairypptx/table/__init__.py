@@ -10,7 +10,7 @@ Desire:
 
 """
 
-from typing import cast, Sequence, Any, overload, Self
+from typing import cast, Sequence, Any, Literal, overload, Self
 from collections import defaultdict
 import numpy as np
 from fairypptx.apis.table import TableApiApplicator
@@ -96,11 +96,11 @@ class Table:
     def empty(shape: tuple[int, int]) -> "Table":
         return TableFactory.empty(*shape)
 
-    def tighten(self):
+    def tighten(self, *, engine: Literal["powerpoint", "offline"] = "powerpoint"):
         for row in self.rows:
             row.tighten()
         for column in self.columns:
-            column.tighten()
+            column.tighten(engine=engine)
 
     def tolist(self):
         data = [[str(cell.text) for cell in row] for row in self.rows]
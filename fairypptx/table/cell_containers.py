@@ -1,9 +1,10 @@
 #from fairypptx.core.resolvers import 
 import numpy as np
-from typing import Sequence, Self, TYPE_CHECKING, Iterator, cast
+from typing import Sequence, Self, TYPE_CHECKING, Iterator, Literal, cast
 from fairypptx.core.types import COMObject, PPTXObjectProtocol
 from fairypptx.table.cell import Cell, CellRange
 from fairypptx.object_utils import ObjectItems
+from fairypptx.apis.text_frame import measure
 
 if TYPE_CHECKING:
     from fairypptx.shape import Shape
@@ -80,12 +81,14 @@ class Column(RowColumnMixin):
     def width(self):
         return self.api.Width
 
-    def tighten(self) -> None:
+    def tighten(self, *, engine: Literal["powerpoint", "offline"] = "powerpoint") -> None:
         shapes = self.shapes
         
         if not shapes:
              return
         def _get_required_width(shape):
+            if engine == "offline":
+                return measure.predict_tight_size(shape.api)[0]
             tf = shape.api.TextFrame
             return tf.MarginLeft + tf.MarginRight + tf.TextRange.BoundWidth
             
@@ -11,18 +11,50 @@ from fairypptx.paragraph_format import ParagraphFormatProperty
 from fairypptx.core.resolvers import resolve_text_range
 from fairypptx.core.types import COMObject, PPTXObjectProtocol
 from fairypptx.apis.text_range.applicator import TextRangeApplicator
-from fairypptx.apis.text_range import normalize_paragraph_breaks
+from fairypptx.apis.text_range import TextRangeApiModel, normalize_paragraph_breaks
+from fairypptx.text_range.offset_index import TextOffsetIndex
 
 
 if TYPE_CHECKING:
     from fairypptx.shape import Shape
 
+class _OffsetIndexHolder:
+    """`TextOffsetIndex` of the root, shared by a `TextRange` and the ones derived from it
+    (e.g. `paragraphs`), so that the loop over them reads `Text` once.
+
+    It is rebuilt when `Length` of the root (one integer read) changes,
+    and dropped when the text is edited via these `TextRange`s.
+    Note that the edits of the same length by other means (e.g. `api`) are not detected.
+    """
+
+    def __init__(self) -> None:
+        self.length: int | None = None
+        self.index: TextOffsetIndex | None = None
+
+    def get(self, root_api: COMObject) -> TextOffsetIndex:
+        length = root_api.Length
+        if self.index is None or length != self.length:
+            self.index = TextOffsetIndex.from_text(str(root_api.Text))
+            self.length = length
+        return self.index
+
+    def invalidate(self) -> None:
+        self.index = None
+
+
 class TextRange:
     font = FontProperty()
     paragraph_format =  ParagraphFormatProperty()
 
     def __init__(self, arg: PPTXObjectProtocol | COMObject | None = None) -> None:
         self._api = resolve_text_range(arg)
+        self._offset_holder = _OffsetIndexHolder()
+
+    def _derive(self, api: COMObject) -> "TextRange":
+        """`TextRange` of `api` in the same frame, sharing the offset index."""
+        text_range = TextRange(api)
+        text_range._offset_holder = self._offset_holder
+        return text_range
 
     @property
     def api(self) -> COMObject:
@@ -43,37 +75,37 @@ class TextRange:
 
     @property
     def characters(self) -> Sequence["TextRange"]:
-        return [TextRange(elem) for elem in self.api.Characters()]
+        return [self._derive(elem) for elem in self.api.Characters()]
 
     @property
     def words(self) -> Sequence["TextRange"]:
-        return [TextRange(elem) for elem in self.api.Words()]
+        return [self._derive(elem) for elem in self.api.Words()]
 
     @property
     def lines(self) -> Sequence["TextRange"]:
-        return [TextRange(elem) for elem in self.api.Lines()]
+        return [self._derive(elem) for elem in self.api.Lines()]
 
     @property
     def sentences(self) -> Sequence["TextRange"]:
-        return [TextRange(elem) for elem in self.api.Sentences()]
+        return [self._derive(elem) for elem in self.api.Sentences()]
 
     @property
     def paragraphs(self) -> Sequence["TextRange"]:
-        return [TextRange(elem) for elem in self.api.Paragraphs()]
+        return [self._derive(elem) for elem in self.api.Paragraphs()]
 
     @property
     def runs(self) -> Sequence["TextRange"]:
         # (2022/02/08): Experimentally, I feel it is better that `runs` are separated at `paragraphs` 
         # Since the modification of `run` affects unintuitive. 
         # This phenomena was seen when revising `FontResizer`.
-        return [TextRange(elem) for para in self.paragraphs for elem in para.api.Runs()]
+        return [self._derive(elem) for para in self.paragraphs for elem in para.api.Runs()]
 
     @property
     def root(self) -> "TextRange":
         """Return the entire `TextRange`.
         """
         textframe_api = upstream(self.api, "TextFrame")
-        return TextRange(textframe_api.TextRange)
+        return self._derive(textframe_api.TextRange)
 
     @property
     def start(self) -> int:
@@ -99,23 +131,34 @@ class TextRange:
         """Return the TextRange. Note that `start` starts from `1`.
         """
         assert 0 <= start, "Per instruction, the indices starts from 1."
-        return TextRange(self.root.api.Characters(start, length))
+        return self._derive(self.root.api.Characters(start, length))
+
+    @property
+    def offset_index(self) -> "TextOffsetIndex":
+        """Return the offsets of paragraphs and lines of `root`.
+        It is built from a single `Text` read, and shared with the `TextRange`s derived from `self`
+        while the text is unchanged (see `_OffsetIndexHolder`).
+        """
+        return self._offset_holder.get(upstream(self.api, "TextFrame").TextRange)
+
+    def get_paragraph_from_root(self, index: int) -> "TextRange":
+        """Return the `index`-th paragraph of `root`, including the trailing `\\r`.
+        """
+        root = self.root
+        start, length = self.offset_index.paragraph_bounds(index)
+        return self._derive(root.api.Characters(start, length))
 
     @property
     def paragraph_index(self) -> int:
         """Return the index of `Paragraph`.
         where  the `Start` of `self` is included.
         """
-        pivot = self.api.Start
-        root = self.root
-        for index, para in enumerate(root.paragraphs):
-            start, length = para.api.Start, para.api.Length
-            if start <= pivot < start + length:
-                return index
-        raise RuntimeError("Implementation Bug.")
+        return self.offset_index.paragraph_index(self.api.Start)
     
     @property
     def editor(self) -> "TextRangeEditor":
+        # The editor may change the text.
+        self._offset_holder.invalidate()
         return TextRangeEditor(self)
 
     def insert(self, text: str, mode: Literal["after", "before"]="after") -> "TextRange":
@@ -127,25 +170,43 @@ class TextRange:
 
     @text.setter
     def text(self, text: str):
+        self._offset_holder.invalidate()
         self.api.Text = normalize_paragraph_breaks(text)
 
+    def update(self, value: "str | TextRange | TextRangeApiModel") -> None:
+        """Change `self` to `value`, rewriting only the differences.
+
+        * `str`: Only the text is changed. The inserted characters follow the neighboring formats.
+        * `TextRange` / `TextRangeApiModel`: The text and the formats are changed.
+        """
+        from fairypptx.apis.text_range.diff import plan_text_edits, apply_text_edits
+        self._offset_holder.invalidate()
+        if isinstance(value, str):
+            current = self.text
+            plan = plan_text_edits(current, normalize_paragraph_breaks(value))
+            apply_text_edits(self.api, current, plan.edits)
+            return
+        if isinstance(value, TextRange):
+            value = TextRangeApiModel.from_api(value.api)
+        value.update_api(self.api)
+
     def itemize(self) -> None:
         for elem in self.paragraphs:
             elem.api.ParagraphFormat.Bullet.Visible = constants.msoTrue
             elem.api.ParagraphFormat.Bullet.Type = constants.ppBulletUnnumbered
 
-    def find(self, target : str) -> Sequence["TextRange"]:
-        """Return `list` of `TextRange` whose text is `target`. 
+    def find(self, target: str, *, regex: bool = False) -> Sequence["TextRange"]:
+        """Return `Sequence` of `TextRange` whose text matches `target`.
+
+        `Text` is read once and the matches are searched in Python.
+        Each `TextRange` is built when it is accessed.
+
+        Args:
+            target: The text to search, or the regular expression if `regex` is True.
         """
-        result = []
-        start = 0
-        while True:
-            cand = self.api.Find(target, start, constants.msoTrue)
-            if cand is None:
-                break
-            start = cand.Start + cand.Length - 1 
-            result.append(TextRange(cand))
-        return result
+        from fairypptx.text_range.search import TextRangeMatches, find_spans
+        text = self.text
+        return TextRangeMatches(self.api, text, find_spans(text, target, regex))
 
 
     def register(self, style: str, style_type: str | None | type = None) -> None:
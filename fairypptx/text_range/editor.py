@@ -1,14 +1,13 @@
 """There are codes related to modify `TextRange`.
 
 """
-from fairypptx.text_range import TextRange
-
-import itertools
 from typing import Literal
 
 from fairypptx.text_range import TextRange
 
 
+CR_CHARS = {"\r", "\013"}
+
 
 class TextRangeEditor:
     def __init__(self,  text_range: TextRange):
@@ -29,56 +28,35 @@ class TextRangeEditor:
         tr.api.Text  = text
         return tr
 
+    def _scan(self) -> "_NewlineScan":
+        api = self.text_range.api
+        root = self.text_range.root
+        return _NewlineScan(root.text, api.Start, api.Length)
+
     @property
     def n_tail_newlines(self) -> int:
         """Return the number of consecutive newlines 
         at the tail of `paragraph`, including itself.
         """
-        api = self.text_range.api
-        CR_CHARS = {"\r", "\013"}
-        text = self.text_range.text
-        root = self.text_range.root
-
-        start, length = api.Start, api.Length
-        n_inner = len(list(itertools.takewhile(lambda t: t in CR_CHARS, reversed(text))))
-        next_start = start + length 
-        n_outer = 0 
-        while next_start + n_outer <= root.api.Length:
-            if root.api.Characters(next_start + n_outer, 1).Text not in CR_CHARS:
-                break
-            n_outer += 1
-        return n_inner + n_outer
-
+        return self._scan().n_tail
 
     @property
     def n_head_newlines(self) -> int:
         """Return the number of consecutive newlines 
         at the head of `paragraph`, including itself.
         """
-        api = self.text_range.api
-        CR_CHARS = {"\r", "\013"}
-        text = self.text_range.text
-        root = self.text_range.root
-        start, length = api.Start, api.Length
-        n_inner = len(list(itertools.takewhile(lambda t: t in CR_CHARS, text)))
-        next_start = start - 1
-        n_outer = 0 
-        while 1 <= next_start - n_outer:
-            if root.api.Characters(next_start - n_outer, 1).Text not in CR_CHARS:
-                break
-            n_outer += 1
-        return n_inner + n_outer
-
+        return self._scan().n_head
 
     def set_tail_newlines(self, n_newlines: int =1) -> None:
         """Set the `tail` of `newlines`. 
         [IMPORTANT] If you use this func, 
         `paragraphs` may break.
         """
+        scan = self._scan()
         # [TODO] For this restriction, We have to consider carefully..  
-        if not self.text_range.text.strip("\r\013"):
+        if scan.is_blank:
             raise NotImplementedError("Currently, this is not expected for empty `TextRange`.")
-        n_current = self.n_tail_newlines
+        n_current = scan.n_tail
         if n_current == n_newlines:
             return 
         elif n_current < n_newlines:
@@ -86,31 +64,74 @@ class TextRangeEditor:
             self.text_range.api.InsertAfter("\r" * diff)
         else:
             diff = n_current - n_newlines
-            start, length = self.text_range.api.Start, self.text_range.api.Length
-            pivot = start + length - 1
-            while 0 <= pivot and self.text_range.root.api.Characters(pivot, 1).Text in ["\r", "\013"]:
-                pivot -= 1
-            text = self.text_range.root.api.Characters(pivot + 1, diff).Text
-            assert all(c in {"\r", "\013"} for c in text), "set_tail_newlines"
-            self.text_range.root.api.Characters(pivot + 1, diff).Delete()
+            self.text_range.root.api.Characters(scan.tail_start, diff).Delete()
 
     def set_head_newlines(self, n_newlines: int =1) -> None:
         """Set the `head` of `newlines`. 
         [IMPORTANT] If you use this func, 
         `paragraphs` may break.
         """
+        scan = self._scan()
         # [TODO] For this restriction, We have to consider carefully..  
-        if not self.text_range.text.strip("\r\013"):
+        if scan.is_blank:
             raise NotImplementedError("Currently, this is not expected for empty `TextRange`.")
-        n_current = self.n_head_newlines
+        n_current = scan.n_head
         if n_current == n_newlines:
             return 
         elif n_current < n_newlines:
             diff = n_newlines - n_current
             self.text_range.api.InsertBefore("\r" * diff)
         else:
-            # Is it truly all right? 
-            # See `set_tail_newlines`.
             diff = n_current - n_newlines
-            start, length = self.text_range.api.Start, self.text_range.api.Length
-            self.text_range.api.Characters(start - diff, diff).Delete()
+            self.text_range.root.api.Characters(scan.head_start, diff).Delete()
+
+
+class _NewlineScan:
+    """Consecutive newlines around the range `[start, start + length)` of `root_text`,
+    scanned locally over a single read of the root text.
+
+    Positions are 1-based and in UTF-16 units, as `Characters`.
+    """
+    CR_CODES = frozenset(ord(c) for c in CR_CHARS)
+
+    def __init__(self, root_text: str, start: int, length: int):
+        self.codes = memoryview(root_text.encode("utf-16-le")).cast("H")
+        self.start = start
+        self.end = start + length  # Exclusive.
+
+    def _is_cr(self, position: int) -> bool:
+        return 1 <= position <= len(self.codes) and self.codes[position - 1] in self.CR_CODES
+
+    @property
+    def is_blank(self) -> bool:
+        return all(self._is_cr(position) for position in range(self.start, self.end))
+
+    @property
+    def tail_start(self) -> int:
+        """The first position of the newlines at the tail."""
+        position = self.end - 1
+        while self.start <= position and self._is_cr(position):
+            position -= 1
+        return position + 1
+
+    @property
+    def n_tail(self) -> int:
+        position = self.end
+        while self._is_cr(position):
+            position += 1
+        return position - self.tail_start
+
+    @property
+    def head_start(self) -> int:
+        """The first position of the newlines at the head."""
+        position = self.start - 1
+        while self._is_cr(position):
+            position -= 1
+        return position + 1
+
+    @property
+    def n_head(self) -> int:
+        position = self.start
+        while position < self.end and self._is_cr(position):
+            position += 1
+        return position - self.head_start
@@ -1,13 +1,33 @@
 """There are codes related to modify `TextRange`.
 
 """
-from typing import Sequence, Literal
+from typing import Sequence, Literal, Callable
 import itertools
 from fairypptx.text_range import TextRange
 from fairypptx.text_range.formatters import guessers
+from fairypptx.text_range.formatters.model import FormatModel, ParagraphView
 from fairypptx import constants
+from fairypptx.object_utils import upstream, stored
 
-class TrimItemization: 
+class PlannedStage:
+    """Base of the stages which edit `FormatModel`.
+
+    `plan` edits the model, and `__call__` applies the edits to `TextRange`.
+    When all the stages of `Composer` are `PlannedStage`,
+    the edits of all the stages are applied at once.
+    """
+
+    def plan(self, model: FormatModel) -> None:
+        raise NotImplementedError
+
+    def __call__(self, textrange: TextRange) -> TextRange:
+        textrange = TextRange(textrange)
+        model = FormatModel.from_text_range(textrange)
+        self.plan(model)
+        return model.apply()
+
+
+class TrimItemization(PlannedStage): 
     """Itemization as for `Trim`.
 
     Args: 
@@ -20,41 +40,30 @@ class TrimItemization:
         self.head_spaces = head_spaces
         self.tail_spaces = tail_spaces
 
-    def __call__(self, textrange: TextRange) -> TextRange:
-        if not textrange.text.strip("\r\013"):
-            return textrange
-        paragraphs = textrange.paragraphs
-        for para in textrange.paragraphs:
-            if self._is_itemization(para):
-                if self._is_empty(para):
-                    para.api.Delete()
-                    
-        # Since `Delete` is performed, so re-getting is mandatory.
-        paragraphs = textrange.paragraphs
-        for para in paragraphs:
-            if self._is_itemization(para):
-                if not self._is_empty(para):
-                    para.editor.set_tail_newlines(1)
-
-        # Since `Delete` is performed, so re-getting is mandatory.
-        paragraphs = textrange.paragraphs
-        groups = [(key, list(paras)) for key, paras
-                                     in itertools.groupby(paragraphs, key=self._is_itemization)
-                                     if  key]
-        for key, paras in reversed(groups):
-            paras[0].editor.set_head_newlines(self.head_spaces + 1)
-            paras[-1].editor.set_tail_newlines(self.tail_spaces + 1)
-        return textrange
+    def plan(self, model: FormatModel) -> None:
+        if model.is_blank:
+            return
+        for para in reversed(model.paragraphs):
+            if self._is_itemization(para) and para.is_empty:
+                model.delete_paragraph(para)
 
+        keys = [para.key for para in model.paragraphs
+                if self._is_itemization(para) and not para.is_empty]
+        for key in keys:
+            model.set_tail_newlines(model.find_paragraph(key), 1)
 
-    def _is_itemization(self, paragraph):
-        return paragraph.api.ParagraphFormat.Bullet.Type in self.ITEMIZATION_TYPES
+        groups = [[para.key for para in paras] for key, paras
+                  in itertools.groupby(model.paragraphs, key=self._is_itemization)
+                  if key]
+        for keys in reversed(groups):
+            model.set_head_newlines(model.find_paragraph(keys[0]), self.head_spaces + 1)
+            model.set_tail_newlines(model.find_paragraph(keys[-1]), self.tail_spaces + 1)
 
-    def _is_empty(self, paragraph):
-        return not paragraph.text.rstrip("\r\013")
+    def _is_itemization(self, paragraph: ParagraphView) -> bool:
+        return paragraph.attributes.bullet_type in self.ITEMIZATION_TYPES
 
 
-class LineSpacer:
+class LineSpacer(PlannedStage):
     """Modify the number of line-spaces.
     Specifically, the line spaces more than `n_spaces` 
     reduces to `n_space`. 
@@ -64,24 +73,27 @@ class LineSpacer:
         self.n_spaces = n_spaces
         pass
 
-    def __call__(self, textrange: TextRange) -> TextRange:
-        if not textrange.text.strip("\r\013"):
-            return textrange
-
-        for para in textrange.paragraphs:
-            if para.editor.n_tail_newlines >= self.n_spaces + 2:
-                para.editor.set_tail_newlines(self.n_spaces + 1)
-        if textrange.editor.n_head_newlines >= self.n_spaces + 2:
-            textrange.editor.set_head_newlines(self.n_spaces + 1)
-        return textrange
+    def plan(self, model: FormatModel) -> None:
+        if model.is_blank:
+            return
 
+        index = 0
+        while index < len(model.paragraphs):
+            para = model.paragraphs[index]
+            if not para.is_empty and self.n_spaces + 2 <= model.n_tail_newlines(para):
+                model.set_tail_newlines(para, self.n_spaces + 1)
+            index += 1
+        first = model.paragraphs[0]
+        if self.n_spaces + 2 <= model.n_head_newlines(first):
+            model.set_head_newlines(first, self.n_spaces + 1)
 
 
-class HeaderSpacer:
+class HeaderSpacer(PlannedStage):
     """Modify the spaces related to `Header`.
 
     [CAUTION]
         This function is basend on `guessing`. 
+        The headers are guessed from the `TextRange` before the edits of the model.
 
     Args:
         `ignore_beginning`: The first paragraph is also modified or not.
@@ -94,26 +106,49 @@ class HeaderSpacer:
         self.tail_spaces = tail_spaces
         self.ignore_beginning = ignore_beginning
 
+    def plan(self, model: FormatModel) -> None:
+        if model.text_range is None or model.is_blank:
+            return
+        text = model.original_text
+        starts = [0, *(index + 1 for index, char in enumerate(text) if char == "\r")]
+        groups = guessers.guess_header_paragraph_indices(model.text_range)
+        keys = []
+        for level, indices in groups:
+            for index in indices:
+                try:
+                    paragraph = model.find_paragraph_by_origin(starts[index])
+                except KeyError:  # Deleted by the preceding stages.
+                    continue
+                if not paragraph.is_empty:
+                    keys.append(paragraph.key)
+
+        for key in keys:
+            header = model.find_paragraph(key)
+            if not (header.index == 0 and self.ignore_beginning is True):
+                model.set_head_newlines(header, self.head_spaces + 1)
+            model.set_tail_newlines(model.find_paragraph(key), self.tail_spaces + 1)
 
-    def __call__(self, textrange: TextRange) -> TextRange:
-        groups = guessers.guess_header_paragraphs(textrange)
-        for level, headers in groups:
-            for header in headers:
-                p_index = header.paragraph_index
-                if p_index == 0 and self.ignore_beginning is True:
-                    pass
-                else:
-                    header.editor.set_head_newlines(self.head_spaces + 1)
-                header.editor.set_tail_newlines(self.tail_spaces + 1)
-        return textrange
 
 class Composer:
+    """Compose the stages.
+
+    If all the stages are `PlannedStage`, the stages edit one `FormatModel`
+    and the net edits are applied to `TextRange` once.
+    Otherwise, each stage is called in sequence (custom stages: `TextRange -> TextRange`).
+    """
     def __init__(self, *args):
-        if len(args) == 1 and isinstance(args, Sequence): 
+        if len(args) == 1 and isinstance(args[0], Sequence): 
             args = args[0]
         self.funcs = args
 
     def __call__(self, target):
+        if self.funcs and all(isinstance(func, PlannedStage) for func in self.funcs):
+            textrange = TextRange(target)
+            model = FormatModel.from_text_range(textrange)
+            for func in self.funcs:
+                func.plan(model)
+            return model.apply()
+
         for func in self.funcs:
             target = func(target)
         return target
@@ -140,14 +175,26 @@ class DefaultFormatter:
 
 class FontResizer:
     """Resize the font of `TextRange`.
+
     Args:
-        pass
+        fontsize: The target fontsize for `min` and `all`.
+        mode:
+            * `min`: The sizes are shifted so that the minimum becomes `fontsize`.
+            * `all`: All the characters become `fontsize`.
+            * `fit`: The sizes are scaled uniformly with the largest scale
+              at which the text fits the shape. `fontsize` is not used.
+        max_probes: The number of layout probes (`BoundWidth` / `BoundHeight`) for `fit`.
+        max_scale: The upper bound of the scale for `fit`.
     """
     def __init__(self,
                  fontsize: int =18,
-                 mode: Literal["min", "all"]="min"):
+                 mode: Literal["min", "all", "fit"]="min",
+                 max_probes: int = 8,
+                 max_scale: float = 4.0):
         self.fontsize = fontsize
         self.mode = mode
+        self.max_probes = max_probes
+        self.max_scale = max_scale
 
     def __call__(self, textrange: TextRange) -> TextRange:
         textrange = TextRange(textrange)
@@ -159,14 +206,98 @@ class FontResizer:
             textrange.font.size = self.fontsize
             return textrange
         elif self.mode == "min":
-            min_size = min((run.font.size for run in textrange.runs), default=self.fontsize)
+            spans = _read_size_spans(textrange)
+            min_size = min((size for _, _, size in spans), default=self.fontsize)
             diff_size = self.fontsize - min_size 
-            for run in textrange.runs:
-                run.font.size += diff_size
+            _write_size_spans(textrange, [(start, length, size + diff_size)
+                                          for start, length, size in spans])
             return textrange
+        elif self.mode == "fit":
+            return self._fit(textrange)
         else:
             raise RuntimeError("Implementation Error `mode`.")
 
+    def _fit(self, textrange: TextRange) -> TextRange:
+        spans = _read_size_spans(textrange)
+        shape_api = upstream(textrange.api, "Shape")
+        frame_api = shape_api.TextFrame
+        width = shape_api.Width - frame_api.MarginLeft - frame_api.MarginRight
+        height = shape_api.Height - frame_api.MarginTop - frame_api.MarginBottom
+        root_api = frame_api.TextRange
+
+        def _apply(scale: float) -> None:
+            _write_size_spans(textrange, [(start, length, _to_valid_size(size * scale))
+                                          for start, length, size in spans])
+
+        def _fits(scale: float) -> bool:
+            _apply(scale)
+            return root_api.BoundWidth <= width and root_api.BoundHeight <= height
+
+        with stored(frame_api, ("AutoSize", )):
+            frame_api.AutoSize = constants.ppAutoSizeNone
+            scale = bisect_scale(_fits, self.max_scale, self.max_probes)
+            _apply(scale)
+        return textrange
+
+
+def bisect_scale(fits: Callable[[float], bool],
+                 max_scale: float,
+                 max_probes: int,
+                 min_scale: float = 0.0) -> float:
+    """Return the largest scale in `[min_scale, max_scale]` which `fits`,
+    calling `fits` at most `max_probes` times.
+
+    `fits` is assumed to be monotone (True for the smaller scales).
+    If no probed scale fits, `min_scale` is returned.
+    """
+    if max_probes <= 0:
+        return min_scale
+    if fits(max_scale):
+        return max_scale
+    low, high = min_scale, max_scale
+    for _ in range(max_probes - 1):
+        middle = (low + high) / 2
+        if fits(middle):
+            low = middle
+        else:
+            high = middle
+    return low
+
+
+def merge_size_spans(runs: Sequence[tuple[int, int, float]]) -> list[tuple[int, int, float]]:
+    """Merge the adjacent `(start, length, size)` with the same `size`.
+    Empty runs are skipped.
+    """
+    spans: list[tuple[int, int, float]] = []
+    for start, length, size in runs:
+        if not length:
+            continue
+        if spans and spans[-1][2] == size and spans[-1][0] + spans[-1][1] == start:
+            spans[-1] = (spans[-1][0], spans[-1][1] + length, size)
+        else:
+            spans.append((start, length, size))
+    return spans
+
+
+def _read_size_spans(textrange: TextRange) -> list[tuple[int, int, float]]:
+    """`(start, length, size)` spans of the same size, relative to `textrange`."""
+    offset = textrange.api.Start - 1
+    runs = [(run_api.Start - offset, run_api.Length, run_api.Font.Size)
+            for para_api in textrange.api.Paragraphs()
+            for run_api in para_api.Runs()]
+    return merge_size_spans(runs)
+
+
+def _write_size_spans(textrange: TextRange, spans: Sequence[tuple[int, int, float]]) -> None:
+    api = textrange.api
+    for start, length, size in merge_size_spans(spans):
+        api.Characters(start, length).Font.Size = size
+
+
+def _to_valid_size(size: float) -> float:
+    # PowerPoint accepts the sizes in `[1, 4000]`, with 0.1pt resolution.
+    return min(max(round(size, 1), 1.0), 4000.0)
+
 
 if __name__ == "__main__":
     TEXT = """
@@ -19,6 +19,74 @@ import itertools
 from collections import defaultdict
 from dataclasses import dataclass
 
+import numpy as np
+
+from fairypptx import constants
+
+
+IGNORE_CHARS = {"\r", "\013"}
+
+
+@dataclass(frozen=True)
+class RunColumns:
+    """Columnar snapshot of the runs of `TextRange`, read at once.
+
+    Run columns:
+        * `size`, `bold`, `underline`, `length` (`Length` of the run),
+        * `empty`: Only `IGNORE_CHARS` are included.
+        * `paragraph`: The index of the paragraph.
+
+    Paragraph columns:
+        * `bullet_visible`, `paragraph_size` (`Font.Size` of the paragraph).
+    """
+    size: np.ndarray
+    bold: np.ndarray
+    underline: np.ndarray
+    length: np.ndarray
+    empty: np.ndarray
+    paragraph: np.ndarray
+    bullet_visible: np.ndarray
+    paragraph_size: np.ndarray
+    has_text: bool
+
+    @property
+    def n_paragraphs(self) -> int:
+        return len(self.bullet_visible)
+
+    @classmethod
+    def from_text_range(cls, textrange) -> "RunColumns":
+        rows = []
+        bullet_visible, paragraph_size = [], []
+        has_text = False
+        for p_index, para_api in enumerate(textrange.api.Paragraphs()):
+            bullet_visible.append(bool(para_api.ParagraphFormat.Bullet.Visible))
+            paragraph_size.append(para_api.Font.Size)
+            for run_api in para_api.Runs():
+                font_api = run_api.Font
+                text = run_api.Text
+                has_text = has_text or bool(text)
+                rows.append((font_api.Size,
+                             font_api.Bold != constants.msoFalse,
+                             font_api.Underline != constants.msoFalse,
+                             run_api.Length,
+                             not text.strip("".join(IGNORE_CHARS)),
+                             p_index))
+        size, bold, underline, length, empty, paragraph = (zip(*rows) if rows else ([],) * 6)
+        return cls(size=np.asarray(size, dtype=float),
+                   bold=np.asarray(bold, dtype=bool),
+                   underline=np.asarray(underline, dtype=bool),
+                   length=np.asarray(length, dtype=int),
+                   empty=np.asarray(empty, dtype=bool),
+                   paragraph=np.asarray(paragraph, dtype=int),
+                   bullet_visible=np.asarray(bullet_visible, dtype=bool),
+                   paragraph_size=np.asarray(paragraph_size, dtype=float),
+                   has_text=has_text)
+
+
+def _to_columns(textrange) -> RunColumns:
+    if isinstance(textrange, RunColumns):
+        return textrange
+    return RunColumns.from_text_range(textrange)
 
 
 def guess_default_fontsize(textrange) -> float:
@@ -30,25 +98,60 @@ def guess_default_fontsize(textrange) -> float:
     * The font must be often used. 
     * The font must be smaller than the one used for emphasizing. 
     """
-    if not textrange.text:
+    columns = _to_columns(textrange)
+    if not columns.has_text:
         raise ValueError("Empty TextRange.")
 
-    paragraphs = textrange.paragraphs
+    # The paragraphs whose runs have the single size.
+    pairs = np.unique(np.stack([columns.paragraph, columns.size]), axis=1)
+    p_indices, n_sizes = np.unique(pairs[0], return_counts=True)
+    single_sizes = pairs[1][np.isin(pairs[0], p_indices[n_sizes == 1])]
+
+    if not single_sizes.size:
+        return float(columns.paragraph_size[-1])  # Fallback.
+    sizes, n_paras = np.unique(single_sizes, return_counts=True)
+    # outliers' removal 
+    threshold = np.sort(n_paras)[min(round(len(n_paras) * 1 // 4), len(n_paras) - 1)]
+    return float(sizes[threshold <= n_paras].min())
+
+
+def guess_header_paragraph_indices(textrange) -> List[Tuple[int, List[int]]]:
+    """Same as `guess_header_paragraphs`, but the indices of paragraphs are returned.
+    `textrange` may be `RunColumns`.
+    """
+    columns = _to_columns(textrange)
+    n_paras = columns.n_paragraphs
+    default_fontsize = guess_default_fontsize(columns)
+    prop = _to_property_counter(columns, default_fontsize)
+
+    is_bold_dominant = (prop.total and prop.bolds / prop.total > 0.5)
+    is_underline_dominant = (prop.total and prop.underlines / prop.total > 0.5)
+
+    filled = ~columns.empty
+    p_filled = columns.paragraph[filled]
+
+    has_content = np.zeros(n_paras, dtype=bool)
+    has_content[p_filled] = True
+    fontsizes = np.full(n_paras, np.inf)
+    np.minimum.at(fontsizes, p_filled, columns.size[filled])
+    n_not_bold = np.bincount(p_filled[~columns.bold[filled]], minlength=n_paras)
+    n_not_underline = np.bincount(p_filled[~columns.underline[filled]], minlength=n_paras)
+    is_bold = np.bincount(columns.paragraph[columns.bold], minlength=n_paras) > 0
+    is_underline = np.bincount(columns.paragraph[columns.underline], minlength=n_paras) > 0
+
+    is_emphasized = (((not is_bold_dominant) & (n_not_bold == 0))
+                     | ((not is_underline_dominant) & (n_not_underline == 0)))
+    is_header = (~columns.bullet_visible & has_content
+                 & ((default_fontsize < fontsizes)
+                    | ((fontsizes == default_fontsize) & is_emphasized)))
+
+    def key_func(index):
+        return (fontsizes[index], bool(is_underline[index]), bool(is_bold[index]))
+
+    headers = sorted(np.flatnonzero(is_header).tolist(), key=key_func, reverse=True)
+    return [(level, list(values)) for level, (key, values)
+            in enumerate(itertools.groupby(headers, key=key_func))]
 
-    size_to_npara = defaultdict(int)
-
-    for para in paragraphs:
-        sizes = [run.font.size for run in para.runs]
-        if len(set(sizes)) == 1:
-            size_to_npara[sizes[0]] += 1
-    if not size_to_npara:
-        default_fontsize = paragraphs[-1].font.size  # Fallback.
-    else:
-        # outliers' removal 
-        threshold = sorted(size_to_npara.values())[min(round(len(size_to_npara) * 1 // 4), len(size_to_npara) -1)]
-        size_to_npara = {key: value for key, value in size_to_npara.items() if threshold <= value}
-        default_fontsize = min(size_to_npara.keys())
-    return default_fontsize
 
 def guess_header_paragraphs(textrange) -> List[Tuple[int, List["TextRange"]]]:
     """Return the `list` whose element is
@@ -62,47 +165,11 @@ def guess_header_paragraphs(textrange) -> List[Tuple[int, List["TextRange"]]]:
         * `fontsize` must be larger than or equal to `normal`  
         * If `fontsize` is the same as `normal`, `bold` or `underline` is applied over all the paragraphs.
     """
+    pairs = guess_header_paragraph_indices(textrange)
+    if not pairs:
+        return []
     paragraphs = textrange.paragraphs
-
-    default_fontsize = guess_default_fontsize(textrange)
-    prop = _gen_fontsize_properties(textrange)[default_fontsize]
-
-    is_bold_dominant = (prop.bolds / prop.total > 0.5)
-    is_underline_dominant = (prop.underlines / prop.total > 0.5)
-
-    def _is_header(paragraph):
-        if paragraph.api.ParagraphFormat.Bullet.Visible:
-            return False
-        if _is_empty(paragraph):
-            return False
-
-        fontsize = _to_single_fontsize(paragraph)
-
-        if fontsize < default_fontsize:
-            return False
-        elif fontsize == default_fontsize:
-            is_bold_cond = ((not is_bold_dominant) and all(run.font.bold for run in _runs_iter(paragraph)))
-            is_underline_cond = ((not is_underline_dominant) and all(run.font.underline for run in _runs_iter(paragraph)))
-            return (is_bold_cond or is_underline_cond)
-        else:
-            return True
-
-    # Firstly, judge whether `each` paragraph is `Header` or not.
-    # Secondly, determine the `level` of `header`. 
-
-    def key_func(paragraph):
-        fontsize = _to_single_fontsize(paragraph)
-        is_underline = paragraph.font.underline
-        is_bold = paragraph.font.bold
-        return (fontsize, is_underline, is_bold)
-
-    headers = [para for para in paragraphs if _is_header(para)]
-    headers = sorted(headers, key=key_func, reverse=True)
-    pairs   = [(level, list(values)) for level, (key, values)
-                         in enumerate(itertools.groupby(headers, key=key_func))]
-    return pairs
-
-
+    return [(level, [paragraphs[index] for index in indices]) for level, indices in pairs]
 
 
 @dataclass
@@ -116,49 +183,32 @@ class _PropertyCounter:
     total: int = 0
 
 
+def _to_property_counter(columns: RunColumns, fontsize: float) -> _PropertyCounter:
+    mask = columns.size == fontsize
+    lengths = columns.length[mask]
+    return _PropertyCounter(bolds=int(lengths[columns.bold[mask]].sum()),
+                            underlines=int(lengths[columns.underline[mask]].sum()),
+                            total=int(lengths.sum()))
+
+
 def _gen_fontsize_properties(textrange):
     """Return the dict. Key is `fontsize` and  
     the value is also `dict`, which represents 
     the information about `TextRange`s for each `fontsize`.  
     """
+    columns = _to_columns(textrange)
     result = defaultdict(_PropertyCounter)
-    for run in textrange.runs:
-        fontsize = run.font.size
-        counter = result[fontsize]
-        counter.total += run.api.Length
-        if run.font.bold:
-            counter.bolds += run.api.Length
-        if run.font.underline:
-            counter.underlines += run.api.Length
+    for fontsize in np.unique(columns.size):
+        result[float(fontsize)] = _to_property_counter(columns, fontsize)
     return result
 
 def _is_empty(textrange):
     """Here `empty` means some characters exists except
     `IGNORE_CHARS` (e.g. `\r`)
     """
-    IGNORE_CHARS = {"\r", "\013"}
     return not bool(textrange.text.strip("".join(IGNORE_CHARS)))
 
 
-def _runs_iter(textrange, ignore_empty=True):
-    """Iterate `runs`. If `ignore_empty` is True`, then 
-    `empty` textrange is omitted.
-    """ 
-    if not ignore_empty:
-        return iter(textrange.runs) 
-    return (run for run in textrange.runs if not _is_empty(run))
-
-def _to_single_fontsize(textrange):
-    """Since, `textrange` contains multiple `runs` 
-    the size of `fontsize` 
-    """
-    if not textrange.text:
-        raise ValueError("Empty TextRange")
-    fontsize = textrange.runs[0].font.size
-    result = min((run.font.size for run in _runs_iter(textrange)), default=fontsize)
-    return result 
-
-
 
 if __name__ == "__main__":
     from fairypptx import Markdown, TextRange
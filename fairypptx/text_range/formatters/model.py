@@ -0,0 +1,254 @@
+"""In-memory model of `TextRange` for the formatters.
+
+The stages of formatters (e.g. `TrimItemization`) mainly insert / delete newlines.
+Instead of editing `TextRange` via COM stage by stage (and re-reading
+the paragraphs after every deletion), the stages edit `FormatModel`,
+and the net edits are applied to `TextRange` at once (`FormatModel.apply`).
+
+Model
+-----
+* The text is a list of characters. Each character remembers
+  its position in the original text (`origin`, None if inserted),
+  and the original paragraph whose attributes it inherits.
+* Paragraphs are derived from the characters by splitting at `\\r`.
+  The attributes of a paragraph are those of its first character.
+"""
+
+import itertools
+from dataclasses import dataclass, field
+from typing import Sequence, TYPE_CHECKING
+
+from fairypptx.apis.text_range.diff import TextEdit, apply_text_edits
+
+if TYPE_CHECKING:
+    from fairypptx.text_range import TextRange
+
+
+CR_CHARS = {"\r", "\013"}
+
+_uid_counter = itertools.count()
+
+
+@dataclass(frozen=True)
+class ParagraphAttributes:
+    bullet_type: int
+    bullet_visible: bool
+    indent_level: int
+
+
+@dataclass
+class _Char:
+    char: str
+    origin: int | None
+    attributes: ParagraphAttributes
+    uid: int = field(default_factory=lambda: next(_uid_counter))
+
+    @property
+    def is_cr(self) -> bool:
+        return self.char in CR_CHARS
+
+
+@dataclass(frozen=True)
+class ParagraphView:
+    """A paragraph of `FormatModel` at some moment.
+    `start` and `end` are the indices of characters (`end` is exclusive and includes `\\r`).
+    """
+    index: int
+    start: int
+    end: int
+    attributes: ParagraphAttributes
+    text: str
+    key: int | None  # `uid` of the first non-newline character. None for empty paragraphs.
+
+    @property
+    def is_empty(self) -> bool:
+        return self.key is None
+
+
+class FormatModel:
+    """Editable model of the text of `TextRange`.
+
+    Args:
+        text: The text of `text_range`.
+        attributes: The attributes of each paragraph of `text`.
+        text_range: The target of `apply`.
+    """
+
+    def __init__(self, text: str,
+                 attributes: Sequence[ParagraphAttributes],
+                 text_range: "TextRange | None" = None):
+        assert text.count("\r") + 1 == len(attributes), "Paragraphs and attributes mismatch."
+        self.original_text = text
+        self.text_range = text_range
+        p_indices = itertools.accumulate((char == "\r" for char in text[:-1]), initial=0)
+        self._chars = [_Char(char, origin, attributes[p_index])
+                       for origin, (char, p_index) in enumerate(zip(text, p_indices))]
+        self._default_attributes = attributes[0]
+        self._paragraphs: list[ParagraphView] | None = None
+
+    @classmethod
+    def from_text_range(cls, text_range: "TextRange") -> "FormatModel":
+        text = text_range.text
+        attributes = []
+        for para in text_range.paragraphs:
+            format_api = para.api.ParagraphFormat
+            attributes.append(ParagraphAttributes(bullet_type=format_api.Bullet.Type,
+                                                  bullet_visible=bool(format_api.Bullet.Visible),
+                                                  indent_level=para.api.IndentLevel))
+        n_paragraphs = text.count("\r") + 1
+        # `Paragraphs` may ignore the empty tail, so the last one is reused.
+        if not attributes:
+            attributes = [ParagraphAttributes(0, False, 1)]
+        attributes = (attributes + [attributes[-1]] * n_paragraphs)[:n_paragraphs]
+        return cls(text, attributes, text_range)
+
+    @property
+    def text(self) -> str:
+        return "".join(char.char for char in self._chars)
+
+    @property
+    def is_blank(self) -> bool:
+        return all(char.is_cr for char in self._chars)
+
+    @property
+    def paragraphs(self) -> Sequence[ParagraphView]:
+        if self._paragraphs is None:
+            self._paragraphs = self._to_paragraphs()
+        return self._paragraphs
+
+    def _to_paragraphs(self) -> list[ParagraphView]:
+        result = []
+        start = 0
+        for end, char in enumerate(self._chars, start=1):
+            if char.char == "\r":
+                result.append(self._to_paragraph(len(result), start, end))
+                start = end
+        result.append(self._to_paragraph(len(result), start, len(self._chars)))
+        return result
+
+    def _to_paragraph(self, index: int, start: int, end: int) -> ParagraphView:
+        chars = self._chars[start:end]
+        if chars:
+            attributes = chars[0].attributes
+        elif start:
+            attributes = self._chars[start - 1].attributes
+        else:
+            attributes = self._default_attributes
+        key = next((char.uid for char in chars if not char.is_cr), None)
+        return ParagraphView(index, start, end, attributes, "".join(char.char for char in chars), key)
+
+    def find_paragraph(self, key: int) -> ParagraphView:
+        """Return the current paragraph which has the character `key`."""
+        for paragraph in self.paragraphs:
+            if paragraph.key == key:
+                return paragraph
+        raise KeyError(key)
+
+    def find_paragraph_by_origin(self, origin: int) -> ParagraphView:
+        """Return the current paragraph which includes the original character at `origin`
+        (`str` index of the original text).
+
+        Raises:
+            KeyError: The character at `origin` is deleted.
+        """
+        index = next((i for i, char in enumerate(self._chars) if char.origin == origin), None)
+        if index is None:
+            raise KeyError(origin)
+        return next(para for para in self.paragraphs if para.start <= index < para.end)
+
+    # Editing operations. They mirror `TextRangeEditor`.
+
+    def _is_cr(self, index: int) -> bool:
+        return 0 <= index < len(self._chars) and self._chars[index].is_cr
+
+    def _tail_start(self, paragraph: ParagraphView) -> int:
+        index = paragraph.end - 1
+        while paragraph.start <= index and self._is_cr(index):
+            index -= 1
+        return index + 1
+
+    def _head_start(self, paragraph: ParagraphView) -> int:
+        index = paragraph.start - 1
+        while self._is_cr(index):
+            index -= 1
+        return index + 1
+
+    def n_tail_newlines(self, paragraph: ParagraphView) -> int:
+        index = paragraph.end
+        while self._is_cr(index):
+            index += 1
+        return index - self._tail_start(paragraph)
+
+    def n_head_newlines(self, paragraph: ParagraphView) -> int:
+        index = paragraph.start
+        while index < paragraph.end and self._is_cr(index):
+            index += 1
+        return index - self._head_start(paragraph)
+
+    def set_tail_newlines(self, paragraph: ParagraphView, n_newlines: int = 1) -> None:
+        n_current = self.n_tail_newlines(paragraph)
+        if n_current < n_newlines:
+            self._insert(paragraph.end, "\r" * (n_newlines - n_current), after=True)
+        elif n_newlines < n_current:
+            start = self._tail_start(paragraph)
+            self._delete(start, start + n_current - n_newlines)
+
+    def set_head_newlines(self, paragraph: ParagraphView, n_newlines: int = 1) -> None:
+        n_current = self.n_head_newlines(paragraph)
+        if n_current < n_newlines:
+            self._insert(paragraph.start, "\r" * (n_newlines - n_current), after=False)
+        elif n_newlines < n_current:
+            start = self._head_start(paragraph)
+            self._delete(start, start + n_current - n_newlines)
+
+    def delete_paragraph(self, paragraph: ParagraphView) -> None:
+        self._delete(paragraph.start, paragraph.end)
+
+    def _insert(self, index: int, text: str, after: bool) -> None:
+        """Insert `text` at `index`.
+        The attributes follow the preceding character if `after`, otherwise the following one.
+        """
+        neighbor = index - 1 if after else index
+        if not (0 <= neighbor < len(self._chars)):
+            neighbor = min(max(index - 1, 0), len(self._chars) - 1)
+        attributes = self._chars[neighbor].attributes if self._chars else self._default_attributes
+        self._chars[index:index] = [_Char(char, None, attributes) for char in text]
+        self._paragraphs = None
+
+    def _delete(self, start: int, end: int) -> None:
+        del self._chars[start:end]
+        self._paragraphs = None
+
+    # Conversion to the edits of the original text.
+
+    def to_edits(self) -> list[TextEdit]:
+        """Net edits of the original text, in `str` index.
+
+        The edits are derived from the `origin`s of the characters, so the newlines
+        deleted / inserted are exactly the ones chosen by the stages.
+        (Within consecutive `\r`, which one is deleted decides whose paragraph format survives.)
+        """
+        edits = []
+        expected = 0  # The origin of the next original character if nothing is deleted.
+        inserted: list[str] = []
+        for char in self._chars:
+            if char.origin is None:
+                inserted.append(char.char)
+                continue
+            assert expected <= char.origin, "The original characters must keep their order."
+            if expected < char.origin or inserted:
+                edits.append(TextEdit(expected, char.origin - expected, "".join(inserted)))
+            inserted = []
+            expected = char.origin + 1
+        end = len(self.original_text)
+        if expected < end or inserted:
+            edits.append(TextEdit(expected, end - expected, "".join(inserted)))
+        return edits
+
+    def apply(self, text_range: "TextRange | None" = None) -> "TextRange":
+        """Apply the net edits to `text_range` (by default, the source of the model)."""
+        text_range = text_range or self.text_range
+        if text_range is None:
+            raise ValueError("`text_range` is not given.")
+        apply_text_edits(text_range.api, self.original_text, self.to_edits())
+        return text_range
@@ -0,0 +1,86 @@
+"""Index of paragraph / line offsets of a text.
+
+`TextRange.paragraph_index` and the like require the boundaries of paragraphs.
+Reading `Start` / `Length` of every paragraph via COM is slow,
+so the boundaries are computed from a single `Text` read,
+and queried with `bisect`.
+
+The index is cached by the text itself, hence, when the text changes,
+a new index is built (i.e. the cache is invalidated implicitly).
+
+Positions follow the convention of COM:
+they start from `1` and are counted in UTF-16 units.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Self, Sequence
+
+from fairypptx.apis.text_range.snapshot import utf16_len
+
+
+PARAGRAPH_SEPARATORS = {"\r"}
+LINE_SEPARATORS = {"\r", "\013"}
+
+
+def _to_bounds(text: str, separators: set[str]) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """`(starts, lengths)` of the segments. The separator belongs to the preceding segment."""
+    starts = [1]
+    position = 1
+    for char in text:
+        position += 1 if ord(char) < 0x10000 else 2
+        if char in separators:
+            starts.append(position)
+    ends = [*starts[1:], position]
+    return tuple(starts), tuple(end - start for start, end in zip(starts, ends))
+
+
+@dataclass(frozen=True)
+class TextOffsetIndex:
+    """Offsets of paragraphs and lines.
+    Note that a `line` is separated with `\\r` or `\\013` (soft break) here,
+    which is different from `TextRange.Lines` (the lines of the layout).
+    """
+
+    paragraph_starts: Sequence[int]
+    paragraph_lengths: Sequence[int]
+    line_starts: Sequence[int]
+    line_lengths: Sequence[int]
+    total_length: int
+
+    @classmethod
+    def from_text(cls, text: str) -> Self:
+        return _from_text(cls, text)
+
+    @property
+    def n_paragraphs(self) -> int:
+        return len(self.paragraph_starts)
+
+    def paragraph_index(self, position: int) -> int:
+        """Return the index of the paragraph which includes `position`."""
+        return max(bisect_right(self.paragraph_starts, position) - 1, 0)
+
+    def paragraph_bounds(self, index: int) -> tuple[int, int]:
+        """Return `(start, length)` of the `index`-th paragraph.
+        `length` includes the trailing `\\r`, as `Paragraphs(index + 1)` does.
+        """
+        return self.paragraph_starts[index], self.paragraph_lengths[index]
+
+    def line_index(self, position: int) -> int:
+        """Return the index of the line which includes `position`."""
+        return max(bisect_right(self.line_starts, position) - 1, 0)
+
+    def line_bounds(self, index: int) -> tuple[int, int]:
+        return self.line_starts[index], self.line_lengths[index]
+
+
+@lru_cache(maxsize=128)
+def _from_text(cls: type[TextOffsetIndex], text: str) -> TextOffsetIndex:
+    paragraph_starts, paragraph_lengths = _to_bounds(text, PARAGRAPH_SEPARATORS)
+    line_starts, line_lengths = _to_bounds(text, LINE_SEPARATORS)
+    return cls(paragraph_starts=paragraph_starts,
+               paragraph_lengths=paragraph_lengths,
+               line_starts=line_starts,
+               line_lengths=line_lengths,
+               total_length=utf16_len(text))
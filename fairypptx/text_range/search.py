@@ -0,0 +1,129 @@
+"""Search and replacement of texts, done in Python over a single `Text` read.
+
+* `TextRangeMatches`: The result of `TextRange.find`.
+  `TextRange` of each match is built only when it is accessed.
+* `plan_replacements`: The edits of find/replace over a text,
+  which is used for `Presentation.find_replace`.
+
+Note that the positions of COM (`Characters`) are in UTF-16 units,
+while Python's `str` is indexed by code points.
+"""
+
+import re
+from collections.abc import Sequence
+from typing import Iterator, overload, TYPE_CHECKING
+
+from pywintypes import com_error
+
+from fairypptx import constants
+from fairypptx.core.types import COMObject
+from fairypptx.apis.text_range.snapshot import utf16_len
+from fairypptx.apis.text_range.diff import TextEdit
+
+if TYPE_CHECKING:
+    from fairypptx.text_range import TextRange
+
+
+def to_pattern(target: str | re.Pattern, regex: bool = False) -> re.Pattern:
+    if isinstance(target, re.Pattern):
+        return target
+    if regex:
+        return re.compile(target)
+    return re.compile(re.escape(target))
+
+
+def find_spans(text: str, target: str | re.Pattern, regex: bool = False) -> list[tuple[int, int]]:
+    """Return `(start, end)` (`str` index) of non-overlapping matches.
+    Empty matches are ignored.
+    """
+    pattern = to_pattern(target, regex)
+    return [match.span() for match in pattern.finditer(text) if match.end() > match.start()]
+
+
+class _Utf16Converter:
+    """Convert `str` index of `text` to UTF-16 index."""
+
+    def __init__(self, text: str):
+        self._text = text
+        self._is_bmp = utf16_len(text) == len(text)
+
+    def __call__(self, index: int) -> int:
+        if self._is_bmp:
+            return index
+        return utf16_len(self._text[:index])
+
+
+class TextRangeMatches(Sequence):
+    """Matches of `TextRange.find`.
+    `TextRange` is built when each element is accessed.
+    """
+
+    def __init__(self, api: COMObject, text: str, spans: Sequence[tuple[int, int]]):
+        self._api = api
+        self._spans = list(spans)
+        self._to_utf16 = _Utf16Converter(text)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    @property
+    def spans(self) -> Sequence[tuple[int, int]]:
+        """`(start, end)` of the matches in `str` index of the text."""
+        return self._spans
+
+    def _to_text_range(self, span: tuple[int, int]) -> "TextRange":
+        from fairypptx.text_range import TextRange
+        start, end = self._to_utf16(span[0]), self._to_utf16(span[1])
+        return TextRange(self._api.Characters(start + 1, end - start))
+
+    @overload
+    def __getitem__(self, key: int) -> "TextRange":
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> Sequence["TextRange"]:
+        ...
+
+    def __getitem__(self, key: int | slice) -> "TextRange | Sequence[TextRange]":
+        if isinstance(key, slice):
+            return [self._to_text_range(span) for span in self._spans[key]]
+        return self._to_text_range(self._spans[key])
+
+    def __iter__(self) -> Iterator["TextRange"]:
+        for span in self._spans:
+            yield self._to_text_range(span)
+
+
+def plan_replacements(text: str,
+                      target: str | re.Pattern,
+                      replacement: str,
+                      regex: bool = False) -> list[TextEdit]:
+    """Edits which replace the matches of `target` in `text` with `replacement`.
+    When `regex` is True, `replacement` may contain group references (e.g. `\\1`).
+    """
+    pattern = to_pattern(target, regex)
+    edits = []
+    for match in pattern.finditer(text):
+        if match.end() == match.start():
+            continue
+        new_text = match.expand(replacement) if regex else replacement
+        edits.append(TextEdit(match.start(), match.end() - match.start(), new_text))
+    return edits
+
+
+def iter_text_range_apis(shape_apis: Sequence[COMObject]) -> Iterator[COMObject]:
+    """Yield COM `TextRange` of the shapes, including grouped shapes and table cells."""
+    for shape_api in shape_apis:
+        try:
+            shape_type = shape_api.Type
+            if shape_type == constants.msoGroup:
+                yield from iter_text_range_apis(list(shape_api.GroupItems))
+            elif shape_api.HasTable == constants.msoTrue:
+                table_api = shape_api.Table
+                for row_api in table_api.Rows:
+                    for cell_api in row_api.Cells:
+                        yield cell_api.Shape.TextFrame.TextRange
+            elif shape_api.HasTextFrame == constants.msoTrue:
+                yield shape_api.TextFrame.TextRange
+        except com_error:
+            continue
@@ -0,0 +1,88 @@
+"""Conformance of `fast_parser` against `pandoc`.
+"""
+
+import json
+import os
+import subprocess
+import time
+import pytest
+from fairypptx.parts._markdown.jsonast import fast_parser
+
+
+def _to_jsonast(markdown_script):
+    ret = subprocess.run("pandoc -t json",
+                          universal_newlines=True,
+                          stdout=subprocess.PIPE,
+                          input=markdown_script, encoding="utf8")
+    assert ret.returncode == 0
+    return json.loads(ret.stdout)
+
+
+SUPPORTED_SCRIPTS = [
+    "Hello world!",
+    "# Title\n\nHello *world* and **bold** with `code` and [link](https://example.com).",
+    "# Dup\n\n## Dup\n\n### 1 Numbered header",
+    "First line\nsecond line\n\nNext paragraph.",
+    "* ITEM1\n* ITEM2\n    * ITEM2-1\n    * ITEM2-2\n* ITEM3",
+    "1. NUM1\n2. NUM2\n   * ITEM\n3. NUM3",
+    "* ITEM with **bold** and *emph*\n  lazy continuation",
+    "foo_bar_baz and 2 * 3",
+    "*a **b** c*",
+    "# A\n\n# A\n\n# A-1",
+    "plain `c``c` text",
+    "* item `a``b`",
+]
+
+UNSUPPORTED_SCRIPTS = [
+    "It's quoted.",
+    "a -- b...",
+    "* loose\n\n* list",
+    "![image](image.png)",
+    "Title\n=====",
+    "| a | b |\n|---|---|\n| 1 | 2 |",
+    "hard  \nbreak",
+    "> quote",
+    "* * *",
+    "- - -",
+    "(a) first\n(b) second",
+    "a) first",
+    "* # Heading",
+    "* 1. nested",
+    "x._y_",
+    "._12_",
+]
+
+
+@pytest.mark.parametrize("script", SUPPORTED_SCRIPTS)
+def test_conformance(script):
+    expected = _to_jsonast(script)
+    actual = fast_parser.parse(script, api_version=expected["pandoc-api-version"])
+    assert actual is not None
+    assert actual["blocks"] == expected["blocks"]
+
+
+@pytest.mark.parametrize("script", UNSUPPORTED_SCRIPTS)
+def test_unsupported(script):
+    assert fast_parser.parse(script) is None
+
+
+@pytest.mark.skipif(not os.environ.get("FAIRYPPTX_BENCHMARK"),
+                    reason="Benchmark. Set `FAIRYPPTX_BENCHMARK=1` to run.")
+def test_benchmark():
+    """Report the throughput of `fast_parser` and `pandoc` over the conformance corpus.
+    Wall-clock times are not asserted.
+    """
+    n_trials = 5
+    timings = {}
+    for label, func in [("fast_parser", fast_parser.parse), ("pandoc", _to_jsonast)]:
+        start = time.perf_counter()
+        for _ in range(n_trials):
+            for script in SUPPORTED_SCRIPTS:
+                func(script)
+        timings[label] = time.perf_counter() - start
+    n_documents = n_trials * len(SUPPORTED_SCRIPTS)
+    print(", ".join(f"{label}: {n_documents / elapsed:.0f} docs/s" for label, elapsed in timings.items()))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "--capture=no"])
@@ -0,0 +1,27 @@
+"""Conversion of Markdown into HTML via `pandoc` and `premailer`.
+"""
+
+import pytest
+from fairypptx.parts._markdown.html import pandoc
+
+
+def test_to_html_many():
+    scripts = ["# Title\n\nHello", "* ITEM1\n* ITEM2"]
+    htmls = pandoc.to_html_many(scripts)
+    assert htmls == [pandoc.to_html(script) for script in scripts]
+    assert "ITEM1" in htmls[1]
+
+
+def test_css_index(tmp_path):
+    index = pandoc._CSSCache(tmp_path)
+    (tmp_path / "sample.css").write_text("body {}", encoding="utf8")
+    assert index("sample") == tmp_path / "sample.css"
+    # Files added later are found after the refresh by mtime.
+    (tmp_path / "other.css").write_text("body {}", encoding="utf8")
+    assert index("other") == tmp_path / "other.css"
+    with pytest.raises(ValueError):
+        index("missing")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "--capture=no"])
@@ -38,5 +38,90 @@ def test_simple_itemization():
     assert _to_jsonast(IN_SCRIPT) == _to_jsonast(out_script)
 
 
+def test_to_jsonast_many():
+    from fairypptx.parts._markdown.jsonast.utils import to_jsonast, to_jsonast_many
+    # The documents are independent (e.g. identifiers of headers and reference links).
+    scripts = ["# Title\n\nHello", "* ITEM1\n* ITEM2", "```\nunclosed code",
+               "# Intro\n\n[ref]\n\n[ref]: https://example.com", "# Intro\n\n[ref]"]
+    results = to_jsonast_many(scripts)
+    assert [result["blocks"] for result in results] == [_to_jsonast(script)["blocks"] for script in scripts]
+    # Cached results are independent objects.
+    results[0]["blocks"].clear()
+    assert to_jsonast(scripts[0])["blocks"] == _to_jsonast(scripts[0])["blocks"]
+
+
+def test_text_cache_eviction(tmp_path):
+    from fairypptx.parts._markdown.jsonast.utils import TextCache
+    cache = TextCache(tmp_path, max_size=0, max_bytes=250)
+    for index in range(5):
+        cache.put_text(f"{index:02d}key", "x" * 100)
+    assert sum(path.stat().st_size for path in tmp_path.glob("*/*.txt")) <= 250
+    assert cache.get_text("04key") == "x" * 100
+    assert cache.get_text("00key") is None
+
+
+def test_render_plan():
+    from fairypptx.parts._markdown.jsonast.markdown_factory import MarkdownFactory
+    script = "# Title\n\nHello **bold** [link](https://example.com)\n\n* ITEM1\n    * ITEM1-1\n* ITEM2"
+    markdown = MarkdownFactory().from_document(script)
+    text_range = markdown.shape.text_range
+    paragraphs = text_range.paragraphs
+    assert [paragraph.text.strip() for paragraph in paragraphs[:5]] == ["Title", "Hello bold link", "ITEM1", "ITEM1-1", "ITEM2"]
+    assert paragraphs[0].font.bold and paragraphs[0].font.underline
+    assert [paragraph.paragraph_format.indent_level for paragraph in paragraphs[2:5]] == [1, 2, 1]
+    hyperlink = text_range.api.Paragraphs(2).Characters(12, 4).ActionSettings(1).Hyperlink
+    assert hyperlink.Address == "https://example.com"
+
+
+def test_editor_dispatch_is_cached():
+    from fairypptx.parts._markdown.jsonast.context import Context
+    from fairypptx.parts._markdown.jsonast.editors import get_default_block_editors, get_default_inline_editors, StrEditor
+    from fairypptx.parts._markdown.jsonast.fast_parser import parse
+    from fairypptx.parts._markdown.jsonast.models import PandocJsonAst
+
+    n_created = 0
+    class CountingStrEditor(StrEditor):
+        def __init__(self):
+            nonlocal n_created
+            n_created += 1
+
+    inline_editors = {**get_default_inline_editors()}
+    inline_editors[next(cls for cls, editor in inline_editors.items() if editor is StrEditor)] = CountingStrEditor
+    blocks = PandocJsonAst.model_validate(parse("* a b c\n    * d e f\n* g h i")).blocks
+    # The plan is not flushed, so `text_range` is not required.
+    context = Context(None, get_default_block_editors(), inline_editors)  # type: ignore[arg-type]
+    context.apply_blocks(blocks)
+    assert n_created == 1
+    assert context.position == len("a b c\rd e f\rg h i\r")
+
+
+def test_table_block():
+    from fairypptx.parts._markdown.jsonast.markdown_factory import MarkdownFactory
+    rows = "\n".join(f"| {i} | **{i * 2}** | {i * 3} |" for i in range(30))
+    script = f"Numbers\n\n| A | B | C |\n|---|:-:|--:|\n{rows}"
+    markdown = MarkdownFactory().from_document(script)
+    assert len(markdown.shape_range) == 2
+    table_api = markdown.shape_range[1].api.Table
+    assert (table_api.Rows.Count, table_api.Columns.Count) == (31, 3)
+    assert table_api.Cell(1, 2).Shape.TextFrame.TextRange.Text == "B"
+    cell_range = table_api.Cell(3, 2).Shape.TextFrame.TextRange
+    assert cell_range.Text == "2"
+    assert cell_range.Font.Bold
+    assert cell_range.ParagraphFormat.Alignment == 2  # ppAlignCenter
+    assert table_api.Cell(1, 1).Shape.TextFrame.TextRange.Font.Bold
+
+
+def test_table_blocks_are_stacked():
+    from fairypptx.parts._markdown.jsonast.markdown_factory import MarkdownFactory
+    table = "| A | B |\n|---|---|\n| 1 | 2 |"
+    script = f"Before\n\n{table}\n\nBetween\n\n{table}\n\nAfter\n\nThe end"
+    markdown = MarkdownFactory().from_document(script)
+    text_api, *table_apis = [shape.api for shape in markdown.shape_range]
+    assert len(table_apis) == 2
+    # Below the final text, and below each previous table.
+    assert text_api.Top + text_api.Height <= table_apis[0].Top + 1
+    assert table_apis[0].Top + table_apis[0].Height <= table_apis[1].Top + 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "--capture=no"])
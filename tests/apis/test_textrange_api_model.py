@@ -85,3 +85,86 @@ def test_text_range_object():
     assert text_range.text == "Hello\rWorld"
 
 
+
+
+def test_text_range_snapshot():
+    from fairypptx import Shape
+    from fairypptx.apis.text_range import TextRangeSnapshot
+    shape = Shape.make(1)
+    text_range = shape.text_range
+    text_range.text = "Hello\rWorld\rAgain"
+    snapshot = TextRangeSnapshot.from_api(text_range.api)
+    assert snapshot.text == "Hello\rWorld\rAgain"
+    assert list(snapshot.paragraph_lengths) == [5, 5, 5]
+    assert list(snapshot.paragraph_offsets) == [0, 6, 12]
+    # Identical formats are interned.
+    assert len(snapshot.fonts) == 1
+    assert len(snapshot.paragraph_formats) == 1
+
+    restored = TextRangeSnapshot.model_validate_json(snapshot.model_dump_json())
+    assert restored.to_api_model() == TextRangeApiModel.from_api(text_range.api)
+    assert TextRangeSnapshot.from_api_model(restored.to_api_model()) == snapshot
+
+
+def test_text_range_merged_spans():
+    from fairypptx.apis.text_range.snapshot import merge_font_spans, merge_paragraph_spans
+    assert merge_paragraph_spans([0, 0, 1, 0]) == [(1, 2, 0), (3, 1, 1), (4, 1, 0)]
+    # "abc\r\rde": the empty paragraph separates the spans.
+    assert merge_font_spans([2, 0, 1], [2, 1, 2], [0, 0, 0]) == [(1, 3, 0), (6, 2, 0)]
+    # "abc\rde": a single paragraph break does not.
+    assert merge_font_spans([2, 1], [2, 1, 2], [0, 1, 1]) == [(1, 2, 0), (3, 4, 1)]
+
+
+def test_text_range_apply_formats():
+    from fairypptx import Shape
+    shape = Shape.make(1)
+    text_range = shape.text_range
+    text_range.text = "Hello\rWorld"
+    text_range.paragraphs[1].runs[0].font.bold = True
+    api_model = TextRangeApiModel.from_api(text_range.api)
+
+    shape = Shape.make(1)
+    api_model.apply_api(shape.text_range.api)
+    assert shape.text_range.text == "Hello\rWorld"
+    assert TextRangeApiModel.from_api(shape.text_range.api) == api_model
+
+
+def test_plan_text_edits():
+    from fairypptx.apis.text_range.diff import plan_text_edits
+
+    def _apply(text, edits):
+        order = sorted(range(len(edits)), key=lambda i: (edits[i].start, edits[i].length, i), reverse=True)
+        for edit in (edits[i] for i in order):
+            text = text[:edit.start] + edit.text + text[edit.start + edit.length:]
+        return text
+
+    pairs = [("Hello\rWorld", "Hello\rWorld!"),
+             ("A\rB\rC", "A\rC"),
+             ("A\rB", "X\rA\rB\rY"),
+             ("", "bab\r\ra\r"),
+             ("\rb\ra\r", "aa\raab\rba\r")]
+    for current, target in pairs:
+        plan = plan_text_edits(current, target)
+        assert _apply(current, plan.edits) == target
+
+    plan = plan_text_edits("A\rB\rC", "A\rBB\rC")
+    assert plan.origins == [0, 1, 2]
+    assert len(plan.edits) == 1
+
+
+def test_text_range_update():
+    from fairypptx import Shape
+    shape = Shape.make(1)
+    text_range = shape.text_range
+    text_range.text = "Hello\rWorld"
+    text_range.paragraphs[0].runs[0].font.bold = True
+
+    text_range.update("Hello\rWorld!")
+    assert text_range.text == "Hello\rWorld!"
+    # The untouched paragraph keeps its format.
+    assert text_range.paragraphs[0].font.bold
+
+    other = Shape.make(1)
+    other.text_range.text = "Hello\rThere"
+    other.text_range.update(text_range)
+    assert TextRangeApiModel.from_api(other.text_range.api) == TextRangeApiModel.from_api(text_range.api)
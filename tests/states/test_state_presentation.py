@@ -1,3 +1,4 @@
+import pytest
 from fairypptx.presentation import Presentation
 from fairypptx.states.presentation import PresentationStateModel
 from fairypptx.core.resolvers import Application
@@ -49,3 +50,32 @@ def test_presentation_state_apply_reorder():
         pres_target.api.Close()
 
 
+def test_presentation_state_extract(tmp_path):
+    app = Application().api
+    pres = Presentation(app.Presentations.Add())
+    try:
+        _ = pres.slides.add()
+        _ = pres.slides.add()
+
+        model = PresentationStateModel.extract(pres, tmp_path)
+        assert [slide.id for slide in model.slides] == [slide.id for slide in pres.slides]
+        assert len(list(tmp_path.glob("*.json.gz"))) == 2
+
+        # The saved slides are reused, and only the new one is read.
+        saved = {path: path.stat().st_mtime_ns for path in tmp_path.glob("*.json.gz")}
+        _ = pres.slides.add()
+        resumed = PresentationStateModel.extract(pres, tmp_path)
+        assert [slide.id for slide in resumed.slides] == [slide.id for slide in pres.slides]
+        assert all(path.stat().st_mtime_ns == mtime for path, mtime in saved.items())
+        assert resumed.slides[:2] == model.slides[:2]
+
+        # The folder of another presentation is refused, since `SlideID`s collide.
+        other = Presentation(app.Presentations.Add())
+        try:
+            _ = other.slides.add()
+            with pytest.raises(ValueError):
+                PresentationStateModel.extract(other, tmp_path)
+        finally:
+            other.api.Close()
+    finally:
+        pres.api.Close()
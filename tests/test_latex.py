@@ -0,0 +1,41 @@
+import pytest
+
+from fairypptx.parts.latex import Latex, LatexRenderCache
+
+
+def test_render_cache(tmp_path):
+    cache = LatexRenderCache(tmp_path)
+    first = cache.render(r"$x^2$")
+    assert first.startswith(b"\x89PNG")
+    assert cache.get(cache.to_key(r"$x^2$")) == first
+    assert cache.to_key(r"$x^2$") != cache.to_key(r"$x^2$", fontsize=32)
+
+    # The least recently used entries are evicted.
+    cache.max_bytes = 250
+    cache.put("a" * 64, b"0" * 100)
+    cache.put("b" * 64, b"0" * 100)
+    cache.put("c" * 64, b"0" * 100)
+    assert cache.get("a" * 64) is None
+    assert cache.get("c" * 64) is not None
+
+
+def test_render_many(tmp_path):
+    cache = LatexRenderCache(tmp_path)
+    texts = [r"$a$", r"$b$", r"$a$"]
+    results = list(cache.render_many(texts, max_workers=2))
+    assert results[0] == results[2]
+    assert results == [cache.render(text) for text in texts]
+
+
+def test_make_many():
+    texts = [r"$x + y$", r"$\frac{1}{2}$"]
+    latexes = Latex.make_many(texts)
+    try:
+        assert [latex.script for latex in latexes] == texts
+    finally:
+        for latex in latexes:
+            latex.shape.api.Delete()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "--capture=no"])
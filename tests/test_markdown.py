@@ -43,6 +43,31 @@ def test_interpret():
     """.strip()
     str(Markdown.make(text))
 
+def test_compile_incremental():
+    markdown = Markdown.make("# Title\n\n* ITEM1\n* ITEM2\n* ITEM3\n\nLast paragraph.")
+    shape_id = markdown.shape.api.Id
+    markdown = markdown.compile("# Title\n\n* ITEM1\n* CHANGED\n* ITEM3\n\nLast paragraph.")
+    # The shape is kept and only the changed block is rewritten.
+    assert markdown.shape.api.Id == shape_id
+    paragraphs = markdown.shape.text_range.paragraphs
+    assert [paragraph.text.strip() for paragraph in paragraphs[:5]] == ["Title", "ITEM1", "CHANGED", "ITEM3", "Last paragraph."]
+    assert paragraphs[0].font.bold
+    assert paragraphs[4].paragraph_format.bullet_type != paragraphs[3].paragraph_format.bullet_type
+    markdown.shape.api.Delete()
+
+
+def test_compile_incremental_keeps_tables_below():
+    table = "| A | B |\n|---|---|\n| 1 | 2 |"
+    markdown = Markdown.make(f"Intro\n\n{table}")
+    try:
+        grown = "\n\n".join(["Intro", *(f"Paragraph {i}" for i in range(10)), table])
+        markdown = markdown.compile(grown)
+        text_api, table_api = [shape.api for shape in markdown.shape_range]
+        assert text_api.Top + text_api.Height <= table_api.Top + 1
+    finally:
+        for shape in markdown.shape_range:
+            shape.api.Delete()
+
 if __name__ == "__main__":
     pytest.main([__file__, "--capture=no"])
 
@@ -0,0 +1,41 @@
+import pytest
+
+from fairypptx import Presentation, Shape
+
+
+def test_find_replace():
+    try:
+        shape = Shape.make_textbox("Old term, old term and Old term.")
+    except Exception as e:
+        pytest.skip(f"PowerPoint not available or cannot create shapes: {e}")
+
+    try:
+        # Only the slide of the test, not to rewrite the other slides of the active presentation.
+        slides = [shape.api.Parent.SlideIndex - 1]
+        assert Presentation().find_replace("Old term", "New term", slides=slides) == 2
+        assert shape.text_range.text == "New term, old term and New term."
+
+        assert Presentation().find_replace(r"(\w+) term", r"\1-term", regex=True, slides=slides) == 3
+        assert shape.text_range.text == "New-term, old-term and New-term."
+    finally:
+        shape.api.Delete()
+
+
+def test_export_markdown():
+    import io
+    try:
+        shape = Shape.make_textbox("Exported text")
+    except Exception as e:
+        pytest.skip(f"PowerPoint not available or cannot create shapes: {e}")
+
+    try:
+        slide_index = shape.api.Parent.SlideIndex - 1
+        buffer = io.StringIO()
+        Presentation().export_markdown(buffer, slides=[slide_index])
+        assert "Exported text" in buffer.getvalue()
+    finally:
+        shape.api.Delete()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "--capture=no"])
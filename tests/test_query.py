@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from fairypptx import constants
+from fairypptx.shape import Shape
+from fairypptx.presentation import Presentation
+from fairypptx.query import ShapeSnapshot, parse_selector, col, is_type, overlaps, SelectorSyntaxError
+
+
+@pytest.fixture
+def snapshot():
+    def _objects(*values):
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+
+    columns = {
+        "type": np.array([constants.msoTextBox, constants.msoAutoShape, constants.msoTextBox], dtype=float),
+        "font.name": _objects("Meiryo", None, "Arial"),
+        "slide_index": np.array([1, 5, 12], dtype=float),
+        "text": _objects("Agenda", None, "Summary"),
+        "left": np.array([0, 100, 0], dtype=float),
+        "top": np.array([0, 0, 200], dtype=float),
+        "width": np.array([50, 50, 50], dtype=float),
+        "height": np.array([50, 50, 50], dtype=float),
+    }
+    return ShapeSnapshot(["a", "b", "c"], columns)
+
+
+def test_selector(snapshot):
+    predicate = parse_selector("TextBox[font.name='Meiryo']")
+    assert predicate.fields == {"type", "font.name"}
+    assert snapshot.take(predicate.evaluate(snapshot)) == ["a"]
+
+    predicate = parse_selector("*[slide_index>=2][slide_index<=80]")
+    assert snapshot.take(predicate.evaluate(snapshot)) == ["b", "c"]
+
+    predicate = parse_selector("[text~='^Agen'], AutoShape")
+    assert snapshot.take(predicate.evaluate(snapshot)) == ["a", "b"]
+
+
+def test_selector_error():
+    with pytest.raises(SelectorSyntaxError):
+        parse_selector("TextBox[font.name=='Meiryo']")
+    with pytest.raises(SelectorSyntaxError):
+        parse_selector("TextBox,")
+    # Numeric columns with non-numeric values.
+    with pytest.raises(SelectorSyntaxError):
+        parse_selector("[left<'abc']")
+    with pytest.raises(TypeError):
+        col("slide_index").isin(["first"])
+
+
+def test_predicate(snapshot):
+    predicate = is_type("TextBox") & ~(col("font.name") == "Arial")
+    assert snapshot.take(predicate.evaluate(snapshot)) == ["a"]
+
+    predicate = overlaps((10, 10, 100, 10))
+    assert snapshot.take(predicate.evaluate(snapshot)) == ["a", "b"]
+
+
+def test_presentation_select():
+    try:
+        shape = Shape.make_textbox("QueryTarget")
+    except Exception as e:
+        pytest.skip(f"PowerPoint not available or cannot create shapes: {e}")
+
+    try:
+        shape_range = Presentation().select("TextBox[text='QueryTarget']")
+        assert [elem.api.Id for elem in shape_range] == [shape.api.Id]
+    finally:
+        shape.api.Delete()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "--capture=no"])
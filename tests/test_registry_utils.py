@@ -66,5 +66,44 @@ def test_lru_cache_clearing(json_registry: StructureRegistry) -> None:
     assert second["v"] == 2
 
 
+def test_content_store(tmp_path: Path) -> None:
+    from PIL import Image
+    from fairypptx.registry_utils.temporary_path import ContentStore, to_image_suffix
+
+    store = ContentStore(tmp_path, max_bytes=1000)
+    image = Image.new("RGB", (8, 8), (255, 0, 0))
+    with store.dump(image) as first:
+        data = first.read_bytes()
+    # The same content reuses the same file.
+    with store.dump(image.copy()) as second:
+        assert second == first
+    assert to_image_suffix(data) == ".png"
+    with store.dump(data, suffix=".png") as third:
+        assert third.read_bytes() == data
+
+    # Files in use are kept, and the others are evicted over `max_bytes`.
+    with store.dump(b"0" * 800, suffix=".bin") as large:
+        with store.dump(b"1" * 800, suffix=".bin") as other:
+            assert large.exists() and other.exists()
+    assert len(list(tmp_path.iterdir())) <= 2
+
+    # "P" images with the same indices and different palettes are different.
+    red, blue = Image.new("P", (8, 8)), Image.new("P", (8, 8))
+    red.putpalette([255, 0, 0] * 256)
+    blue.putpalette([0, 0, 255] * 256)
+    with store.dump(red) as red_path:
+        red_data = red_path.read_bytes()
+    with store.dump(blue) as blue_path:
+        assert blue_path.read_bytes() != red_data
+
+    # The files not written by the store are not reused.
+    (tmp_path / "unknown").mkdir()
+    other_store = ContentStore(tmp_path / "unknown")
+    with other_store.dump(b"content", suffix=".bin") as path:
+        path.write_bytes(b"tampered")
+    with ContentStore(tmp_path / "unknown").dump(b"content", suffix=".bin") as path:
+        assert path.read_bytes() == b"content"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "--capture=no"])
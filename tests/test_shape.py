@@ -80,6 +80,27 @@ def test_tighten():
     assert height != shape.api.Height
 
 
+def test_tighten_offline():
+    from fairypptx.apis.text_frame import measure
+    shape = Shape.make(1)
+    shape.text = "This is a test of tighten.\rSecond line"
+    report = measure.verify_tighten(shape.api, tolerance=10)
+    assert report.ok, report
+    shape.tighten(engine="offline")
+    assert abs(shape.width - report.predicted[0]) < 1
+    assert abs(shape.height - report.predicted[1]) < 1
+
+
+def test_is_tight_estimate():
+    shape = Shape.make(1)
+    shape.text = "This is a test of is_tight."
+    box = shape.box
+    assert shape.is_tight(mode="estimate") == shape.is_tight()
+    assert shape.box == box
+    shape.tighten()
+    assert shape.is_tight(mode="estimate")
+
+
 def test_like():
     # The case without texts.
     shape = Shape.make(1)
@@ -80,3 +80,36 @@ def test_leafs():
     assert len(shapes) == 2
     texts = {str(shape.text) for shape in shapes}
     assert texts == {"S1", "S2"}
+
+
+def test_are_tight():
+    tight, loose = Shape.make(1), Shape.make(1)
+    tight.text = "tight"
+    tight.tighten()
+    loose.text = "loose"
+    loose.width, loose.height = 400, 300
+    assert ShapeRange([tight, loose]).are_tight() == [True, False]
+
+
+def test_to_images():
+    from PIL import Image
+    images = [Image.new("RGB", (60, 40), color) for color in [(255, 0, 0), (0, 0, 255)]]
+    pictures = [Shape.make(image) for image in images]
+    pictures[0].api.Left, pictures[0].api.Top = 10, 10
+    pictures[1].api.Left, pictures[1].api.Top = 200, 10
+    try:
+        shape_range = ShapeRange(pictures)
+        batched = shape_range.to_images("RGB")
+        exact = shape_range.to_images("RGB", exact=True)
+        for b_image, e_image, expected in zip(batched, exact, [(255, 0, 0), (0, 0, 255)]):
+            center = (b_image.width // 2, b_image.height // 2)
+            assert b_image.getpixel(center) == expected
+            assert abs(b_image.width - e_image.width) <= 2
+
+        # The picture with a line is exported, so that the border is not clipped.
+        pictures[1].api.Line.Visible = True
+        pictures[1].api.Line.Weight = 6
+        assert shape_range.to_images("RGB")[1].size == shape_range.to_images("RGB", exact=True)[1].size
+    finally:
+        for picture in pictures:
+            picture.api.Delete()
@@ -221,6 +221,38 @@ def test_find():
     assert len(result) == 3
     assert all(elem.text == "ITEM" for elem in result)
 
+    result = tr.find(r"ITEM\d", regex=True)
+    assert [elem.text for elem in result] == ["ITEM1", "ITEM2", "ITEM3"]
+    assert result[1].start == tr.start + 6
+
+
+def test_plan_replacements():
+    from fairypptx.text_range.search import find_spans, plan_replacements
+    # `🍣` is 2 units in UTF-16, but the spans are in `str` index.
+    assert find_spans("🍣ab-ab", "ab") == [(1, 3), (4, 6)]
+    edits = plan_replacements("v1.2 and v3.4", r"v(\d)\.(\d)", r"v\1_\2", regex=True)
+    assert [(edit.start, edit.length, edit.text) for edit in edits] == [(0, 4, "v1_2"), (9, 4, "v3_4")]
+
+
+def test_offset_index():
+    from fairypptx.text_range.offset_index import TextOffsetIndex
+    index = TextOffsetIndex.from_text("AB\rC\013D\r\r🍣E")
+    assert index.paragraph_starts == (1, 4, 8, 9)
+    # `🍣` is 2 units in UTF-16.
+    assert index.paragraph_bounds(3) == (9, 3)
+    assert [index.paragraph_index(p) for p in (1, 3, 4, 8, 11)] == [0, 0, 1, 2, 3]
+    assert index.line_starts == (1, 4, 6, 8, 9)
+    assert TextOffsetIndex.from_text("AB\rC\013D\r\r🍣E") is index
+
+    tr = TextRange.make("AAA\rBBB\rCCC")
+    assert tr.paragraphs[2].paragraph_index == 2
+    assert tr.get_paragraph_from_root(1).text == "BBB\r"
+    # The paragraphs share the index of `tr`, which is rebuilt after the edit.
+    paragraphs = tr.paragraphs
+    assert all(paragraph.offset_index is tr.offset_index for paragraph in paragraphs)
+    tr.text = "A\rBBBBB\rCCC"
+    assert tr.get_paragraph_from_root(1).text == "BBBBB\r"
+
 
 def test_editor():
     tr = TextRange.make("ABC\r\r")
@@ -278,5 +310,61 @@ def test_paragraph_boundary_variation():
     assert editor.n_tail_newlines == 2
 
 
+def test_guess_header_paragraphs():
+    from fairypptx.text_range.formatters import guessers
+    tr = TextRange.make("Title\rBody\rSection\rBody")
+    paragraphs = tr.paragraphs
+    for para in paragraphs:
+        para.font.size = 12
+    paragraphs[0].font.size = 24
+    paragraphs[2].font.bold = True
+
+    columns = guessers.RunColumns.from_text_range(tr)
+    assert guessers.guess_default_fontsize(columns) == 12
+    assert guessers.guess_header_paragraph_indices(columns) == [(0, [0]), (1, [2])]
+    groups = guessers.guess_header_paragraphs(tr)
+    assert [[para.text.strip() for para in paras] for _, paras in groups] == [["Title"], ["Section"]]
+
+
+def test_font_resizer():
+    from fairypptx.text_range.formatters import FontResizer, bisect_scale, merge_size_spans
+    assert merge_size_spans([(1, 3, 12), (4, 2, 12), (6, 0, 18), (6, 4, 18)]) == [(1, 5, 12), (6, 4, 18)]
+    assert abs(bisect_scale(lambda scale: scale <= 1.5, 4.0, 10) - 1.5) < 0.01
+
+    tr = TextRange.make("Small\rLarge")
+    tr.paragraphs[0].font.size = 12
+    tr.paragraphs[1].font.size = 20
+    FontResizer(fontsize=16, mode="min")(tr)
+    assert [para.font.size for para in tr.paragraphs] == [16, 24]
+
+    shape = tr.shape
+    FontResizer(mode="fit")(tr)
+    frame_api = shape.api.TextFrame
+    assert frame_api.TextRange.BoundHeight <= shape.api.Height - frame_api.MarginTop - frame_api.MarginBottom
+
+
+def test_format_model():
+    from fairypptx.text_range.formatters.model import FormatModel, ParagraphAttributes
+    attributes = [ParagraphAttributes(bullet_type=0, bullet_visible=False, indent_level=1)] * 5
+    model = FormatModel("ABC\r\r\r\rDEF", attributes)
+    head = model.paragraphs[0]
+    assert model.n_tail_newlines(head) == 4
+    model.set_tail_newlines(head, 2)
+    model.set_head_newlines(model.paragraphs[-1], 3)
+    assert model.text == "ABC\r\r\rDEF"
+    # The edits follow the newlines chosen by the stages, not an alignment of the texts.
+    assert [(edit.start, edit.length, edit.text) for edit in model.to_edits()] == [(3, 2, ""), (7, 0, "\r")]
+    with pytest.raises(KeyError):
+        model.find_paragraph_by_origin(3)
+    assert model.find_paragraph_by_origin(7) == model.paragraphs[-1]
+
+
+def test_default_formatter():
+    from fairypptx.text_range import DefaultFormatter
+    tr = TextRange.make("Title\r\r\r\rBody\r\r\r\rEnd")
+    DefaultFormatter()(tr)
+    assert tr.root.text == "Title\r\rBody\r\rEnd"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "--capture=no"])